@@ -0,0 +1,183 @@
+"""
+Admission Control for AI-Based Mock Interview Platform
+
+Bounds the number of LLM-bound interview operations in flight. Up to
+max_concurrent operations run at once; further ones wait in a bounded FIFO
+queue. A request is rejected immediately, with a suggested retry delay,
+when the queue is full or when its expected wait already exceeds the
+queue deadline, and is dropped from the queue once its deadline passes.
+When the LLM slows down, callers get a fast 429 instead of piling up as
+open requests.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Raised when an operation is not admitted; maps to HTTP 429"""
+
+    def __init__(self, reason: str, retry_after_seconds: float):
+        super().__init__(f"Interview system is busy ({reason})")
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after_seconds)))
+
+
+class AdmissionConfig(BaseModel):
+    """Configuration for the admission controller"""
+    max_concurrent: int = Field(default=32, ge=1)
+    max_queue: int = Field(default=64, ge=0)
+    max_queue_wait_seconds: float = Field(default=10.0, gt=0)
+    initial_service_seconds: float = Field(default=2.0, gt=0)
+
+
+class AdmissionController:
+    """
+    Semaphore with a bounded, deadline-aware wait queue
+    """
+
+    def __init__(self, config: AdmissionConfig):
+        self.config = config
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        # Smoothed duration of an admitted operation, used to predict waits
+        self._service_seconds = config.initial_service_seconds
+
+        # Metrics
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_deadline = 0
+        self.timed_out = 0
+        self._recent_waits_ms: Deque[float] = deque(maxlen=1000)
+        self._total_wait_ms = 0.0
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _expected_wait(self, position: int) -> float:
+        """Seconds until the waiter at position (0-based) in the queue is admitted"""
+        return (position // self.config.max_concurrent + 1) * self._service_seconds
+
+    def _retry_after(self) -> float:
+        return self._expected_wait(len(self._waiters))
+
+    def _grant_next(self) -> None:
+        while self._waiters and self.active < self.config.max_concurrent:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> None:
+        """Wait for a slot or raise AdmissionRejected"""
+        if self.active < self.config.max_concurrent and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            self._recent_waits_ms.append(0.0)
+            return
+
+        if len(self._waiters) >= self.config.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejected("queue full", self._retry_after())
+        expected_wait = self._expected_wait(len(self._waiters))
+        if expected_wait > self.config.max_queue_wait_seconds:
+            # Would miss its deadline anyway; fail now instead of holding the client
+            self.rejected_deadline += 1
+            raise AdmissionRejected("expected wait too long", expected_wait)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(waiter), timeout=self.config.max_queue_wait_seconds)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            self._discard(waiter)
+            raise AdmissionRejected("queue deadline exceeded", self._retry_after())
+        except BaseException:
+            self._discard(waiter)
+            raise
+
+        wait_ms = (time.perf_counter() - started) * 1000
+        self.admitted += 1
+        self._recent_waits_ms.append(wait_ms)
+        self._total_wait_ms += wait_ms
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        """Remove an abandoned waiter, handing on a slot it was just given"""
+        if waiter.done() and not waiter.cancelled():
+            self.release()
+        else:
+            waiter.cancel()
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def release(self, service_seconds: Optional[float] = None) -> None:
+        """Free a slot; service_seconds updates the wait prediction"""
+        self.active -= 1
+        if service_seconds is not None:
+            self._service_seconds = 0.8 * self._service_seconds + 0.2 * service_seconds
+        self._grant_next()
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block"""
+        await self.acquire()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release(time.perf_counter() - started)
+
+    def get_stats(self) -> Dict[str, Any]:
+        waits = sorted(self._recent_waits_ms)
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "max_concurrent": self.config.max_concurrent,
+            "max_queue": self.config.max_queue,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_deadline": self.rejected_deadline,
+            "timed_out": self.timed_out,
+            "queue_wait_ms": {
+                "avg": round(self._total_wait_ms / self.admitted, 2) if self.admitted else 0.0,
+                "p95": round(waits[int(len(waits) * 0.95)], 2) if waits else 0.0,
+                "max": round(waits[-1], 2) if waits else 0.0
+            },
+            "service_seconds": round(self._service_seconds, 3)
+        }
+
+
+def create_admission_controller(**kwargs: Any) -> AdmissionController:
+    """Factory function to create AdmissionController with environment overrides"""
+    settings = {
+        "max_concurrent": int(os.getenv("INTERVIEW_MAX_CONCURRENT_LLM_CALLS", "32")),
+        "max_queue": int(os.getenv("INTERVIEW_ADMISSION_QUEUE_SIZE", "64")),
+        "max_queue_wait_seconds": float(os.getenv("INTERVIEW_ADMISSION_MAX_WAIT_SECONDS", "10")),
+        **kwargs
+    }
+    return AdmissionController(AdmissionConfig(**settings))
@@ -16,19 +16,23 @@ from enum import Enum
 from datetime import datetime
 import uuid
 
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages import (
+    BaseMessage, HumanMessage, AIMessage, SystemMessage, messages_from_dict, messages_to_dict)
 from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
-from langgraph.checkpoint.memory import MemorySaver
 
 from pydantic import BaseModel, Field
 
+from ..utils.checkpointer import create_checkpointer
+from ..utils.memory_usage import checkpointer_stats
 from .response_generator import (
     TechnicalInterviewerResponseGenerator,
     ResponseGeneratorConfig,
     ResponseType,
     InterviewResponse,
+    TokenCallback,
     create_response_generator
 )
 
@@ -87,6 +91,11 @@ class ConversationState(TypedDict):
     conversation_metadata: Dict[str, Any]
 
 
+# Per-session fields owned by the caller; only messages have a reducer, so
+# without them each turn would start these channels from defaults
+SESSION_FIELDS = ("problem_data", "user_code", "code_language", "hints_given", "max_hints")
+
+
 class ConversationManagerConfig(BaseModel):
     """Configuration for Conversation Manager"""
     max_hints: int = Field(default=3, description="Maximum hints per problem")
@@ -193,9 +202,13 @@ class TechnicalInterviewConversationManager:
 
         return "\n".join(context_parts)
 
-    async def _process_message_node(self, state: ConversationState) -> ConversationState:
+    async def _process_message_node(self, state: ConversationState, config: RunnableConfig) -> ConversationState:
         """LangGraph node to process user messages and generate responses"""
         try:
+            # Response content goes to the graph's custom stream when streaming
+            on_token = get_stream_writer() if config.get(
+                "configurable", {}).get("stream_tokens") else None
+
             messages = state.get("messages", [])
             if not messages:
                 logger.warning("No messages found in state")
@@ -230,7 +243,9 @@ class TechnicalInterviewConversationManager:
                 # Generate code review
                 ai_response = await self.response_generator.generate_code_review(
                     code=code,
-                    problem_context=context
+                    problem_context=context,
+                    conversation_id=state["conversation_id"],
+                    on_token=on_token
                 )
 
                 # Update phase to code review
@@ -247,7 +262,10 @@ class TechnicalInterviewConversationManager:
                     hint_level = "gentle" if state["hints_given"] == 0 else "moderate"
                     ai_response = await self.response_generator.generate_hint(
                         context=context,
-                        hint_level=hint_level
+                        hint_level=hint_level,
+                        conversation_id=state["conversation_id"],
+                        on_token=on_token,
+                        problem_data=state.get("problem_data")
                     )
                     state["hints_given"] += 1
                     state["current_phase"] = InterviewPhase.HINT_GIVING
@@ -258,7 +276,9 @@ class TechnicalInterviewConversationManager:
                     user_message=user_message,
                     response_type=response_type,
                     context=context,
-                    problem_data=state.get("problem_data")
+                    problem_data=state.get("problem_data"),
+                    conversation_id=state["conversation_id"],
+                    on_token=on_token
                 )
 
             # Add AI response to conversation
@@ -343,7 +363,7 @@ class TechnicalInterviewConversationManager:
         workflow.add_edge("process_message", END)
 
         # Compile with memory
-        memory = MemorySaver()
+        memory = create_checkpointer("conversation")
         return workflow.compile(checkpointer=memory)
 
     async def start_new_conversation(self, problem_data: Dict[str, Any]) -> ConversationResponse:
@@ -353,7 +373,8 @@ class TechnicalInterviewConversationManager:
         logger.info(f"Starting new conversation: {conversation_id}")
 
         # Generate problem introduction
-        intro_response = await self.response_generator.generate_problem_introduction(problem_data)
+        intro_response = await self.response_generator.generate_problem_introduction(
+            problem_data, conversation_id=conversation_id)
 
         # Create initial state
         initial_state: ConversationState = {
@@ -393,8 +414,22 @@ class TechnicalInterviewConversationManager:
                                "Start thinking about the approach", "Request a hint if needed"]
         )
 
-    async def process_user_message(self, conversation_id: str, user_message: str) -> ConversationResponse:
-        """Process a user message and return AI response"""
+    async def process_user_message(
+        self,
+        conversation_id: str,
+        user_message: str,
+        on_token: Optional[TokenCallback] = None,
+        session_state: Optional[Dict[str, Any]] = None
+    ) -> ConversationResponse:
+        """
+        Process a user message and return AI response
+
+        With on_token the response is streamed: on_token receives its
+        content piece by piece before the full response is returned.
+        session_state (the agent's ConversationState) supplies the
+        SESSION_FIELDS for this turn and receives their new values.
+        """
+        session_state = session_state if session_state is not None else {}
         logger.info(f"Processing message for conversation: {conversation_id}")
 
         # Create user message
@@ -408,18 +443,32 @@ class TechnicalInterviewConversationManager:
             "messages": [user_msg],
             "conversation_id": conversation_id,
             "current_phase": InterviewPhase.DISCUSSION,  # Will be updated by graph
-            "problem_data": None,  # Will be preserved by graph
-            "user_code": None,
-            "code_language": None,
-            "hints_given": 0,
-            "max_hints": self.config.max_hints,
+            "problem_data": session_state.get("problem_data"),
+            "user_code": session_state.get("user_code"),
+            "code_language": session_state.get("code_language"),
+            "hints_given": session_state.get("hints_given", 0),
+            "max_hints": session_state.get("max_hints", self.config.max_hints),
             "session_start_time": datetime.now(),
             "last_activity_time": datetime.now(),
             "conversation_metadata": {}
         }
 
         # Process through graph
-        result_state = await self.graph.ainvoke(current_state, config=config)
+        if on_token is None:
+            result_state = await self.graph.ainvoke(current_state, config=config)
+        else:
+            config["configurable"]["stream_tokens"] = True
+            result_state = None
+            async for mode, chunk in self.graph.astream(
+                    current_state, config=config, stream_mode=["custom", "values"]):
+                if mode == "custom":
+                    on_token(chunk)
+                else:
+                    result_state = chunk
+
+        for key in SESSION_FIELDS:
+            if key in result_state:
+                session_state[key] = result_state[key]
 
         # Extract AI response
         messages = result_state.get("messages", [])
@@ -450,7 +499,9 @@ class TechnicalInterviewConversationManager:
                 "response_type": last_response.get("response_type"),
                 "confidence_score": last_response.get("confidence_score"),
                 "hints_given": result_state.get("hints_given", 0),
-                "hints_remaining": self.config.max_hints - result_state.get("hints_given", 0),
+                "hints_remaining": (
+                    result_state.get("max_hints", self.config.max_hints) -
+                    result_state.get("hints_given", 0)),
                 "user_intent": last_response.get("user_intent")
             },
             requires_user_action=True,
@@ -495,13 +546,52 @@ class TechnicalInterviewConversationManager:
             "message": "Conversation summary feature coming soon"
         }
 
+    async def export_conversation(self, conversation_id: str) -> List[Dict[str, Any]]:
+        """Checkpointed messages of a conversation as plain data"""
+        config = RunnableConfig(configurable={"thread_id": conversation_id})
+        snapshot = await self.graph.aget_state(config)
+        return messages_to_dict(snapshot.values.get("messages", []))
+
+    async def import_conversation(self, conversation_id: str, messages: List[Dict[str, Any]]) -> None:
+        """Seed a conversation's checkpoint with messages from export_conversation"""
+        if not messages:
+            return
+        config = RunnableConfig(configurable={"thread_id": conversation_id})
+        await self.graph.aupdate_state(
+            config,
+            {"messages": messages_from_dict(messages), "conversation_id": conversation_id},
+            as_node="process_message"
+        )
 
-def create_conversation_manager(api_key: Optional[str] = None, **kwargs) -> TechnicalInterviewConversationManager:
+    def release_conversation(self, conversation_id: str) -> None:
+        """Drop all checkpointed state of a conversation"""
+        checkpointer = self.graph.checkpointer
+        if checkpointer is not None:
+            checkpointer.delete_thread(conversation_id)
+        # Managers built by InterviewStateManager carry no response generator
+        if isinstance(self.response_generator, TechnicalInterviewerResponseGenerator):
+            self.response_generator.release_thread(conversation_id)
+
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """Resident checkpointer usage of this manager and its generator"""
+        stats = {"conversation_checkpointer": checkpointer_stats(self.graph.checkpointer)}
+        if isinstance(self.response_generator, TechnicalInterviewerResponseGenerator):
+            stats["response_checkpointer"] = checkpointer_stats(
+                self.response_generator.graph.checkpointer)
+        return stats
+
+
+def create_conversation_manager(
+    api_key: Optional[str] = None,
+    response_generator: Optional[TechnicalInterviewerResponseGenerator] = None,
+    **kwargs
+) -> TechnicalInterviewConversationManager:
     """
     Factory function to create conversation manager with Gemini
 
     Args:
         api_key: Deprecated, not needed for Gemini (uses GOOGLE_API_KEY from env)
+        response_generator: Existing response generator to share instead of creating one
         **kwargs: Additional configuration parameters
 
     Returns:
@@ -510,18 +600,19 @@ def create_conversation_manager(api_key: Optional[str] = None, **kwargs) -> Tech
     try:
         logger.info("🤖 Creating Conversation Manager with Gemini")
 
-        # Create Gemini chat instance
-        llm = create_conversation_gemini_chat()
+        if response_generator is None:
+            # Create Gemini chat instance
+            llm = create_conversation_gemini_chat()
 
-        # Create response generator config for other parameters
-        response_config = ResponseGeneratorConfig(
-            temperature=kwargs.get('temperature', 0.2),
-            max_tokens=kwargs.get('max_tokens', 10000)
-        )
+            # Create response generator config for other parameters
+            response_config = ResponseGeneratorConfig(
+                temperature=kwargs.get('temperature', 0.2),
+                max_tokens=kwargs.get('max_tokens', 10000)
+            )
 
-        # Create response generator with LLM
-        response_generator = TechnicalInterviewerResponseGenerator(
-            llm=llm, config=response_config)
+            # Create response generator with LLM
+            response_generator = TechnicalInterviewerResponseGenerator(
+                llm=llm, config=response_config)
 
         # Create conversation manager config
         config = ConversationManagerConfig(
@@ -16,7 +16,7 @@ Date: January 2025
 
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List, TypedDict, Annotated
+from typing import Optional, Dict, Any, List, Set, TypedDict, Annotated
 from enum import Enum
 from datetime import datetime, timedelta
 import uuid
@@ -25,10 +25,11 @@ import json
 from langchain_core.messages import BaseMessage
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
-from langgraph.checkpoint.memory import MemorySaver
 
 from pydantic import BaseModel, Field
 
+from ..utils.checkpointer import create_checkpointer
+from ..utils.memory_usage import checkpointer_stats, deep_sizeof
 from .conversation_manager import (
     TechnicalInterviewConversationManager,
     ConversationManagerConfig,
@@ -167,18 +168,34 @@ class InterviewStateManager:
         graph.add_edge("process_session", END)
 
         # Add checkpointer for state persistence
-        memory = MemorySaver()
+        memory = create_checkpointer("interview_state")
         return graph.compile(checkpointer=memory)
 
     async def create_session(
         self,
         user_id: Optional[str] = None,
         session_type: str = "dsa",
-        duration_limit: Optional[int] = None
+        duration_limit: Optional[int] = None,
+        session_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Create a new interview session"""
+        """
+        Create a new interview session
 
-        session_id = str(uuid.uuid4())
+        Callers that already own an interview id pass it as session_id so
+        every layer shares one identity; creating an existing session again
+        returns it without re-running the session graph.
+        """
+
+        if session_id is not None and session_id in self.active_sessions:
+            existing = self.active_sessions[session_id]
+            return {
+                "success": True,
+                "session_id": session_id,
+                "status": existing.status.value,
+                "next_actions": []
+            }
+
+        session_id = session_id or str(uuid.uuid4())
 
         # Create session data
         session_data = InterviewSessionData(
@@ -426,8 +443,8 @@ class InterviewStateManager:
             # Get final analytics
             analytics = await self.get_session_analytics(session_id)
 
-            # Remove from active sessions
-            del self.active_sessions[session_id]
+            # Remove from active sessions, with its checkpoint threads
+            self.release_session(session_id)
 
             logger.info(f"Closed interview session: {session_id}")
 
@@ -441,6 +458,52 @@ class InterviewStateManager:
             logger.error(f"Error closing session: {e}")
             return {"success": False, "error": str(e)}
 
+    def release_session(self, session_id: str) -> bool:
+        """
+        Drop a session and every checkpoint thread it owns
+
+        Unlike close_session this skips analytics; it is what the idle
+        reaper uses for sessions that were never closed.
+        """
+        session_data = self.active_sessions.pop(session_id, None)
+        self.session_graph.checkpointer.delete_thread(session_id)
+        if session_data is not None and session_data.conversation_id:
+            self.conversation_manager.release_conversation(
+                session_data.conversation_id)
+        return session_data is not None
+
+    def reap_idle_sessions(
+        self,
+        idle_ttl_seconds: float,
+        keep: Optional[Set[str]] = None
+    ) -> List[str]:
+        """
+        Release sessions without activity for idle_ttl_seconds
+
+        Sessions in keep are still referenced by a caller and are skipped.
+        """
+        cutoff = datetime.now() - timedelta(seconds=idle_ttl_seconds)
+        idle = [
+            session_id for session_id, session_data in list(self.active_sessions.items())
+            if session_data.last_activity < cutoff and (keep is None or session_id not in keep)
+        ]
+        for session_id in idle:
+            self.release_session(session_id)
+        if idle:
+            logger.info(f"Released {len(idle)} idle interview sessions")
+        return idle
+
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """Entries and approximate size of the in-memory session state"""
+        return {
+            "active_sessions": {
+                "entries": len(self.active_sessions),
+                "approx_bytes": deep_sizeof(self.active_sessions)
+            },
+            "session_checkpointer": checkpointer_stats(self.session_graph.checkpointer),
+            **self.conversation_manager.get_memory_stats()
+        }
+
     def get_active_sessions(self) -> List[Dict[str, Any]]:
         """Get list of all active sessions"""
         return [
@@ -9,16 +9,29 @@ Date: January 2025
 """
 
 import asyncio
+import gc
 import logging
-from typing import Optional, Dict, Any, List, Set
+import os
+import threading
+from typing import Optional, Dict, Any, List, Set, Tuple, Iterator, Mapping, Callable
+from types import MappingProxyType
 from enum import Enum
-import json
 import random
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 from pydantic import BaseModel, Field
 
+from .problem_loader import ParallelProblemLoader, ProblemLoadError
+from .problem_snapshot import ProblemSnapshot
+from .problem_store import ProblemBodyStore
+from .problem_mongo_source import MongoProblemSource
+from .problem_sampler import ProblemSampler
+from .problem_graph import ProblemGraph
+from .user_performance import UserPerformanceStore, get_performance_store
+from .problem_embeddings import ProblemVectorIndex, build_vector_index, catalog_fingerprint
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -126,6 +139,88 @@ class Problem(BaseModel):
     updated_at: Optional[str] = None
 
 
+@dataclass(frozen=True, slots=True)
+class ProblemIndexRecord:
+    """Compact always-resident view of a problem used for search and ranking"""
+    id: str
+    title: str
+    slug: str
+    difficulty: ProblemDifficulty
+    category: ProblemCategory
+    subcategories: Tuple[ProblemCategory, ...] = ()
+    company_tags: Tuple[CompanyTag, ...] = ()
+    frequency: Optional[float] = None
+    acceptance_rate: Optional[float] = None
+    tags: Tuple[str, ...] = ()
+    similar_problems: Tuple[str, ...] = ()
+    prerequisites: Tuple[str, ...] = ()
+    leetcode_id: Optional[int] = None
+
+    @classmethod
+    def from_problem(cls, problem: Problem) -> "ProblemIndexRecord":
+        """Extract the index fields from a full problem"""
+        return cls(
+            id=problem.id,
+            title=problem.title,
+            slug=problem.slug,
+            difficulty=problem.difficulty,
+            category=problem.category,
+            subcategories=tuple(problem.subcategories),
+            company_tags=tuple(problem.company_tags),
+            frequency=problem.frequency,
+            acceptance_rate=problem.acceptance_rate,
+            tags=tuple(problem.tags),
+            similar_problems=tuple(problem.similar_problems),
+            prerequisites=tuple(problem.prerequisites),
+            leetcode_id=problem.leetcode_id
+        )
+
+
+# Stable integer ids for enum-valued feature columns
+CATEGORY_IDS: Dict[ProblemCategory, int] = {
+    category: i for i, category in enumerate(ProblemCategory)}
+DIFFICULTY_IDS: Dict[ProblemDifficulty, int] = {
+    difficulty: i for i, difficulty in enumerate(ProblemDifficulty)}
+
+
+@dataclass
+class ProblemFeatures:
+    """Column-oriented numeric features of every indexed problem"""
+    ids: List[str]
+    rows: Dict[str, int]
+    frequency: np.ndarray  # float64, 0.0 when unknown
+    acceptance_rate: np.ndarray  # float64, 0.0 when unknown
+    company_count: np.ndarray  # int16
+    category_id: np.ndarray  # int16
+    difficulty_id: np.ndarray  # int8
+
+    @classmethod
+    def from_records(cls, records: List[ProblemIndexRecord]) -> "ProblemFeatures":
+        """Build the feature columns in record order"""
+        return cls(
+            ids=[r.id for r in records],
+            rows={r.id: i for i, r in enumerate(records)},
+            frequency=np.fromiter(
+                (r.frequency or 0.0 for r in records), dtype=np.float64, count=len(records)),
+            acceptance_rate=np.fromiter(
+                (r.acceptance_rate or 0.0 for r in records), dtype=np.float64, count=len(records)),
+            company_count=np.fromiter(
+                (len(r.company_tags) for r in records), dtype=np.int16, count=len(records)),
+            category_id=np.fromiter(
+                (CATEGORY_IDS[r.category] for r in records), dtype=np.int16, count=len(records)),
+            difficulty_id=np.fromiter(
+                (DIFFICULTY_IDS[r.difficulty] for r in records), dtype=np.int8, count=len(records))
+        )
+
+    def row_mask(self, problem_ids: List[str]) -> np.ndarray:
+        """Boolean mask selecting the given problem ids"""
+        mask = np.zeros(len(self.ids), dtype=bool)
+        rows = [self.rows[pid] for pid in problem_ids if pid in self.rows]
+        if rows:
+            mask[rows] = True
+        return mask
+
+
 class ProblemFilter(BaseModel):
     """Filter criteria for problem selection"""
     difficulties: Optional[List[ProblemDifficulty]] = None
@@ -155,52 +250,149 @@ class ProblemDatabaseConfig(BaseModel):
         default_factory=lambda: {"easy": 0.3, "medium": 0.5, "hard": 0.2}
     )
     recommendation_algorithm: str = "adaptive"  # "adaptive", "random", "sequential"
-
-
-class ProblemDatabase:
+    enable_snapshot: bool = True  # Cache validated problems in a binary snapshot
+    snapshot_path: Optional[str] = None  # Defaults to <data_directory>/.problems.snapshot
+    loader_threads: Optional[int] = None  # Threads reading and parsing JSON, defaults to min(8, CPU count)
+    loader_processes: Optional[int] = None  # Validation processes, defaults to CPU count
+    loader_chunk_size: int = 250  # Problems validated per process task
+    parallel_load_threshold: int = 200  # Below this many files load sequentially
+    body_cache_size: int = 256  # Full problems kept decoded in the body store LRU
+    vector_index_directory: Optional[str] = "vectorstores/problems"  # Similar-problem embeddings
+    auto_build_vector_index: bool = True  # Build embeddings at warmup if missing or stale
+    source: str = "local"  # "local" (JSON directory) or "mongo" (DSA_Problems.Leetcode)
+    mongo_url: Optional[str] = None  # Defaults to MONGODB_URL
+    mongo_database: str = "DSA_Problems"
+    mongo_collection: str = "Leetcode"
+    mongo_batch_size: int = 500  # Documents per cursor batch
+    mongo_cache_path: Optional[str] = None  # Defaults to <data_directory>/.leetcode.cache
+    performance_journal_path: Optional[str] = None  # Defaults to INTERVIEW_PERFORMANCE_JOURNAL_PATH or data/user_performance.jsonl
+
+
+class ProblemMapping(Mapping):
+    """Read-only problem_id -> Problem view that loads bodies on access"""
+
+    def __init__(self, database: "ProblemDatabase"):
+        self._database = database
+
+    def __getitem__(self, problem_id: str) -> Problem:
+        problem = self._database.get_problem(problem_id)
+        if problem is None:
+            raise KeyError(problem_id)
+        return problem
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._database.records)
+
+    def __len__(self) -> int:
+        return len(self._database.records)
+
+    def __contains__(self, problem_id: object) -> bool:
+        return problem_id in self._database.records
+
+
+class ProblemCatalogLoader:
     """
-    Manages problem data and provides intelligent problem selection
+    Builds the records and body store of a catalog from configured sources
     """
 
     def __init__(self, config: ProblemDatabaseConfig):
         self.config = config
-        self.problems: Dict[str, Problem] = {}
-        self.category_index: Dict[ProblemCategory, List[str]] = {}
-        self.difficulty_index: Dict[ProblemDifficulty, List[str]] = {}
-        self.company_index: Dict[CompanyTag, List[str]] = {}
+        self.records: Dict[str, ProblemIndexRecord] = {}
+        self.body_store = ProblemBodyStore(b"", {}, config.body_cache_size)
 
-        # User performance tracking for recommendations
-        self.user_performance: Dict[str, Dict[str, Any]] = {}
+        # Problem files that failed to load during the directory load
+        self.load_errors: List[ProblemLoadError] = []
 
-        self._initialize_database()
-        logger.info("ProblemDatabase initialized")
-
-    def _initialize_database(self):
-        """Initialize database with default problems"""
-        # Load problems from data directory if exists
+    def load(self) -> "ProblemCatalog":
+        """Load problems and build an immutable catalog"""
         data_path = Path(self.config.data_directory)
-        if data_path.exists():
+        if self.config.source == "mongo":
+            self._load_problems_from_mongo()
+        elif data_path.exists():
+            # Load problems from data directory if exists
             self._load_problems_from_directory(data_path)
 
         # If no problems loaded, create default problems
-        if not self.problems:
+        if not self.records:
             self._create_default_problems()
 
-        self._build_indexes()
+        return ProblemCatalog(self.records, self.body_store, self.load_errors)
+
+    def _set_problems(self, problems: List[Problem]):
+        """Index a freshly loaded problem list and keep bodies out of memory"""
+        self.records = {
+            problem.id: ProblemIndexRecord.from_problem(problem)
+            for problem in problems
+        }
+        self.body_store = ProblemBodyStore.from_problems(
+            problems, self.config.body_cache_size)
 
     def _load_problems_from_directory(self, data_path: Path):
+        """Load problems from the snapshot, falling back to the JSON files"""
+        snapshot = None
+        if self.config.enable_snapshot:
+            snapshot = ProblemSnapshot(
+                data_path,
+                Path(self.config.snapshot_path) if self.config.snapshot_path else None
+            )
+            cached = snapshot.load(self.config.body_cache_size)
+            if cached is not None:
+                self.records, self.body_store = cached
+                logger.info(
+                    f"Loaded {len(self.records)} problems from snapshot {snapshot.snapshot_path}")
+                return
+
+        problems = self._load_problem_files(data_path)
+        if not problems:
+            return
+
+        if snapshot is not None:
+            records = {
+                problem.id: ProblemIndexRecord.from_problem(problem)
+                for problem in problems
+            }
+            body_store = snapshot.save(
+                records, problems, self.config.body_cache_size)
+            if body_store is not None:
+                self.records, self.body_store = records, body_store
+                return
+
+        self._set_problems(problems)
+
+    def _load_problems_from_mongo(self):
+        """Load problems from the Leetcode collection through its local cache"""
+        problems = create_mongo_source(self.config).load()
+        if problems:
+            self._set_problems(list({
+                problem.id: problem for problem in problems
+            }.values()))
+            logger.info(f"Loaded {len(self.records)} problems from MongoDB")
+
+    def _load_problem_files(self, data_path: Path) -> List[Problem]:
         """Load problems from JSON files in data directory"""
+        loader = ParallelProblemLoader(
+            max_threads=self.config.loader_threads,
+            max_processes=self.config.loader_processes,
+            chunk_size=self.config.loader_chunk_size,
+            parallel_threshold=self.config.parallel_load_threshold
+        )
+
         try:
-            for problem_file in data_path.glob("*.json"):
-                with open(problem_file, 'r', encoding='utf-8') as f:
-                    problem_data = json.load(f)
-                    problem = Problem(**problem_data)
-                    self.problems[problem.id] = problem
-
-            logger.info(
-                f"Loaded {len(self.problems)} problems from {data_path}")
+            result = loader.load_directory(data_path)
         except Exception as e:
             logger.error(f"Error loading problems: {e}")
+            return []
+
+        # Later files win on duplicate ids, as with the sequential loader
+        problems = list({
+            problem.id: problem for problem in result.problems
+        }.values())
+        self.load_errors = result.errors
+
+        logger.info(
+            f"Loaded {len(problems)} problems from {data_path}"
+            + (f" ({len(result.errors)} files skipped)" if result.errors else ""))
+        return problems
 
     def _create_default_problems(self):
         """Create a set of default problems for testing"""
@@ -316,19 +508,64 @@ class ProblemDatabase:
             }
         ]
 
-        for problem_data in default_problems:
-            problem = Problem(**problem_data)
-            self.problems[problem.id] = problem
+        self._set_problems([
+            Problem(**problem_data) for problem_data in default_problems
+        ])
 
         logger.info(f"Created {len(default_problems)} default problems")
 
+
+class ProblemCatalog:
+    """
+    Immutable snapshot of the problem corpus and all derived indexes
+
+    Never mutated after construction; updates build a new catalog that is
+    published through SharedProblemCatalog.
+    """
+
+    def __init__(
+        self,
+        records: Dict[str, ProblemIndexRecord],
+        body_store: ProblemBodyStore,
+        load_errors: Optional[List[ProblemLoadError]] = None,
+        version: int = 1
+    ):
+        self.records: Mapping[str, ProblemIndexRecord] = MappingProxyType(
+            dict(records))
+        self.body_store = body_store
+        self.load_errors: Tuple[ProblemLoadError, ...] = tuple(load_errors or ())
+        self.version = version
+        self.category_index: Dict[ProblemCategory, List[str]] = {}
+        self.difficulty_index: Dict[ProblemDifficulty, List[str]] = {}
+        self.company_index: Dict[CompanyTag, List[str]] = {}
+        self._build_indexes()
+
+        # Freeze the indexes once they are built
+        self.category_index = MappingProxyType(
+            {k: tuple(v) for k, v in self.category_index.items()})
+        self.difficulty_index = MappingProxyType(
+            {k: tuple(v) for k, v in self.difficulty_index.items()})
+        self.company_index = MappingProxyType(
+            {k: tuple(v) for k, v in self.company_index.items()})
+        for column in (
+            self.features.frequency, self.features.acceptance_rate,
+            self.features.company_count, self.features.category_id,
+            self.features.difficulty_id
+        ):
+            column.flags.writeable = False
+
+    @classmethod
+    def load(cls, config: ProblemDatabaseConfig) -> "ProblemCatalog":
+        """Load a catalog from the configured sources"""
+        return ProblemCatalogLoader(config).load()
+
     def _build_indexes(self):
         """Build indexes for efficient problem lookup"""
         self.category_index.clear()
         self.difficulty_index.clear()
         self.company_index.clear()
 
-        for problem in self.problems.values():
+        for problem in self.records.values():
             # Category index
             if problem.category not in self.category_index:
                 self.category_index[problem.category] = []
@@ -351,41 +588,356 @@ class ProblemDatabase:
                     self.company_index[company] = []
                 self.company_index[company].append(problem.id)
 
+        # Feature columns for vectorized recommendation scoring
+        self.features = ProblemFeatures.from_records(list(self.records.values()))
+
+        # Weighted random selection over the same rows
+        self.sampler = ProblemSampler(
+            self.features.ids,
+            self.features.frequency,
+            self.features.difficulty_id,
+            {
+                CATEGORY_IDS[category]: np.fromiter(
+                    (self.features.rows[pid] for pid in problem_ids),
+                    dtype=np.int64, count=len(problem_ids))
+                for category, problem_ids in self.category_index.items()
+            }
+        )
+
+        # Prerequisite DAG and curriculum levels over the same rows
+        self.graph = ProblemGraph.build(
+            self.features.ids, self.records, self.features.frequency)
+
+
+    def with_problems(self, problems: List[Problem]) -> "ProblemCatalog":
+        """Return a new catalog with the given problems added or replaced"""
+        records = dict(self.records)
+        for problem in problems:
+            records[problem.id] = ProblemIndexRecord.from_problem(problem)
+        return ProblemCatalog(
+            records,
+            self.body_store.with_problems(problems),
+            self.load_errors,
+            self.version + 1
+        )
+
+
+class SharedProblemCatalog:
+    """
+    Holder of the currently published catalog
+
+    Readers take `current` once per operation and work on that snapshot;
+    writers build a new catalog and swap the reference under a lock.
+    """
+
+    def __init__(self, catalog: ProblemCatalog):
+        self.current = catalog
+        self._lock = threading.Lock()
+
+    def publish(self, catalog: ProblemCatalog) -> None:
+        """Atomically replace the published catalog"""
+        with self._lock:
+            self.current = catalog
+
+    def update(self, build: Callable[[ProblemCatalog], ProblemCatalog]) -> ProblemCatalog:
+        """Derive a new catalog from the current one and publish it"""
+        with self._lock:
+            self.current = build(self.current)
+            return self.current
+
+
+# Process-wide catalogs, one per source configuration
+_shared_catalogs: Dict[Tuple[Any, ...], SharedProblemCatalog] = {}
+_shared_catalogs_lock = threading.Lock()
+
+
+def _mongo_cache_path(config: ProblemDatabaseConfig) -> Path:
+    return (
+        Path(config.mongo_cache_path) if config.mongo_cache_path
+        else Path(config.data_directory) / ".leetcode.cache"
+    )
+
+
+def _catalog_key(config: ProblemDatabaseConfig) -> Tuple[Any, ...]:
+    """Source settings that identify a catalog"""
+    return (
+        config.source,
+        str(Path(config.data_directory).resolve()),
+        config.enable_snapshot,
+        config.snapshot_path,
+        config.mongo_url or os.getenv("MONGODB_URL"),
+        config.mongo_database,
+        config.mongo_collection,
+        str(_mongo_cache_path(config).resolve()),
+        config.body_cache_size
+    )
+
+
+def create_mongo_source(config: ProblemDatabaseConfig) -> MongoProblemSource:
+    """Mongo problem source for a database config"""
+    return MongoProblemSource(
+        connection_url=config.mongo_url,
+        database_name=config.mongo_database,
+        collection_name=config.mongo_collection,
+        cache_path=_mongo_cache_path(config),
+        batch_size=config.mongo_batch_size
+    )
+
+
+def get_shared_catalog(config: ProblemDatabaseConfig) -> SharedProblemCatalog:
+    """Return the process-wide catalog for a config, loading it once"""
+    key = _catalog_key(config)
+    with _shared_catalogs_lock:
+        shared = _shared_catalogs.get(key)
+        if shared is None:
+            shared = SharedProblemCatalog(ProblemCatalog.load(config))
+            _shared_catalogs[key] = shared
+        return shared
+
+
+def problem_catalog_settings(**kwargs) -> Dict[str, Any]:
+    """
+    ProblemDatabaseConfig settings that select the catalog
+
+    PROBLEM_DATA_DIRECTORY and PROBLEM_SOURCE ("local" or "mongo") override
+    the defaults; explicit keyword arguments override both. The preload in
+    main.py and create_problem_database resolve through here, so the master
+    process and its workers agree on the catalog key.
+    """
+    return {
+        "data_directory": os.getenv("PROBLEM_DATA_DIRECTORY", "data/problems"),
+        "source": os.getenv("PROBLEM_SOURCE", "local").lower(),
+        **kwargs
+    }
+
+
+def preload_problem_catalog(
+    freeze_gc: bool = True,
+    **kwargs
+) -> SharedProblemCatalog:
+    """
+    Load the shared catalog before worker processes are forked
+
+    Call from the master process (e.g. gunicorn --preload with uvicorn
+    workers). gc.freeze() moves everything allocated so far into the
+    permanent generation so collections in the children never write to
+    those pages and they stay shared copy-on-write.
+    """
+    config = ProblemDatabaseConfig(**problem_catalog_settings(**kwargs))
+    shared = get_shared_catalog(config)
+    if freeze_gc:
+        gc.collect()
+        gc.freeze()
+    logger.info(
+        f"Preloaded problem catalog with {len(shared.current.records)} problems")
+    return shared
+
+
+class ProblemDatabase:
+    """
+    Manages problem data and provides intelligent problem selection
+
+    Problem data comes from a shared immutable ProblemCatalog. Only
+    ProblemIndexRecord entries stay resident; full problems are read from
+    the body store on demand.
+    """
+
+    def __init__(
+        self,
+        config: ProblemDatabaseConfig,
+        shared_catalog: Optional[SharedProblemCatalog] = None
+    ):
+        self.config = config
+        self.shared_catalog = shared_catalog or SharedProblemCatalog(
+            ProblemCatalog.load(config))
+
+        # User performance tracking for recommendations
+        journal_path = Path(
+            config.performance_journal_path
+            or os.getenv("INTERVIEW_PERFORMANCE_JOURNAL_PATH", "data/user_performance.jsonl")
+        )
+        self.user_performance: UserPerformanceStore = get_performance_store(journal_path)
+
+        # Source of randomness for sample_problem
+        self._rng = random.Random()
+
+        # Incremental Mongo refreshes, created on first use
+        self._mongo_source: Optional[MongoProblemSource] = None
+
+        # Similar-problem embeddings for one catalog version, prepared at
+        # warmup and rebuilt in the background when the catalog changes
+        self._vector_index: Optional[ProblemVectorIndex] = None
+        self._vector_index_version: Optional[int] = None
+        self._vector_index_lock = threading.Lock()
+        self._vector_index_rebuild: Optional[threading.Thread] = None
+
+        logger.info("ProblemDatabase initialized")
+
+    @property
+    def catalog(self) -> ProblemCatalog:
+        """Currently published catalog snapshot"""
+        return self.shared_catalog.current
+
+    @property
+    def records(self) -> Mapping[str, ProblemIndexRecord]:
+        return self.catalog.records
+
+    @property
+    def body_store(self) -> ProblemBodyStore:
+        return self.catalog.body_store
+
+    @property
+    def category_index(self) -> Mapping[ProblemCategory, Tuple[str, ...]]:
+        return self.catalog.category_index
+
+    @property
+    def difficulty_index(self) -> Mapping[ProblemDifficulty, Tuple[str, ...]]:
+        return self.catalog.difficulty_index
+
+    @property
+    def company_index(self) -> Mapping[CompanyTag, Tuple[str, ...]]:
+        return self.catalog.company_index
+
+    @property
+    def features(self) -> ProblemFeatures:
+        return self.catalog.features
+
+    @property
+    def load_errors(self) -> Tuple[ProblemLoadError, ...]:
+        return self.catalog.load_errors
+
+    @property
+    def problems(self) -> Mapping[str, Problem]:
+        """Problems keyed by id; each access loads the full body"""
+        return ProblemMapping(self)
+
     def get_problem(self, problem_id: str) -> Optional[Problem]:
         """Get a specific problem by ID"""
-        return self.problems.get(problem_id)
+        catalog = self.catalog
+        if problem_id not in catalog.records:
+            return None
+        return catalog.body_store.get(problem_id)
+
+    def get_record(self, problem_id: str) -> Optional[ProblemIndexRecord]:
+        """Get the compact index record for a problem"""
+        return self.records.get(problem_id)
+
+    @property
+    def vector_index(self) -> Optional[ProblemVectorIndex]:
+        """
+        Similar-problem embeddings for the current catalog, or None
+
+        Never builds on the caller's thread: a missing or stale index starts
+        a background rebuild and None is returned until it is published.
+        """
+        if self._vector_index_version != self.catalog.version:
+            self._schedule_vector_index_rebuild()
+            return None
+        return self._vector_index
+
+    def prepare_vector_index(self) -> Optional[ProblemVectorIndex]:
+        """Load or build the embeddings for the current catalog (blocking)"""
+        with self._vector_index_lock:
+            version = self.catalog.version
+            if self._vector_index_version != version:
+                self._vector_index = self._load_vector_index()
+                self._vector_index_version = version
+            return self._vector_index
+
+    def _schedule_vector_index_rebuild(self) -> None:
+        """Start a single background rebuild unless one is running"""
+        with self._vector_index_lock:
+            if self._vector_index_rebuild is not None and self._vector_index_rebuild.is_alive():
+                return
+            self._vector_index_rebuild = threading.Thread(
+                target=self.prepare_vector_index,
+                name="problem-vector-index",
+                daemon=True
+            )
+            self._vector_index_rebuild.start()
+
+    def _load_vector_index(self) -> Optional[ProblemVectorIndex]:
+        """Load saved embeddings, building them if allowed and needed"""
+        if not self.config.vector_index_directory:
+            return None
+
+        directory = Path(self.config.vector_index_directory)
+        fingerprint = catalog_fingerprint(self.records.values())
+        index = ProblemVectorIndex.load(directory, fingerprint)
+        if index is not None or not self.config.auto_build_vector_index:
+            return index
+
+        try:
+            return build_vector_index(self, directory)
+        except Exception as e:
+            logger.error(f"Error building problem vector index: {e}")
+            return None
+
+    def similar(self, problem_id: str, k: int = 5) -> List[ProblemIndexRecord]:
+        """
+        Problems most similar to the given one
+
+        Curated similar_problems come first, followed by nearest neighbours
+        from the embedding index.
+        """
+        catalog = self.catalog
+        record = catalog.records.get(problem_id)
+        if record is None or k <= 0:
+            return []
+
+        similar_ids = [
+            pid for pid in record.similar_problems
+            if pid in catalog.records and pid != problem_id
+        ]
+        index = self.vector_index
+        if index is not None and len(similar_ids) < k:
+            # Over-fetch so curated duplicates do not shrink the result
+            for pid, _ in index.similar(problem_id, k + len(similar_ids)):
+                if pid in catalog.records and pid not in similar_ids:
+                    similar_ids.append(pid)
+
+        return [catalog.records[pid] for pid in dict.fromkeys(similar_ids)][:k]
 
     def search_problems(self, filter_criteria: ProblemFilter) -> List[Problem]:
         """Search problems based on filter criteria"""
-        candidate_ids = set(self.problems.keys())
+        records = self.search_records(filter_criteria)
+        return [
+            problem for problem in (self.get_problem(r.id) for r in records)
+            if problem is not None
+        ]
+
+    def search_records(self, filter_criteria: ProblemFilter) -> List[ProblemIndexRecord]:
+        """Search index records based on filter criteria without loading bodies"""
+        catalog = self.catalog
+        candidate_ids = set(catalog.records.keys())
 
         # Apply difficulty filter
         if filter_criteria.difficulties:
             difficulty_ids = set()
             for difficulty in filter_criteria.difficulties:
                 difficulty_ids.update(
-                    self.difficulty_index.get(difficulty, []))
+                    catalog.difficulty_index.get(difficulty, []))
             candidate_ids &= difficulty_ids
 
         # Apply category filter
         if filter_criteria.categories:
             category_ids = set()
             for category in filter_criteria.categories:
-                category_ids.update(self.category_index.get(category, []))
+                category_ids.update(catalog.category_index.get(category, []))
             candidate_ids &= category_ids
 
         # Apply company filter
         if filter_criteria.company_tags:
             company_ids = set()
             for company in filter_criteria.company_tags:
-                company_ids.update(self.company_index.get(company, []))
+                company_ids.update(catalog.company_index.get(company, []))
             candidate_ids &= company_ids
 
         # Apply frequency filter
         if filter_criteria.min_frequency is not None:
             frequency_ids = {
                 pid for pid in candidate_ids
-                if self.problems[pid].frequency and self.problems[pid].frequency >= filter_criteria.min_frequency
+                if catalog.records[pid].frequency and catalog.records[pid].frequency >= filter_criteria.min_frequency
             }
             candidate_ids &= frequency_ids
 
@@ -399,17 +951,67 @@ class ProblemDatabase:
             for tag in filter_criteria.tags:
                 tag_ids.update([
                     pid for pid in candidate_ids
-                    if tag in self.problems[pid].tags
+                    if tag in catalog.records[pid].tags
                 ])
             candidate_ids &= tag_ids
 
-        # Get problems and apply limit
-        problems = [self.problems[pid] for pid in candidate_ids]
+        # Get records and apply limit
+        records = [catalog.records[pid] for pid in candidate_ids]
 
         # Sort by frequency (descending) and then by difficulty
-        problems.sort(key=lambda p: (-(p.frequency or 0), p.difficulty.value))
+        records.sort(key=lambda r: (-(r.frequency or 0), r.difficulty.value))
+
+        return records[:filter_criteria.limit]
 
-        return problems[:filter_criteria.limit]
+    def sample_problem(
+        self,
+        difficulties: Optional[List[ProblemDifficulty]] = None,
+        categories: Optional[List[ProblemCategory]] = None,
+        exclude_ids: Optional[List[str]] = None,
+        user_id: Optional[str] = None
+    ) -> Optional[ProblemIndexRecord]:
+        """
+        Pick a problem at random following config.default_difficulty_distribution
+
+        "adaptive" weights problems by frequency, "random" draws uniformly and
+        "sequential" returns the best match like search_records. Problems in
+        exclude_ids and problems the user already solved are never returned.
+        """
+        catalog = self.catalog
+        allowed = set(difficulties) if difficulties else set(ProblemDifficulty)
+
+        excluded = set(exclude_ids or ())
+        aggregate = self.user_performance.get(user_id) if user_id else None
+        completed = aggregate.completed_problems if aggregate else set()
+
+        def is_excluded(problem_id: str) -> bool:
+            return problem_id in excluded or problem_id in completed
+
+        if self.config.recommendation_algorithm == "sequential":
+            records = self.search_records(ProblemFilter(
+                difficulties=list(allowed),
+                categories=categories,
+                limit=len(catalog.records)
+            ))
+            return next((r for r in records if not is_excluded(r.id)), None)
+
+        difficulty_weights = {
+            DIFFICULTY_IDS[difficulty]: self.config.default_difficulty_distribution.get(
+                difficulty.value, 0.0)
+            for difficulty in allowed
+        }
+        if not any(difficulty_weights.values()):
+            # Distribution does not cover the requested difficulties
+            difficulty_weights = dict.fromkeys(difficulty_weights, 1.0)
+
+        problem_id = catalog.sampler.sample(
+            self._rng,
+            difficulty_weights,
+            frozenset(CATEGORY_IDS[c] for c in categories) if categories else None,
+            is_excluded if (excluded or completed) else None,
+            weighted=self.config.recommendation_algorithm != "random"
+        )
+        return catalog.records.get(problem_id) if problem_id else None
 
     def get_recommendations(
         self,
@@ -427,111 +1029,152 @@ class ProblemDatabase:
         if not target_difficulty:
             target_difficulty = self._determine_target_difficulty(user_perf)
 
-        # Get candidate problems
-        filter_criteria = ProblemFilter(
-            difficulties=[target_difficulty],
-            exclude_ids=user_perf.get("completed_problems", []),
-            limit=20
-        )
-
-        candidate_problems = self.search_problems(filter_criteria)
-
-        # Generate recommendations with scoring
+        # Score the whole eligible catalog at once
+        catalog = self.catalog
+        features = catalog.features
+        eligible = features.difficulty_id == DIFFICULTY_IDS[target_difficulty]
+        aggregate = user_perf.get("aggregate")
+        if aggregate is not None:
+            solved = aggregate.completed_mask(features)
+        else:
+            solved = features.row_mask(user_perf.get("completed_problems", []))
+        eligible &= ~solved
+
+        # Prefer problems whose prerequisites are already solved
+        unlocked = eligible & catalog.graph.prerequisites_met(solved)
+        if unlocked.any():
+            eligible = unlocked
+        candidate_rows = np.flatnonzero(eligible)
+        if candidate_rows.size == 0:
+            return []
+
+        scores = self._score_candidates(features, candidate_rows, user_perf)
+        top_rows = self._top_k_rows(features, candidate_rows, scores, k=5)
+
+        # Build reasoning and load bodies for the winners only
+        row_scores = dict(zip(candidate_rows.tolist(), scores.tolist()))
         recommendations = []
-        for problem in candidate_problems:
-            confidence_score = self._calculate_recommendation_score(
-                problem, user_perf)
-            estimated_time = self._estimate_problem_time(problem, user_perf)
-            reasoning = self._generate_recommendation_reasoning(
-                problem, user_perf)
-
-            recommendation = ProblemRecommendation(
+        for row in top_rows:
+            record = catalog.records[features.ids[row]]
+            confidence_score = row_scores[row]
+            problem = catalog.body_store.get(record.id)
+            if problem is None:
+                continue
+            recommendations.append(ProblemRecommendation(
                 problem=problem,
                 confidence_score=confidence_score,
-                reasoning=reasoning,
-                estimated_time=estimated_time
-            )
-            recommendations.append(recommendation)
+                reasoning=self._generate_recommendation_reasoning(
+                    record, user_perf),
+                estimated_time=self._estimate_problem_time(record, user_perf),
+                prerequisite_topics=[
+                    catalog.records[pid].title
+                    for pid in catalog.graph.all_prerequisites(record.id)
+                ]
+            ))
+
+        return recommendations
+
+    def record_attempt(
+        self,
+        user_id: str,
+        problem_id: str,
+        solution_correct: bool,
+        time_taken: float
+    ) -> None:
+        """Fold a finished problem attempt into the user's aggregate"""
+        record = self.get_record(problem_id)
+        self.user_performance.record_attempt(
+            user_id,
+            problem_id,
+            record.category.value if record else None,
+            solution_correct,
+            time_taken
+        )
+
+    def next_eligible_problems(
+        self,
+        user_id: str,
+        limit: int = 10,
+        difficulties: Optional[List[ProblemDifficulty]] = None
+    ) -> List[ProblemIndexRecord]:
+        """
+        Unsolved problems whose prerequisites the user has solved
+
+        Ordered by curriculum level, then frequency.
+        """
+        catalog = self.catalog
+        features = catalog.features
+        aggregate = self.user_performance.get(user_id)
+        solved = (
+            aggregate.completed_mask(features) if aggregate
+            else np.zeros(len(features.ids), dtype=bool)
+        )
 
-        # Sort by confidence score
-        recommendations.sort(key=lambda r: r.confidence_score, reverse=True)
+        candidate_mask = None
+        if difficulties:
+            candidate_mask = np.isin(
+                features.difficulty_id, [DIFFICULTY_IDS[d] for d in difficulties])
 
-        return recommendations[:5]  # Return top 5 recommendations
+        rows = catalog.graph.next_eligible(solved, limit, candidate_mask)
+        return [catalog.records[features.ids[row]] for row in rows]
 
     def _analyze_user_performance(
         self,
         user_id: str,
         session_history: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Analyze user performance from session history"""
-
-        performance = {
-            "completed_problems": [],
-            "attempted_problems": [],
-            "strong_categories": [],
-            "weak_categories": [],
-            "average_time": 0,
-            "success_rate": 0,
-            "preferred_difficulty": ProblemDifficulty.EASY
-        }
-
-        if not session_history:
-            return performance
-
-        total_problems = len(session_history)
-        successful_problems = 0
-        total_time = 0
-        category_performance = {}
-
-        for session in session_history:
-            problem_id = session.get("problem_id")
-            if problem_id:
-                performance["attempted_problems"].append(problem_id)
-
-                if session.get("solution_correct", False):
-                    performance["completed_problems"].append(problem_id)
-                    successful_problems += 1
-
-                # Track time
-                time_taken = session.get("time_taken", 0)
-                total_time += time_taken
-
-                # Track category performance
-                problem = self.get_problem(problem_id)
-                if problem:
-                    category = problem.category
-                    if category not in category_performance:
-                        category_performance[category] = {
-                            "attempts": 0, "successes": 0}
-
-                    category_performance[category]["attempts"] += 1
-                    if session.get("solution_correct", False):
-                        category_performance[category]["successes"] += 1
-
-        # Calculate metrics
-        performance["success_rate"] = successful_problems / \
-            total_problems if total_problems > 0 else 0
-        performance["average_time"] = total_time / \
-            total_problems if total_problems > 0 else 0
-
-        # Determine strong and weak categories
-        for category, stats in category_performance.items():
-            success_rate = stats["successes"] / \
-                stats["attempts"] if stats["attempts"] > 0 else 0
-            if success_rate > 0.7:
-                performance["strong_categories"].append(category)
-            elif success_rate < 0.3:
-                performance["weak_categories"].append(category)
+        """
+        Summarize user performance from the running aggregate
+
+        session_history is only read to seed a user who has no aggregate
+        yet; afterwards record_attempt keeps the aggregate current.
+        """
+        aggregate = self.user_performance.get(user_id)
+        if aggregate is None:
+            if not session_history:
+                return {
+                    "completed_problems": set(),
+                    "attempted_problems": set(),
+                    "strong_categories": [],
+                    "weak_categories": [],
+                    "average_time": 0,
+                    "success_rate": 0,
+                    "preferred_difficulty": ProblemDifficulty.EASY
+                }
+            aggregate = self.user_performance.seed(user_id, [
+                {
+                    "problem_id": session["problem_id"],
+                    "category": self._record_category(session["problem_id"]),
+                    "solution_correct": session.get("solution_correct", False),
+                    "time_taken": session.get("time_taken", 0)
+                }
+                for session in session_history if session.get("problem_id")
+            ])
+
+        split = aggregate.category_split()
+        success_rate = aggregate.success_rate
 
         # Determine preferred difficulty
-        if performance["success_rate"] > 0.8:
-            performance["preferred_difficulty"] = ProblemDifficulty.MEDIUM
-        elif performance["success_rate"] > 0.6:
-            performance["preferred_difficulty"] = ProblemDifficulty.EASY
+        if success_rate > 0.8:
+            preferred_difficulty = ProblemDifficulty.MEDIUM
         else:
-            performance["preferred_difficulty"] = ProblemDifficulty.EASY
+            preferred_difficulty = ProblemDifficulty.EASY
+
+        return {
+            # Live sets owned by the aggregate, treat as read-only
+            "completed_problems": aggregate.completed_problems,
+            "attempted_problems": aggregate.attempted_problems,
+            "strong_categories": [ProblemCategory(c) for c in split["strong"]],
+            "weak_categories": [ProblemCategory(c) for c in split["weak"]],
+            "average_time": aggregate.average_time,
+            "success_rate": success_rate,
+            "preferred_difficulty": preferred_difficulty,
+            "aggregate": aggregate
+        }
 
-        return performance
+    def _record_category(self, problem_id: str) -> Optional[str]:
+        record = self.get_record(problem_id)
+        return record.category.value if record else None
 
     def _determine_target_difficulty(self, user_perf: Dict[str, Any]) -> ProblemDifficulty:
         """Determine appropriate target difficulty for user"""
@@ -544,41 +1187,57 @@ class ProblemDatabase:
         else:
             return ProblemDifficulty.EASY
 
-    def _calculate_recommendation_score(
+    def _score_candidates(
         self,
-        problem: Problem,
+        features: ProblemFeatures,
+        candidate_rows: np.ndarray,
         user_perf: Dict[str, Any]
-    ) -> float:
-        """Calculate confidence score for problem recommendation"""
-        score = 0.5  # Base score
-
-        # Frequency boost
-        if problem.frequency:
-            score += problem.frequency * 0.3
-
-        # Category alignment
-        strong_categories = user_perf.get("strong_categories", [])
-        weak_categories = user_perf.get("weak_categories", [])
-
-        if problem.category in weak_categories:
-            score += 0.2  # Practice weak areas
-        elif problem.category in strong_categories:
-            score += 0.1  # Reinforce strengths
-
-        # Company tag relevance
-        if problem.company_tags:
-            score += len(problem.company_tags) * 0.05
+    ) -> np.ndarray:
+        """Calculate confidence scores for candidate rows in one expression"""
+        # Per-category bonus: practice weak areas, reinforce strengths
+        category_bonus = np.zeros(len(CATEGORY_IDS), dtype=np.float64)
+        for category in user_perf.get("strong_categories", []):
+            category_bonus[CATEGORY_IDS[category]] = 0.1
+        for category in user_perf.get("weak_categories", []):
+            category_bonus[CATEGORY_IDS[category]] = 0.2
+
+        scores = (
+            0.5  # Base score
+            + features.frequency[candidate_rows] * 0.3  # Frequency boost
+            + category_bonus[features.category_id[candidate_rows]]
+            + features.company_count[candidate_rows] * 0.05  # Company tag relevance
+            # More approachable problems
+            + (features.acceptance_rate[candidate_rows] > 0.5) * 0.1
+        )
+        return np.minimum(scores, 1.0)
 
-        # Acceptance rate consideration
-        if problem.acceptance_rate:
-            if problem.acceptance_rate > 0.5:
-                score += 0.1  # More approachable problems
+    def _top_k_rows(
+        self,
+        features: ProblemFeatures,
+        candidate_rows: np.ndarray,
+        scores: np.ndarray,
+        k: int
+    ) -> List[int]:
+        """Rows of the k best scores, ties broken by frequency then difficulty"""
+        if scores.size > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            # Keep every candidate tied with the k-th score so the tie-break
+            # below sees all of them
+            top = np.flatnonzero(scores >= scores[top].min())
+        else:
+            top = np.arange(scores.size)
 
-        return min(1.0, score)
+        rows = candidate_rows[top]
+        order = np.lexsort((
+            features.difficulty_id[rows],
+            -features.frequency[rows],
+            -scores[top]
+        ))
+        return rows[order][:k].tolist()
 
     def _estimate_problem_time(
         self,
-        problem: Problem,
+        problem: ProblemIndexRecord,
         user_perf: Dict[str, Any]
     ) -> int:
         """Estimate time needed to solve problem in minutes"""
@@ -601,7 +1260,7 @@ class ProblemDatabase:
 
     def _generate_recommendation_reasoning(
         self,
-        problem: Problem,
+        problem: ProblemIndexRecord,
         user_perf: Dict[str, Any]
     ) -> str:
         """Generate reasoning for why this problem is recommended"""
@@ -637,8 +1296,8 @@ class ProblemDatabase:
     def add_problem(self, problem: Problem) -> bool:
         """Add a new problem to the database"""
         try:
-            self.problems[problem.id] = problem
-            self._build_indexes()
+            self.shared_catalog.update(
+                lambda catalog: catalog.with_problems([problem]))
             logger.info(f"Added problem: {problem.title}")
             return True
         except Exception as e:
@@ -647,56 +1306,96 @@ class ProblemDatabase:
 
     def update_problem(self, problem_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing problem"""
-        if problem_id not in self.problems:
+        if problem_id not in self.records:
             return False
 
         try:
-            problem = self.problems[problem_id]
+            problem = self.get_problem(problem_id)
+            if problem is None:
+                return False
+            problem = problem.model_copy()
             for key, value in updates.items():
                 if hasattr(problem, key):
                     setattr(problem, key, value)
 
-            self._build_indexes()
+            self.shared_catalog.update(
+                lambda catalog: catalog.with_problems([problem]))
             logger.info(f"Updated problem: {problem_id}")
             return True
         except Exception as e:
             logger.error(f"Error updating problem: {e}")
             return False
 
+    def refresh_from_source(self) -> int:
+        """
+        Pull problems changed in MongoDB since the last load
+
+        Only documents past the cached watermarks are fetched; they are
+        published as a new catalog version. Returns the number of changed
+        problems.
+        """
+        if self.config.source != "mongo":
+            return 0
+
+        if self._mongo_source is None:
+            self._mongo_source = create_mongo_source(self.config)
+        try:
+            changed = self._mongo_source.refresh()
+        except Exception as e:
+            logger.error(f"Error refreshing problems from MongoDB: {e}")
+            return 0
+
+        if changed:
+            self.shared_catalog.update(
+                lambda catalog: catalog.with_problems(changed))
+            logger.info(f"Refreshed {len(changed)} problems from MongoDB")
+        return len(changed)
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics"""
-        total_problems = len(self.problems)
+        catalog = self.catalog
+        total_problems = len(catalog.records)
 
         difficulty_stats = {
             difficulty: len(problems)
-            for difficulty, problems in self.difficulty_index.items()
+            for difficulty, problems in catalog.difficulty_index.items()
         }
 
         category_stats = {
             category: len(problems)
-            for category, problems in self.category_index.items()
+            for category, problems in catalog.category_index.items()
         }
 
         return {
             "total_problems": total_problems,
             "difficulty_distribution": difficulty_stats,
             "category_distribution": category_stats,
-            "companies_covered": len(self.company_index),
+            "companies_covered": len(catalog.company_index),
             "average_frequency": sum(
-                p.frequency for p in self.problems.values() if p.frequency
-            ) / total_problems if total_problems > 0 else 0
+                r.frequency for r in catalog.records.values() if r.frequency
+            ) / total_problems if total_problems > 0 else 0,
+            "catalog_version": catalog.version,
+            "prerequisite_graph": catalog.graph.get_stats(),
+            "body_store": catalog.body_store.get_stats()
         }
 
 
 def create_problem_database(
-    data_directory: str = "data/problems",
+    data_directory: Optional[str] = None,
+    shared: bool = True,
     **kwargs
 ) -> ProblemDatabase:
-    """Factory function to create ProblemDatabase with default config"""
+    """
+    Factory function to create ProblemDatabase with environment overrides
 
-    config = ProblemDatabaseConfig(
-        data_directory=data_directory,
-        **kwargs
-    )
+    Settings not passed explicitly come from problem_catalog_settings. With
+    shared=True (default) the database references the process-wide catalog
+    for its sources instead of loading a private copy.
+    """
+    if data_directory is not None:
+        kwargs["data_directory"] = data_directory
+    config = ProblemDatabaseConfig(**problem_catalog_settings(**kwargs))
 
+    if shared:
+        return ProblemDatabase(config, get_shared_catalog(config))
     return ProblemDatabase(config)
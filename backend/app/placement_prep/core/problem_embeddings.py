@@ -0,0 +1,391 @@
+"""
+Problem Embedding Pipeline for AI-Based Mock Interview Platform
+
+Offline, CPU-only embeddings of problem title, description and tags used for
+similar-problem retrieval. Text is turned into hashed TF-IDF vectors and
+reduced with a randomized truncated SVD (LSA). The resulting matrix and a
+precomputed exact top-K neighbour table are stored as .npy files and
+memory-mapped at lookup time.
+
+Build from the command line:
+    python -m app.placement_prep.core.problem_embeddings --data-directory data/problems
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import re
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bump whenever tokenization, weighting or file layout changes
+EMBEDDING_SCHEMA_VERSION = 1
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be by can each for from given has have if in into is it its
+of on or return returns such that the their then there these this to was where
+which while will with you your
+""".split())
+
+
+class EmbeddingConfig:
+    """Settings for building problem embeddings"""
+
+    def __init__(
+        self,
+        dimensions: int = 128,
+        hash_features: int = 2 ** 14,
+        neighbors: int = 16,
+        power_iterations: int = 2,
+        title_weight: int = 3,
+        tag_weight: int = 2,
+        seed: int = 42
+    ):
+        self.dimensions = dimensions
+        self.hash_features = hash_features
+        self.neighbors = neighbors
+        self.power_iterations = power_iterations
+        self.title_weight = title_weight
+        self.tag_weight = tag_weight
+        self.seed = seed
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords"""
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and len(token) > 1
+    ]
+
+
+def _problem_tokens(problem: Any, config: EmbeddingConfig) -> Counter:
+    """Weighted token counts for one problem"""
+    counts: Counter = Counter()
+    for token in tokenize(problem.title):
+        counts[token] += config.title_weight
+    for token in tokenize(problem.description or ""):
+        counts[token] += 1
+    tag_text = " ".join(
+        list(problem.tags)
+        + [problem.category.value]
+        + [category.value for category in problem.subcategories]
+    )
+    for token in tokenize(tag_text.replace("_", " ")):
+        counts[token] += config.tag_weight
+    return counts
+
+
+def _hash_token(token: str, n_features: int) -> int:
+    """Stable feature index for a token (independent of PYTHONHASHSEED)"""
+    return zlib.crc32(token.encode("utf-8")) % n_features
+
+
+def catalog_fingerprint(records: Iterable[Any]) -> str:
+    """Fingerprint of the fields that identify an embedded catalog"""
+    digest = hashlib.sha256()
+    for record in sorted(records, key=lambda r: r.id):
+        digest.update(record.id.encode("utf-8"))
+        digest.update(record.title.encode("utf-8"))
+        digest.update("|".join(record.tags).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class _SparseRows:
+    """CSR-style hashed TF-IDF matrix built without scipy"""
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, values: np.ndarray, n_features: int):
+        self.indptr = indptr
+        self.indices = indices
+        self.values = values
+        self.n_features = n_features
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    def dense_rows(self, start: int, stop: int) -> np.ndarray:
+        """Densify a block of rows"""
+        block = np.zeros((stop - start, self.n_features), dtype=np.float32)
+        for i in range(start, stop):
+            lo, hi = self.indptr[i], self.indptr[i + 1]
+            block[i - start, self.indices[lo:hi]] = self.values[lo:hi]
+        return block
+
+
+def _build_tfidf(problems: List[Any], config: EmbeddingConfig) -> _SparseRows:
+    """Hashed, sublinear-TF, L2-normalized TF-IDF rows"""
+    n_features = config.hash_features
+    row_features: List[Dict[int, float]] = []
+    document_frequency = np.zeros(n_features, dtype=np.float64)
+
+    for problem in problems:
+        features: Dict[int, float] = {}
+        for token, count in _problem_tokens(problem, config).items():
+            index = _hash_token(token, n_features)
+            features[index] = features.get(index, 0.0) + count
+        row_features.append(features)
+        if features:
+            document_frequency[list(features.keys())] += 1
+
+    n_docs = len(problems)
+    idf = np.log((1.0 + n_docs) / (1.0 + document_frequency)) + 1.0
+
+    indptr = [0]
+    indices: List[int] = []
+    values: List[float] = []
+    for features in row_features:
+        row_indices = np.fromiter(features.keys(), dtype=np.int64, count=len(features))
+        row_values = np.fromiter(features.values(), dtype=np.float64, count=len(features))
+        row_values = (1.0 + np.log(row_values)) * idf[row_indices]
+        norm = np.linalg.norm(row_values)
+        if norm > 0:
+            row_values /= norm
+        indices.extend(row_indices.tolist())
+        values.extend(row_values.tolist())
+        indptr.append(len(indices))
+
+    return _SparseRows(
+        np.asarray(indptr, dtype=np.int64),
+        np.asarray(indices, dtype=np.int64),
+        np.asarray(values, dtype=np.float32),
+        n_features
+    )
+
+
+def _randomized_svd_embeddings(
+    matrix: _SparseRows,
+    dimensions: int,
+    power_iterations: int,
+    seed: int,
+    block_rows: int = 1024
+) -> np.ndarray:
+    """Rank-k LSA embeddings (U * S) via a randomized range finder"""
+    n_rows = matrix.n_rows
+    rank = min(dimensions, n_rows)
+    sketch = min(rank + 10, n_rows)
+    rng = np.random.default_rng(seed)
+
+    def multiply(right: np.ndarray) -> np.ndarray:
+        # A @ right, one dense block of rows at a time
+        out = np.empty((n_rows, right.shape[1]), dtype=np.float32)
+        for start in range(0, n_rows, block_rows):
+            stop = min(start + block_rows, n_rows)
+            out[start:stop] = matrix.dense_rows(start, stop) @ right
+        return out
+
+    def multiply_transpose(left: np.ndarray) -> np.ndarray:
+        # A.T @ left, accumulated over row blocks
+        out = np.zeros((matrix.n_features, left.shape[1]), dtype=np.float32)
+        for start in range(0, n_rows, block_rows):
+            stop = min(start + block_rows, n_rows)
+            out += matrix.dense_rows(start, stop).T @ left[start:stop]
+        return out
+
+    omega = rng.standard_normal(
+        (matrix.n_features, sketch)).astype(np.float32)
+    basis, _ = np.linalg.qr(multiply(omega))
+    for _ in range(power_iterations):
+        basis, _ = np.linalg.qr(multiply(multiply_transpose(basis)))
+
+    projected = multiply_transpose(basis).T  # (sketch, n_features)
+    u_small, singular_values, _ = np.linalg.svd(projected, full_matrices=False)
+    embeddings = (basis @ u_small[:, :rank]) * singular_values[:rank]
+
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (embeddings / norms).astype(np.float32)
+
+
+def _top_neighbors(
+    embeddings: np.ndarray,
+    k: int,
+    block_rows: int = 1024
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Exact cosine top-k neighbours (excluding self) for every row"""
+    n_rows = embeddings.shape[0]
+    k = min(k, max(n_rows - 1, 0))
+    neighbors = np.zeros((n_rows, k), dtype=np.int32)
+    scores = np.zeros((n_rows, k), dtype=np.float32)
+    if k == 0:
+        return neighbors, scores
+
+    for start in range(0, n_rows, block_rows):
+        stop = min(start + block_rows, n_rows)
+        similarity = embeddings[start:stop] @ embeddings.T
+        similarity[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+        top = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(similarity, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        neighbors[start:stop] = np.take_along_axis(top, order, axis=1)
+        scores[start:stop] = np.take_along_axis(top_scores, order, axis=1)
+    return neighbors, scores
+
+
+class ProblemVectorIndex:
+    """
+    Memory-mapped embedding matrix with a precomputed neighbour table
+    """
+
+    EMBEDDINGS_FILE = "embeddings.npy"
+    NEIGHBORS_FILE = "neighbors.npy"
+    SCORES_FILE = "neighbor_scores.npy"
+    META_FILE = "meta.json"
+
+    def __init__(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        neighbors: np.ndarray,
+        neighbor_scores: np.ndarray,
+        fingerprint: str
+    ):
+        self.ids = ids
+        self.rows = {problem_id: i for i, problem_id in enumerate(ids)}
+        self.embeddings = embeddings
+        self.neighbors = neighbors
+        self.neighbor_scores = neighbor_scores
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(
+        cls,
+        problems: List[Any],
+        fingerprint: str,
+        config: Optional[EmbeddingConfig] = None
+    ) -> "ProblemVectorIndex":
+        """Embed full problems and precompute neighbours"""
+        config = config or EmbeddingConfig()
+        matrix = _build_tfidf(problems, config)
+        embeddings = _randomized_svd_embeddings(
+            matrix, config.dimensions, config.power_iterations, config.seed)
+        neighbors, scores = _top_neighbors(embeddings, config.neighbors)
+        logger.info(
+            f"Built problem embeddings for {len(problems)} problems "
+            f"({embeddings.shape[1]} dimensions, {neighbors.shape[1]} neighbours)")
+        return cls([p.id for p in problems], embeddings, neighbors, scores, fingerprint)
+
+    def save(self, directory: Path) -> None:
+        """Write the index files"""
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / self.EMBEDDINGS_FILE, self.embeddings)
+        np.save(directory / self.NEIGHBORS_FILE, self.neighbors)
+        np.save(directory / self.SCORES_FILE, self.neighbor_scores)
+        # Metadata last so a partial write is never picked up as valid
+        with open(directory / self.META_FILE, "w", encoding="utf-8") as f:
+            json.dump({
+                "schema_version": EMBEDDING_SCHEMA_VERSION,
+                "fingerprint": self.fingerprint,
+                "ids": self.ids
+            }, f)
+
+    @classmethod
+    def load(
+        cls,
+        directory: Path,
+        fingerprint: Optional[str] = None
+    ) -> Optional["ProblemVectorIndex"]:
+        """Memory-map a saved index, or None if missing or stale"""
+        try:
+            with open(directory / cls.META_FILE, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("schema_version") != EMBEDDING_SCHEMA_VERSION:
+                return None
+            if fingerprint is not None and meta.get("fingerprint") != fingerprint:
+                logger.info("Problem embeddings are stale for this catalog")
+                return None
+            return cls(
+                meta["ids"],
+                np.load(directory / cls.EMBEDDINGS_FILE, mmap_mode="r"),
+                np.load(directory / cls.NEIGHBORS_FILE, mmap_mode="r"),
+                np.load(directory / cls.SCORES_FILE, mmap_mode="r"),
+                meta["fingerprint"]
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not load problem embeddings: {e}")
+            return None
+
+    def similar(self, problem_id: str, k: int = 5) -> List[Tuple[str, float]]:
+        """Most similar problem ids with cosine scores"""
+        row = self.rows.get(problem_id)
+        if row is None or k <= 0:
+            return []
+
+        if k <= self.neighbors.shape[1]:
+            return [
+                (self.ids[int(neighbor)], float(score))
+                for neighbor, score in zip(self.neighbors[row, :k], self.neighbor_scores[row, :k])
+            ]
+
+        # Beyond the precomputed table fall back to an exact scan
+        similarity = np.asarray(self.embeddings @ self.embeddings[row])
+        similarity[row] = -np.inf
+        k = min(k, len(self.ids) - 1)
+        top = np.argpartition(-similarity, k - 1)[:k]
+        top = top[np.argsort(-similarity[top], kind="stable")]
+        return [(self.ids[int(i)], float(similarity[i])) for i in top]
+
+
+def build_vector_index(
+    database: Any,
+    directory: Optional[Path] = None,
+    config: Optional[EmbeddingConfig] = None
+) -> ProblemVectorIndex:
+    """Embed every problem of a ProblemDatabase and optionally save it"""
+    catalog = database.catalog
+    # Bypass the LRU so a full pass does not evict hot problems
+    problems = [
+        catalog.body_store.get(problem_id, use_cache=False)
+        for problem_id in catalog.records
+    ]
+    index = ProblemVectorIndex.build(
+        [p for p in problems if p is not None],
+        catalog_fingerprint(catalog.records.values()),
+        config
+    )
+    if directory is not None:
+        index.save(directory)
+    return index
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point for offline index builds"""
+    from .problem_database import create_problem_database
+
+    parser = argparse.ArgumentParser(
+        description="Build the similar-problem vector index")
+    parser.add_argument(
+        "--data-directory", default=None,
+        help="Defaults to PROBLEM_DATA_DIRECTORY or data/problems")
+    parser.add_argument("--output", default="vectorstores/problems")
+    parser.add_argument("--dimensions", type=int, default=128)
+    parser.add_argument("--neighbors", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    database = create_problem_database(args.data_directory)
+    build_vector_index(
+        database,
+        Path(args.output),
+        EmbeddingConfig(dimensions=args.dimensions, neighbors=args.neighbors)
+    )
+    logger.info(f"Saved problem vector index to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
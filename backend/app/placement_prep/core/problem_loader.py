@@ -0,0 +1,148 @@
+"""
+Parallel Problem Corpus Loader for AI-Based Mock Interview Platform
+
+Loads problem JSON files when no usable snapshot exists. Files are read and
+parsed on a thread pool and validated in chunks on a process pool. Every bad
+file is reported on its own instead of aborting the whole load.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProblemLoadError:
+    """A single problem file that could not be loaded"""
+    path: str
+    error: str
+
+
+@dataclass
+class ProblemLoadResult:
+    """Outcome of loading a directory of problem files"""
+    problems: List[Any] = field(default_factory=list)
+    errors: List[ProblemLoadError] = field(default_factory=list)
+
+
+def _read_problem_file(path: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """Read and parse one JSON file (runs on the thread pool)"""
+    try:
+        with open(path, "rb") as f:
+            return path, json.loads(f.read()), None
+    except Exception as e:
+        return path, None, f"{type(e).__name__}: {e}"
+
+
+def _validate_chunk(
+    chunk: List[Tuple[str, Dict[str, Any]]]
+) -> List[Tuple[str, Optional[Any], Optional[str]]]:
+    """Validate parsed problem data (runs on the process pool)"""
+    # Imported here to avoid a circular import with problem_database
+    from .problem_database import Problem
+
+    results = []
+    for path, problem_data in chunk:
+        try:
+            results.append((path, Problem(**problem_data), None))
+        except Exception as e:
+            results.append((path, None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+class ParallelProblemLoader:
+    """
+    Loads and validates problem files concurrently
+    """
+
+    def __init__(
+        self,
+        max_threads: Optional[int] = None,
+        max_processes: Optional[int] = None,
+        chunk_size: int = 250,
+        parallel_threshold: int = 200
+    ):
+        # Pools only pay off with more than one core, so size them from the
+        # CPU count unless told otherwise
+        cpu_count = os.cpu_count() or 1
+        self.max_threads = max(1, max_threads or min(8, cpu_count))
+        self.max_processes = max(1, max_processes or cpu_count)
+        self.chunk_size = max(1, chunk_size)
+        self.parallel_threshold = parallel_threshold
+
+    def load_directory(self, data_path: Path) -> ProblemLoadResult:
+        """Load every *.json problem file in a directory"""
+        with os.scandir(data_path) as entries:
+            paths = sorted(
+                entry.path for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+        return self.load_files(paths)
+
+    def load_files(self, paths: List[str]) -> ProblemLoadResult:
+        """Load the given problem files, collecting per-file errors"""
+        result = ProblemLoadResult()
+        if not paths:
+            return result
+
+        parallel = len(paths) >= self.parallel_threshold
+
+        # Stage 1: read + parse
+        if parallel and self.max_threads > 1:
+            with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+                parsed = list(executor.map(_read_problem_file, paths))
+        else:
+            parsed = [_read_problem_file(path) for path in paths]
+
+        valid: List[Tuple[str, Dict[str, Any]]] = []
+        for path, problem_data, error in parsed:
+            if error is not None:
+                result.errors.append(ProblemLoadError(path=path, error=error))
+            else:
+                valid.append((path, problem_data))
+
+        # Stage 2: validate in chunks
+        chunks = [
+            valid[i:i + self.chunk_size]
+            for i in range(0, len(valid), self.chunk_size)
+        ]
+        validated: List[Tuple[str, Optional[Any], Optional[str]]] = []
+        if parallel and self.max_processes > 1 and len(chunks) > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(self.max_processes, len(chunks))
+                ) as executor:
+                    for chunk_result in executor.map(_validate_chunk, chunks):
+                        validated.extend(chunk_result)
+            except Exception as e:
+                logger.warning(
+                    f"Process pool validation failed ({e}), validating in-process")
+                validated = []
+                for chunk in chunks:
+                    validated.extend(_validate_chunk(chunk))
+        else:
+            for chunk in chunks:
+                validated.extend(_validate_chunk(chunk))
+
+        for path, problem, error in validated:
+            if error is not None:
+                result.errors.append(ProblemLoadError(path=path, error=error))
+            else:
+                result.problems.append(problem)
+
+        for load_error in result.errors:
+            logger.warning(
+                f"Skipping problem file {load_error.path}: {load_error.error}")
+
+        return result
@@ -0,0 +1,352 @@
+"""
+MongoDB Problem Source for AI-Based Mock Interview Platform
+
+Streams problems from the DSA_Problems.Leetcode collection (the one behind
+the problem sheets API) into interview Problem records. Documents are read
+in batches with a projection and kept in a local cache file; later loads only
+fetch documents past the cached _id / updated_at watermarks.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import logging
+import os
+import pickle
+import re
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bump whenever the cached payload layout or the document mapping changes
+MONGO_CACHE_SCHEMA_VERSION = 1
+
+LEETCODE_PROJECTION = {
+    "name": 1,
+    "link": 1,
+    "difficulty": 1,
+    "main_tag": 1,
+    "other_tags": 1,
+    "companies": 1,
+    "problem_number": 1,
+    "created_at": 1,
+    "updated_at": 1
+}
+
+# Normalized LeetCode topic names that do not match a category value directly
+TAG_CATEGORY_ALIASES = {
+    "arrays": "array",
+    "strings": "string",
+    "matrix": "array",
+    "prefix_sum": "array",
+    "sorting": "array",
+    "simulation": "array",
+    "linked_lists": "linked_list",
+    "monotonic_stack": "stack",
+    "monotonic_queue": "queue",
+    "binary_tree": "tree",
+    "binary_search_tree": "tree",
+    "trees": "tree",
+    "segment_tree": "tree",
+    "binary_indexed_tree": "tree",
+    "graphs": "graph",
+    "depth_first_search": "graph",
+    "breadth_first_search": "graph",
+    "dfs": "graph",
+    "bfs": "graph",
+    "union_find": "graph",
+    "topological_sort": "graph",
+    "shortest_path": "graph",
+    "dp": "dynamic_programming",
+    "memoization": "dynamic_programming",
+    "hashing": "hash_table",
+    "hash_map": "hash_table",
+    "hashmap": "hash_table",
+    "heap_priority_queue": "heap",
+    "priority_queue": "heap",
+    "recursion": "backtracking",
+    "bit_manipulation": "bit_manipulation",
+    "bitmask": "bit_manipulation",
+    "number_theory": "math",
+    "geometry": "math",
+    "combinatorics": "math",
+    "two_pointer": "two_pointers",
+}
+
+COMPANY_ALIASES = {
+    "meta": "facebook",
+    "x": "twitter",
+}
+
+
+@dataclass
+class MongoCachePayload:
+    """On-disk cache of converted documents and refresh watermarks"""
+    schema_version: int
+    source: Tuple[str, str]
+    # Mongo _id (as string) -> Problem
+    problems: Dict[str, Any] = field(default_factory=dict)
+    last_id: Optional[Any] = None
+    last_updated_at: Optional[datetime] = None
+
+
+def normalize_tag(tag: str) -> str:
+    """'Heap (Priority Queue)' -> 'heap_priority_queue'"""
+    return re.sub(r"[^a-z0-9]+", "_", tag.lower()).strip("_")
+
+
+def map_category(tag: Optional[str]) -> Optional[Any]:
+    """Map a LeetCode topic name to a ProblemCategory, if it has one"""
+    from .problem_database import ProblemCategory
+
+    if not tag:
+        return None
+    value = normalize_tag(tag)
+    value = TAG_CATEGORY_ALIASES.get(value, value)
+    try:
+        return ProblemCategory(value)
+    except ValueError:
+        return None
+
+
+def map_difficulty(difficulty: Optional[str]) -> Any:
+    """'Easy' / 'Medium' / 'Hard' -> ProblemDifficulty (medium if unknown)"""
+    from .problem_database import ProblemDifficulty
+
+    try:
+        return ProblemDifficulty((difficulty or "").strip().lower())
+    except ValueError:
+        return ProblemDifficulty.MEDIUM
+
+
+def map_companies(companies: Optional[List[str]]) -> List[Any]:
+    """Keep only companies that have a CompanyTag"""
+    from .problem_database import CompanyTag
+
+    tags = []
+    for company in companies or []:
+        value = normalize_tag(company)
+        value = COMPANY_ALIASES.get(value, value)
+        try:
+            tag = CompanyTag(value)
+        except ValueError:
+            continue
+        if tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def _slug_from_document(document: Dict[str, Any]) -> str:
+    """Problem slug from the LeetCode link, falling back to the name"""
+    link = document.get("link") or ""
+    match = re.search(r"/problems/([^/?#]+)", link)
+    if match:
+        return match.group(1)
+    return normalize_tag(document.get("name") or str(document["_id"])).replace("_", "-")
+
+
+def _timestamp(value: Any) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value) if value is not None else None
+
+
+def document_to_problem(document: Dict[str, Any]) -> Any:
+    """Convert a DSA_Problems.Leetcode document into a Problem"""
+    from .problem_database import Problem, ProblemCategory
+
+    main_tag = document.get("main_tag")
+    other_tags = [tag for tag in document.get("other_tags") or [] if tag]
+    tags = ([main_tag] if main_tag else []) + other_tags
+
+    categories = []
+    for tag in tags:
+        category = map_category(tag)
+        if category is not None and category not in categories:
+            categories.append(category)
+    category = categories[0] if categories else ProblemCategory.ARRAY
+
+    slug = _slug_from_document(document)
+    name = document.get("name") or slug
+    problem_number = document.get("problem_number")
+    description = name + (f". Topics: {', '.join(tags)}." if tags else ".")
+
+    return Problem(
+        id=slug,
+        title=name,
+        slug=slug,
+        difficulty=map_difficulty(document.get("difficulty")),
+        category=category,
+        subcategories=categories[1:],
+        description=description,
+        leetcode_id=problem_number if isinstance(problem_number, int) else None,
+        leetcode_url=document.get("link"),
+        company_tags=map_companies(document.get("companies")),
+        tags=[normalize_tag(tag) for tag in tags],
+        created_at=_timestamp(document.get("created_at")),
+        updated_at=_timestamp(document.get("updated_at"))
+    )
+
+
+class MongoProblemSource:
+    """
+    Loads problems from MongoDB with a local cache and incremental refresh
+    """
+
+    def __init__(
+        self,
+        connection_url: Optional[str] = None,
+        database_name: str = "DSA_Problems",
+        collection_name: str = "Leetcode",
+        cache_path: Optional[Path] = None,
+        batch_size: int = 500,
+        server_timeout_ms: int = 5000
+    ):
+        self.connection_url = connection_url or os.getenv("MONGODB_URL")
+        self.database_name = database_name
+        self.collection_name = collection_name
+        self.cache_path = cache_path
+        self.batch_size = max(1, batch_size)
+        self.server_timeout_ms = server_timeout_ms
+        self._payload: Optional[MongoCachePayload] = None
+
+    def _empty_payload(self) -> MongoCachePayload:
+        return MongoCachePayload(
+            schema_version=MONGO_CACHE_SCHEMA_VERSION,
+            source=(self.database_name, self.collection_name)
+        )
+
+    def _read_cache(self) -> MongoCachePayload:
+        """Cached documents, or an empty payload if there is no usable cache"""
+        if self.cache_path is None:
+            return self._empty_payload()
+        try:
+            with open(self.cache_path, "rb") as f:
+                payload = pickle.loads(f.read())
+        except FileNotFoundError:
+            return self._empty_payload()
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Mongo problem cache {self.cache_path}: {e}")
+            return self._empty_payload()
+
+        if (
+            not isinstance(payload, MongoCachePayload)
+            or payload.schema_version != MONGO_CACHE_SCHEMA_VERSION
+            or payload.source != (self.database_name, self.collection_name)
+        ):
+            return self._empty_payload()
+        return payload
+
+    def _write_cache(self, payload: MongoCachePayload) -> None:
+        """Atomically replace the cache file"""
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.cache_path.parent, prefix=".mongo-cache-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, self.cache_path)
+        except Exception:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def _watermark_query(self, payload: MongoCachePayload) -> Dict[str, Any]:
+        """Documents inserted or updated since the last fetch"""
+        clauses: List[Dict[str, Any]] = []
+        if payload.last_id is not None:
+            clauses.append({"_id": {"$gt": payload.last_id}})
+        if payload.last_updated_at is not None:
+            clauses.append({"updated_at": {"$gt": payload.last_updated_at}})
+        if not clauses:
+            return {}
+        return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+    @contextmanager
+    def _collection(self) -> Iterator[Any]:
+        """The Leetcode collection on a short-lived client"""
+        from pymongo import MongoClient
+
+        if not self.connection_url:
+            raise ValueError("MONGODB_URL environment variable is required")
+
+        client = MongoClient(
+            self.connection_url, serverSelectionTimeoutMS=self.server_timeout_ms)
+        try:
+            yield client[self.database_name][self.collection_name]
+        finally:
+            client.close()
+
+    def _fetch(self, payload: MongoCachePayload) -> List[Any]:
+        """Stream changed documents into the payload, returning new problems"""
+        from pymongo import ASCENDING
+
+        with self._collection() as collection:
+            cursor = collection.find(
+                self._watermark_query(payload),
+                LEETCODE_PROJECTION,
+                batch_size=self.batch_size
+            ).sort("_id", ASCENDING)
+
+            changed = []
+            skipped = 0
+            for document in cursor:
+                document_id = document["_id"]
+                if payload.last_id is None or document_id > payload.last_id:
+                    payload.last_id = document_id
+                updated_at = document.get("updated_at")
+                if isinstance(updated_at, datetime) and (
+                    payload.last_updated_at is None or updated_at > payload.last_updated_at
+                ):
+                    payload.last_updated_at = updated_at
+
+                try:
+                    problem = document_to_problem(document)
+                except Exception as e:
+                    skipped += 1
+                    logger.warning(f"Skipping Leetcode document {document_id}: {e}")
+                    continue
+                payload.problems[str(document_id)] = problem
+                changed.append(problem)
+
+        logger.info(
+            f"Fetched {len(changed)} changed problems from "
+            f"{self.database_name}.{self.collection_name}"
+            + (f" ({skipped} skipped)" if skipped else ""))
+        return changed
+
+    def load(self, refresh: bool = True) -> List[Any]:
+        """
+        Return every known problem
+
+        The cache is read first; with refresh=True only documents past its
+        watermarks are fetched. If MongoDB is unreachable the cached
+        problems are returned as they are.
+        """
+        payload = self._read_cache()
+        if refresh:
+            try:
+                if self._fetch(payload):
+                    self._write_cache(payload)
+            except Exception as e:
+                logger.warning(f"Could not refresh problems from MongoDB, using cache: {e}")
+        self._payload = payload
+        return list(payload.problems.values())
+
+    def refresh(self) -> List[Any]:
+        """Fetch only documents changed since the last load or refresh"""
+        if self._payload is None:
+            self._payload = self._read_cache()
+        changed = self._fetch(self._payload)
+        if changed:
+            self._write_cache(self._payload)
+        return changed
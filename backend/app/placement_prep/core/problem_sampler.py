@@ -0,0 +1,173 @@
+"""
+Weighted Problem Sampler for AI-Based Mock Interview Platform
+
+Draws problems at random instead of always handing out the top search
+result. A draw first picks a difficulty from the configured distribution,
+then a problem within that difficulty and the requested categories,
+weighted by frequency. Both steps use Walker/Vose alias tables, so a draw is
+O(1) once the table for a filter shape has been built; tables are cached per
+shape. Excluded problems are handled by rejection sampling.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import logging
+import random
+import threading
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# (difficulty id, category ids or None for every category)
+FilterShape = Tuple[int, Optional[FrozenSet[int]]]
+
+
+class AliasTable:
+    """
+    Vose alias table for O(1) draws from a fixed discrete distribution
+    """
+
+    __slots__ = ("items", "probability", "alias", "total_weight")
+
+    def __init__(self, items: Sequence[int], weights: Sequence[float]):
+        weights_array = np.asarray(weights, dtype=np.float64)
+        n = len(weights_array)
+        self.items: List[int] = list(items)
+        self.total_weight = float(weights_array.sum())
+        if n == 0 or self.total_weight <= 0:
+            self.probability: List[float] = []
+            self.alias: List[int] = []
+            return
+
+        scaled = weights_array * (n / self.total_weight)
+        probability = np.ones(n, dtype=np.float64)
+        alias = np.arange(n, dtype=np.int64)
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            probability[low] = scaled[low]
+            alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+
+        # Python lists make scalar indexing in draw() much cheaper
+        self.probability = probability.tolist()
+        self.alias = alias.tolist()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def draw(self, rng: random.Random) -> int:
+        """Return one item, proportional to its weight"""
+        column = int(rng.random() * len(self.probability))
+        if rng.random() < self.probability[column]:
+            return self.items[column]
+        return self.items[self.alias[column]]
+
+
+class ProblemSampler:
+    """
+    Frequency-weighted problem draws for one catalog version
+
+    Built from the catalog's feature columns and category index; it never
+    changes after construction apart from its cache of per-shape tables.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        frequency: np.ndarray,
+        difficulty_id: np.ndarray,
+        category_rows: Dict[int, np.ndarray],
+        frequency_floor: float = 0.05,
+        max_rejections: int = 32
+    ):
+        self.ids = ids
+        self.difficulty_id = difficulty_id
+        self.category_rows = category_rows
+        # Problems without frequency data stay reachable
+        self.weights = np.maximum(frequency, frequency_floor)
+        self.max_rejections = max_rejections
+        self._tables: Dict[Tuple[FilterShape, bool], AliasTable] = {}
+        self._difficulty_tables: Dict[Tuple[Tuple[int, float], ...], AliasTable] = {}
+        self._lock = threading.Lock()
+
+    def _shape_rows(self, shape: FilterShape) -> np.ndarray:
+        """Rows matching a filter shape, in row order"""
+        difficulty, categories = shape
+        mask = self.difficulty_id == difficulty
+        if categories is not None:
+            category_mask = np.zeros(len(self.ids), dtype=bool)
+            for category in categories:
+                rows = self.category_rows.get(category)
+                if rows is not None:
+                    category_mask[rows] = True
+            mask &= category_mask
+        return np.flatnonzero(mask)
+
+    def table(self, shape: FilterShape, weighted: bool = True) -> AliasTable:
+        """Alias table for a filter shape, built on first use"""
+        key = (shape, weighted)
+        table = self._tables.get(key)
+        if table is None:
+            rows = self._shape_rows(shape)
+            weights = self.weights[rows] if weighted else np.ones(len(rows))
+            table = AliasTable(rows.tolist(), weights)
+            with self._lock:
+                table = self._tables.setdefault(key, table)
+        return table
+
+    def sample(
+        self,
+        rng: random.Random,
+        difficulty_weights: Dict[int, float],
+        categories: Optional[FrozenSet[int]] = None,
+        is_excluded: Optional[Callable[[str], bool]] = None,
+        weighted: bool = True
+    ) -> Optional[str]:
+        """
+        Draw one problem id
+
+        difficulty_weights maps difficulty ids to their share of draws;
+        difficulties without matching problems are dropped and the rest
+        renormalized. Returns None when every candidate is excluded.
+        """
+        tables = {
+            difficulty: self.table((difficulty, categories), weighted)
+            for difficulty, weight in difficulty_weights.items() if weight > 0
+        }
+        tables = {d: t for d, t in tables.items() if len(t) > 0}
+        if not tables:
+            return None
+
+        difficulty_key = tuple((d, difficulty_weights[d]) for d in sorted(tables))
+        difficulty_table = self._difficulty_tables.get(difficulty_key)
+        if difficulty_table is None:
+            difficulty_table = AliasTable(
+                [d for d, _ in difficulty_key], [w for _, w in difficulty_key])
+            self._difficulty_tables[difficulty_key] = difficulty_table
+
+        for _ in range(self.max_rejections):
+            difficulty = difficulty_table.draw(rng)
+            problem_id = self.ids[tables[difficulty].draw(rng)]
+            if is_excluded is None or not is_excluded(problem_id):
+                return problem_id
+
+        # Mostly-excluded shapes: fall back to the remaining candidates
+        remaining: List[Tuple[int, float]] = []
+        for difficulty, table in tables.items():
+            share = difficulty_weights[difficulty] / table.total_weight
+            for row in table.items:
+                if not is_excluded(self.ids[row]):
+                    weight = self.weights[row] if weighted else 1.0
+                    remaining.append((row, share * weight))
+        if not remaining:
+            return None
+        rows, weights = zip(*remaining)
+        return self.ids[AliasTable(rows, weights).draw(rng)]
@@ -0,0 +1,207 @@
+"""
+Problem Snapshot Cache for AI-Based Mock Interview Platform
+
+Stores the validated problem corpus as a single binary snapshot so process
+start does not have to re-parse and re-validate every JSON file. The snapshot
+is keyed on the source directory's file stats and content hashes and is only
+rebuilt when the sources change.
+
+The snapshot itself only holds the compact index records; full problem bodies
+live in a sibling blob file that is memory-mapped by ProblemBodyStore.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import gc
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .problem_store import BodyOffsets, ProblemBodyStore, write_body_file
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bump whenever the pickled payload layout or the Problem model changes shape
+SNAPSHOT_SCHEMA_VERSION = 2
+
+SNAPSHOT_FILENAME = ".problems.snapshot"
+BODY_FILE_SUFFIX = ".bodies"
+
+# (file name, size, mtime_ns) for every source file
+StatFingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+@dataclass
+class SnapshotPayload:
+    """On-disk snapshot contents"""
+    schema_version: int
+    stat_fingerprint: StatFingerprint
+    content_hash: str
+    records: Dict[str, Any] = field(default_factory=dict)
+    body_offsets: BodyOffsets = field(default_factory=dict)
+    body_size: int = 0
+
+
+class ProblemSnapshot:
+    """
+    Reads and writes the compiled problem snapshot for a data directory
+    """
+
+    def __init__(self, data_path: Path, snapshot_path: Optional[Path] = None):
+        self.data_path = data_path
+        self.snapshot_path = snapshot_path or data_path / SNAPSHOT_FILENAME
+        self.body_path = self.snapshot_path.with_name(
+            self.snapshot_path.name + BODY_FILE_SUFFIX)
+
+    def _stat_fingerprint(self) -> StatFingerprint:
+        """Cheap fingerprint of the JSON sources built from one directory scan"""
+        fingerprint = []
+        with os.scandir(self.data_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    fingerprint.append(
+                        (entry.name, stat.st_size, stat.st_mtime_ns))
+        fingerprint.sort()
+        return tuple(fingerprint)
+
+    def _content_hash(self, fingerprint: StatFingerprint) -> str:
+        """Hash of every source file's name and bytes"""
+        digest = hashlib.sha256()
+        for name, _, _ in fingerprint:
+            digest.update(name.encode("utf-8"))
+            digest.update(b"\0")
+            with open(os.path.join(self.data_path, name), "rb") as f:
+                digest.update(f.read())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _read_payload(self) -> Optional[SnapshotPayload]:
+        """Read the snapshot file in a single pass, or None if unusable"""
+        # Unpickling allocates thousands of container objects; pausing the
+        # cyclic collector avoids repeated full scans while they are created
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                payload = pickle.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(
+                f"Ignoring unreadable problem snapshot {self.snapshot_path}: {e}")
+            return None
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        if not isinstance(payload, SnapshotPayload):
+            return None
+        if payload.schema_version != SNAPSHOT_SCHEMA_VERSION:
+            logger.info(
+                f"Problem snapshot schema {payload.schema_version} is outdated "
+                f"(expected {SNAPSHOT_SCHEMA_VERSION})")
+            return None
+        return payload
+
+    def _write_payload(self, payload: SnapshotPayload) -> None:
+        """Atomically replace the snapshot file"""
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.snapshot_path.parent, prefix=".snapshot-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, self.snapshot_path)
+        except Exception:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def _open_bodies(
+        self,
+        payload: SnapshotPayload,
+        max_cached: int
+    ) -> Optional[ProblemBodyStore]:
+        """Map the body file if it belongs to this snapshot"""
+        try:
+            if os.stat(self.body_path).st_size != payload.body_size:
+                logger.info("Problem body file does not match snapshot")
+                return None
+            return ProblemBodyStore.open_file(
+                self.body_path, payload.body_offsets, max_cached)
+        except OSError as e:
+            logger.warning(f"Could not open problem body file: {e}")
+            return None
+
+    def load(
+        self,
+        max_cached: int = 256
+    ) -> Optional[Tuple[Dict[str, Any], ProblemBodyStore]]:
+        """
+        Return the cached index records and body store if the snapshot
+        matches the sources
+
+        Stats are compared first; only when they differ are the sources
+        hashed, so a touched-but-unchanged directory keeps its snapshot.
+        """
+        payload = self._read_payload()
+        if payload is None:
+            return None
+
+        stat_fingerprint = self._stat_fingerprint()
+        if payload.stat_fingerprint != stat_fingerprint:
+            if payload.content_hash != self._content_hash(stat_fingerprint):
+                logger.info("Problem sources changed, snapshot is stale")
+                return None
+
+            # Contents are identical, refresh the stats so the next start is fast
+            payload.stat_fingerprint = stat_fingerprint
+            try:
+                self._write_payload(payload)
+            except Exception as e:
+                logger.warning(f"Could not refresh problem snapshot: {e}")
+
+        body_store = self._open_bodies(payload, max_cached)
+        if body_store is None:
+            return None
+        return payload.records, body_store
+
+    def save(
+        self,
+        records: Dict[str, Any],
+        problems: List[Any],
+        max_cached: int = 256
+    ) -> Optional[ProblemBodyStore]:
+        """
+        Write bodies and a new snapshot for the current state of the sources
+
+        Returns a body store mapped onto the freshly written file.
+        """
+        try:
+            stat_fingerprint = self._stat_fingerprint()
+            body_offsets, body_size = write_body_file(self.body_path, problems)
+            payload = SnapshotPayload(
+                schema_version=SNAPSHOT_SCHEMA_VERSION,
+                stat_fingerprint=stat_fingerprint,
+                content_hash=self._content_hash(stat_fingerprint),
+                records=records,
+                body_offsets=body_offsets,
+                body_size=body_size
+            )
+            self._write_payload(payload)
+            logger.info(
+                f"Wrote problem snapshot with {len(records)} problems to {self.snapshot_path}")
+            return ProblemBodyStore.open_file(
+                self.body_path, body_offsets, max_cached)
+        except Exception as e:
+            logger.warning(f"Could not write problem snapshot: {e}")
+            return None
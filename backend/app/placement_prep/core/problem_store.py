@@ -0,0 +1,177 @@
+"""
+Problem Body Store for AI-Based Mock Interview Platform
+
+Keeps the heavy part of each problem (description, examples, constraints,
+test cases, hints, approaches) out of the resident index. Bodies are pickled
+into one blob file that is memory-mapped and decoded on demand through a
+bounded LRU, so resident memory stays flat as the catalog grows.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import logging
+import mmap
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# problem_id -> (offset, length) inside the blob buffer
+BodyOffsets = Dict[str, Tuple[int, int]]
+
+
+def write_body_file(path: Path, problems: Iterable[Any]) -> Tuple[BodyOffsets, int]:
+    """
+    Atomically write pickled problem bodies to a blob file
+
+    Returns the offsets table and the total file size.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    offsets: BodyOffsets = {}
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=".bodies-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            position = 0
+            for problem in problems:
+                blob = pickle.dumps(problem, protocol=pickle.HIGHEST_PROTOCOL)
+                f.write(blob)
+                offsets[problem.id] = (position, len(blob))
+                position += len(blob)
+        os.replace(tmp_name, path)
+    except Exception:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return offsets, position
+
+
+class ProblemBodyStore:
+    """
+    Read-mostly store of full problem records with a bounded decode cache
+    """
+
+    def __init__(
+        self,
+        buffer: Union[bytes, mmap.mmap],
+        offsets: BodyOffsets,
+        max_cached: int = 256
+    ):
+        self._buffer = buffer
+        self._offsets = offsets
+        # Problems added or updated at runtime, kept as pickled bytes
+        self._overlay: Dict[str, bytes] = {}
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_cached = max(1, max_cached)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def open_file(
+        cls,
+        path: Path,
+        offsets: BodyOffsets,
+        max_cached: int = 256
+    ) -> "ProblemBodyStore":
+        """Memory-map an existing blob file"""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                buffer: Union[bytes, mmap.mmap] = b""
+            else:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, offsets, max_cached)
+
+    @classmethod
+    def from_problems(
+        cls,
+        problems: Iterable[Any],
+        max_cached: int = 256
+    ) -> "ProblemBodyStore":
+        """Build an in-memory store when there is no file to map"""
+        offsets: BodyOffsets = {}
+        chunks = []
+        position = 0
+        for problem in problems:
+            blob = pickle.dumps(problem, protocol=pickle.HIGHEST_PROTOCOL)
+            chunks.append(blob)
+            offsets[problem.id] = (position, len(blob))
+            position += len(blob)
+        return cls(b"".join(chunks), offsets, max_cached)
+
+    def __contains__(self, problem_id: str) -> bool:
+        return problem_id in self._overlay or problem_id in self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets.keys() | self._overlay.keys())
+
+    def _read_blob(self, problem_id: str) -> Optional[bytes]:
+        """Raw pickled bytes for a problem, overlay first"""
+        blob = self._overlay.get(problem_id)
+        if blob is not None:
+            return blob
+        location = self._offsets.get(problem_id)
+        if location is None:
+            return None
+        offset, length = location
+        return self._buffer[offset:offset + length]
+
+    def get(self, problem_id: str, use_cache: bool = True) -> Optional[Any]:
+        """Return the full problem, decoding it on a cache miss"""
+        with self._lock:
+            problem = self._cache.get(problem_id)
+            if problem is not None:
+                self._cache.move_to_end(problem_id)
+                self.hits += 1
+                return problem
+
+        blob = self._read_blob(problem_id)
+        if blob is None:
+            return None
+        problem = pickle.loads(blob)
+
+        with self._lock:
+            self.misses += 1
+            if use_cache:
+                self._cache[problem_id] = problem
+                self._cache.move_to_end(problem_id)
+                while len(self._cache) > self.max_cached:
+                    self._cache.popitem(last=False)
+        return problem
+
+    def with_problems(self, problems: Iterable[Any]) -> "ProblemBodyStore":
+        """
+        Return a new store sharing this buffer with problems added or replaced
+
+        The original store is left untouched so readers of an older catalog
+        keep a consistent view.
+        """
+        store = ProblemBodyStore(self._buffer, self._offsets, self.max_cached)
+        store._overlay = dict(self._overlay)
+        for problem in problems:
+            store._overlay[problem.id] = pickle.dumps(
+                problem, protocol=pickle.HIGHEST_PROTOCOL)
+        return store
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache and storage statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "stored_problems": len(self),
+                "cached_problems": len(self._cache),
+                "max_cached": self.max_cached,
+                "overlay_problems": len(self._overlay),
+                "memory_mapped": isinstance(self._buffer, mmap.mmap),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
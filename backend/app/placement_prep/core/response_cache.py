@@ -0,0 +1,356 @@
+"""
+Response Cache for AI-Based Mock Interview Platform
+
+Caches interviewer responses that do not depend on the candidate, such as
+problem introductions and first-level hints. Entries are keyed by (prompt
+template version, response type, problem id, normalized context), so a
+prompt change or an edited problem statement never serves a stale answer.
+
+Two tiers:
+- an in-memory LRU bounded by max_entries
+- an optional SQLite file, so entries survive restarts and are shared by
+  the workers of one host
+
+Each response type has its own TTL; a TTL of 0 disables caching for that
+type. Concurrent misses on one key wait for a single generation instead of
+each calling the LLM.
+
+Variety is opt-in: with variants > 1 the cache keeps up to that many
+responses per key, each generated at a jittered temperature, and serves one
+of them at random once they are all filled.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Generates a response payload; receives the temperature to use, or None
+# for the generator's configured temperature
+GenerateFn = Callable[[Optional[float]], Awaitable[Optional[Dict[str, Any]]]]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_context(context: str) -> str:
+    """Collapse whitespace so formatting differences share a cache entry"""
+    return _WHITESPACE.sub(" ", context).strip()
+
+
+class ResponseCacheConfig(BaseModel):
+    """Configuration for the response cache"""
+    max_entries: int = Field(default=2048, ge=1)
+    # Seconds an entry lives, per response type; types not listed are not cached
+    ttl_seconds: Dict[str, float] = Field(default_factory=lambda: {
+        "problem_introduction": 7 * 86400.0,
+        "hint_provision": 86400.0
+    })
+    sqlite_path: Optional[str] = None
+    # Distinct responses kept per key; above 1, each is generated at
+    # base_temperature +/- temperature_jitter
+    variants: int = Field(default=1, ge=1)
+    temperature_jitter: float = Field(default=0.3, ge=0.0)
+    base_temperature: float = Field(default=0.6, ge=0.0)
+
+
+@dataclass
+class _CacheEntry:
+    response_type: str
+    expires_at: float
+    variants: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class _TypeStats:
+    memory_hits: int = 0
+    sqlite_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.sqlite_hits + self.coalesced
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "sqlite_hits": self.sqlite_hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class SQLiteResponseTier:
+    """
+    Persistent tier: one row per key in a SQLite file
+
+    sqlite3 is blocking, so callers run these methods in a worker thread;
+    a lock serializes them on the shared connection.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                " key TEXT PRIMARY KEY,"
+                " response_type TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " variants TEXT NOT NULL)")
+            self._connection.commit()
+
+    def get(self, key: str) -> Optional[_CacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response_type, expires_at, variants FROM response_cache WHERE key = ?",
+                (key,)).fetchone()
+        if row is None or row[1] <= time.time():
+            return None
+        return _CacheEntry(response_type=row[0], expires_at=row[1], variants=json.loads(row[2]))
+
+    def put(self, key: str, entry: _CacheEntry) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO response_cache (key, response_type, expires_at, variants)"
+                " VALUES (?, ?, ?, ?)",
+                (key, entry.response_type, entry.expires_at, json.dumps(entry.variants)))
+            self._connection.commit()
+
+    def prune(self) -> int:
+        """Delete expired rows; returns how many"""
+        with self._lock:
+            deleted = self._connection.execute(
+                "DELETE FROM response_cache WHERE expires_at <= ?", (time.time(),)).rowcount
+            self._connection.commit()
+        return deleted
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class ResponseCache:
+    """
+    Two-tier cache of generated responses
+    """
+
+    def __init__(self, config: Optional[ResponseCacheConfig] = None,
+                 persistent: Optional[SQLiteResponseTier] = None):
+        self.config = config or ResponseCacheConfig()
+        self.persistent = persistent
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+
+        # Metrics
+        self._type_stats: Dict[str, _TypeStats] = {}
+        self.stores = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.errors = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def make_key(self, prompt_version: str, response_type: str,
+                 problem_id: Any, context: str) -> str:
+        """Cache key for one prompt; context is normalized first"""
+        parts = (str(prompt_version), response_type, str(problem_id), normalize_context(context))
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def is_cacheable(self, response_type: str) -> bool:
+        return self.config.ttl_seconds.get(response_type, 0) > 0
+
+    def _stats(self, response_type: str) -> _TypeStats:
+        return self._type_stats.setdefault(response_type, _TypeStats())
+
+    def _remember(self, key: str, entry: _CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def _load(self, key: str) -> Tuple[Optional[_CacheEntry], bool]:
+        """Entry for key and whether it came from the persistent tier"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.time():
+                self._entries.move_to_end(key)
+                return entry, False
+            del self._entries[key]
+            self.expirations += 1
+
+        if self.persistent is None:
+            return None, False
+        try:
+            entry = await asyncio.to_thread(self.persistent.get, key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Response cache read failed: {str(e)}")
+            return None, False
+        if entry is not None:
+            self._remember(key, entry)
+        return entry, entry is not None
+
+    async def _store(self, key: str, response_type: str, payload: Dict[str, Any],
+                     entry: Optional[_CacheEntry]) -> None:
+        if entry is None:
+            entry = _CacheEntry(
+                response_type=response_type,
+                expires_at=time.time() + self.config.ttl_seconds[response_type])
+        entry.variants.append(payload)
+        self._remember(key, entry)
+        self.stores += 1
+
+        if self.persistent is not None:
+            try:
+                await asyncio.to_thread(self.persistent.put, key, entry)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Response cache write failed: {str(e)}")
+
+    def _temperature(self, filled: int) -> Optional[float]:
+        """Temperature for the next variant; the first keeps the configured one"""
+        if self.config.variants <= 1 or filled == 0:
+            return None
+        jitter = random.uniform(-self.config.temperature_jitter, self.config.temperature_jitter)
+        return round(min(2.0, max(0.0, self.config.base_temperature + jitter)), 3)
+
+    async def get_or_generate(self, key: str, response_type: str,
+                              generate: GenerateFn) -> Optional[Dict[str, Any]]:
+        """
+        Cached payload for key, or the result of generate (stored if not None)
+
+        generate returns None for responses that must not be cached, such
+        as error fallbacks; that result is passed through as None.
+        """
+        stats = self._stats(response_type)
+        entry, from_persistent = await self._load(key)
+        if entry is not None and len(entry.variants) >= self.config.variants:
+            if from_persistent:
+                stats.sqlite_hits += 1
+            else:
+                stats.memory_hits += 1
+            return random.choice(entry.variants)
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            # Another request is already generating this response
+            stats.coalesced += 1
+            return await asyncio.shield(pending)
+
+        stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            payload = await generate(self._temperature(len(entry.variants) if entry else 0))
+            if payload is not None:
+                await self._store(key, response_type, payload, entry)
+            future.set_result(payload)
+            return payload
+        except BaseException:
+            # Waiters get None and generate on their own
+            if not future.done():
+                future.set_result(None)
+            raise
+        finally:
+            del self._pending[key]
+
+    async def prune(self) -> int:
+        """Drop expired entries from both tiers"""
+        now = time.time()
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        self.expirations += len(expired)
+        if self.persistent is not None:
+            expired_rows = await asyncio.to_thread(self.persistent.prune)
+            return len(expired) + expired_rows
+        return len(expired)
+
+    async def close(self) -> None:
+        if self.persistent is not None:
+            await asyncio.to_thread(self.persistent.close)
+            self.persistent = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        totals = _TypeStats()
+        for stats in self._type_stats.values():
+            totals.memory_hits += stats.memory_hits
+            totals.sqlite_hits += stats.sqlite_hits
+            totals.misses += stats.misses
+            totals.coalesced += stats.coalesced
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.config.max_entries,
+            "persistent": self.persistent.path if self.persistent else None,
+            "variants": self.config.variants,
+            **totals.as_dict(),
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "errors": self.errors,
+            "by_type": {name: stats.as_dict() for name, stats in self._type_stats.items()}
+        }
+
+
+def create_response_cache(**kwargs: Any) -> Optional[ResponseCache]:
+    """
+    Factory function to create ResponseCache with environment overrides
+
+    Returns None when INTERVIEW_RESPONSE_CACHE is "off". An empty
+    INTERVIEW_RESPONSE_CACHE_PATH keeps the cache in memory only.
+    """
+    if os.getenv("INTERVIEW_RESPONSE_CACHE", "on").lower() in ("off", "false", "0"):
+        return None
+
+    settings = {
+        "max_entries": int(os.getenv("INTERVIEW_RESPONSE_CACHE_MAX_ENTRIES", "2048")),
+        "ttl_seconds": {
+            "problem_introduction": float(os.getenv(
+                "INTERVIEW_RESPONSE_CACHE_INTRO_TTL_SECONDS", str(7 * 86400))),
+            "hint_provision": float(os.getenv(
+                "INTERVIEW_RESPONSE_CACHE_HINT_TTL_SECONDS", "86400"))
+        },
+        "sqlite_path": os.getenv(
+            "INTERVIEW_RESPONSE_CACHE_PATH", "data/response_cache.sqlite3") or None,
+        "variants": int(os.getenv("INTERVIEW_RESPONSE_CACHE_VARIANTS", "1")),
+        "temperature_jitter": float(os.getenv("INTERVIEW_RESPONSE_CACHE_TEMPERATURE_JITTER", "0.3")),
+        **kwargs
+    }
+    config = ResponseCacheConfig(**settings)
+
+    persistent = None
+    if config.sqlite_path:
+        try:
+            persistent = SQLiteResponseTier(config.sqlite_path)
+        except Exception as e:
+            logger.warning(
+                f"⚠️ Response cache file {config.sqlite_path} unavailable, using memory only: {str(e)}")
+
+    logger.info(
+        f"🗃️ Response cache: {config.max_entries} entries in memory, "
+        f"persistent tier {persistent.path if persistent else 'off'}, {config.variants} variant(s) per key")
+    return ResponseCache(config, persistent)
@@ -1,6 +1,8 @@
 import asyncio
+import json
 import logging
-from typing import Optional, Dict, Any, List, TypedDict, Annotated
+import re
+from typing import Optional, Dict, Any, List, TypedDict, Annotated, Callable
 from enum import Enum
 import os
 
@@ -9,18 +11,31 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from langchain_core.runnables import RunnableConfig
 
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
-from langgraph.checkpoint.memory import MemorySaver
 
 from pydantic import BaseModel, Field
 
 # Import Gemini utility
 from ..utils.gemini_chat import create_response_gemini_chat
+from ..utils.checkpointer import create_checkpointer
+from .response_cache import ResponseCache, create_response_cache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Receives each new piece of response content while it is being generated
+TokenCallback = Callable[[str], None]
+
+# Part of every response cache key; bump when the prompts below change
+PROMPT_TEMPLATE_VERSION = "1"
+
+# Start of the content field in the model's JSON output, and the longest
+# run of complete JSON string characters after it
+_CONTENT_START = re.compile(r'"content"\s*:\s*"')
+_JSON_STRING_BODY = re.compile(r'(?:[^"\\]|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4})*')
+
 
 class ResponseType(str, Enum):
     PROBLEM_INTRODUCTION = "problem_introduction"
@@ -44,6 +59,36 @@ class InterviewState(TypedDict):
     current_response: Optional[InterviewResponse]
 
 
+def _chunk_text(chunk: BaseMessage) -> str:
+    """Text of a streamed message chunk (content may be a list of parts)"""
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        part if isinstance(part, str) else part.get("text", "")
+        for part in content
+        if isinstance(part, str) or part.get("type") == "text"
+    )
+
+
+def _partial_content(text: str) -> Optional[str]:
+    """
+    The content field of a partially generated InterviewResponse JSON
+
+    Reads only the complete characters so far, so each call is linear in
+    the text (a general partial-JSON parser re-parses it many times).
+    """
+    start = _CONTENT_START.search(text)
+    if start is None:
+        return None
+    body = _JSON_STRING_BODY.match(text, start.end()).group()
+    content = json.loads(f'"{body}"')
+    # The low half of a surrogate pair may still be on its way
+    if content and "\ud800" <= content[-1] <= "\udbff":
+        content = content[:-1]
+    return content
+
+
 class ResponseGeneratorConfig(BaseModel):
     # Remove api_key and model_name since LLM will be provided externally
     temperature: float = 0.2
@@ -51,9 +96,11 @@ class ResponseGeneratorConfig(BaseModel):
 
 
 class TechnicalInterviewerResponseGenerator:
-    def __init__(self, llm, config: Optional[ResponseGeneratorConfig] = None):
+    def __init__(self, llm, config: Optional[ResponseGeneratorConfig] = None,
+                 cache: Optional[ResponseCache] = None):
         self.llm = llm
         self.config = config or ResponseGeneratorConfig()
+        self.cache = cache
         self.output_parser = self._setup_output_parser()
         self.graph = self._build_graph()
 
@@ -68,7 +115,28 @@ class TechnicalInterviewerResponseGenerator:
             "encouragement": "You are a supportive technical interviewer. Keep the candidate motivated and guide them through challenges."
         }
 
-    async def _generate_response_node(self, state: InterviewState) -> InterviewState:
+    async def _stream_response(
+        self,
+        llm,
+        prompt_template: ChatPromptTemplate,
+        inputs: Dict[str, Any]
+    ) -> InterviewResponse:
+        """
+        Generate a response with astream, writing the content field to the
+        graph's custom stream as it arrives
+        """
+        writer = get_stream_writer()
+        text = ""
+        sent = ""
+        async for chunk in (prompt_template | llm).astream(inputs):
+            text += _chunk_text(chunk)
+            content = _partial_content(text)
+            if content and len(content) > len(sent) and content.startswith(sent):
+                writer(content[len(sent):])
+                sent = content
+        return self.output_parser.parse(text)
+
+    async def _generate_response_node(self, state: InterviewState, config: RunnableConfig) -> InterviewState:
         try:
             response_type = state.get(
                 "response_type_needed") or ResponseType.ENCOURAGEMENT
@@ -94,13 +162,20 @@ class TechnicalInterviewerResponseGenerator:
                 if isinstance(last_message, HumanMessage):
                     user_message = last_message.content
 
-            chain = prompt_template | self.llm | self.output_parser
-
-            response = await chain.ainvoke({
+            inputs = {
                 "context": context,
                 "user_message": user_message,
                 "format_instructions": self.output_parser.get_format_instructions()
-            })
+            }
+            configurable = config.get("configurable", {})
+            llm = self.llm
+            if configurable.get("temperature") is not None:
+                llm = llm.bind(temperature=configurable["temperature"])
+            if configurable.get("stream_tokens"):
+                response = await self._stream_response(llm, prompt_template, inputs)
+            else:
+                chain = prompt_template | llm | self.output_parser
+                response = await chain.ainvoke(inputs)
 
             state["current_response"] = response
             state["messages"] = state.get(
@@ -131,7 +206,7 @@ class TechnicalInterviewerResponseGenerator:
         workflow.add_edge(START, "generate_response")
         workflow.add_edge("generate_response", END)
 
-        memory = MemorySaver()
+        memory = create_checkpointer("response")
         complied_workflow = workflow.compile(checkpointer=memory)
 
         # # store compiled graph image in current directory
@@ -147,8 +222,15 @@ class TechnicalInterviewerResponseGenerator:
         response_type: ResponseType = ResponseType.ENCOURAGEMENT,
         context: Optional[str] = None,
         problem_data: Optional[Dict[str, Any]] = None,
-        conversation_id: str = "default"
+        conversation_id: str = "default",
+        on_token: Optional[TokenCallback] = None,
+        temperature: Optional[float] = None
     ) -> InterviewResponse:
+        """
+        Generate a response; with on_token the LLM output is streamed and
+        on_token receives the response content piece by piece. temperature
+        overrides the LLM's configured temperature for this call.
+        """
         initial_state: InterviewState = {
             "messages": [HumanMessage(content=user_message)],
             "problem_data": problem_data,
@@ -157,31 +239,136 @@ class TechnicalInterviewerResponseGenerator:
             "current_response": None
         }
 
-        config = RunnableConfig(configurable={"thread_id": conversation_id})
-        result = await self.graph.ainvoke(initial_state, config=config)
+        configurable = {"thread_id": conversation_id, "temperature": temperature}
+        if on_token is None:
+            config = RunnableConfig(configurable=configurable)
+            result = await self.graph.ainvoke(initial_state, config=config)
+            return result["current_response"]
+
+        config = RunnableConfig(configurable={**configurable, "stream_tokens": True})
+        result = None
+        async for mode, chunk in self.graph.astream(
+                initial_state, config=config, stream_mode=["custom", "values"]):
+            if mode == "custom":
+                on_token(chunk)
+            else:
+                result = chunk
         return result["current_response"]
 
-    async def generate_problem_introduction(self, problem_data: Dict[str, Any]) -> InterviewResponse:
-        return await self.generate_response(
+    async def _generate_cached(
+        self,
+        problem_id: Any,
+        cache_context: str,
+        on_token: Optional[TokenCallback] = None,
+        **request: Any
+    ) -> InterviewResponse:
+        """
+        generate_response through the response cache when it applies
+
+        cache_context must hold everything the prompt depends on besides
+        the response type and problem id. Error fallbacks are not cached.
+        """
+        response_type = request["response_type"]
+        if (self.cache is None or problem_id is None
+                or not self.cache.is_cacheable(response_type.value)):
+            return await self.generate_response(on_token=on_token, **request)
+
+        generated: Optional[InterviewResponse] = None
+
+        async def generate(temperature: Optional[float]) -> Optional[Dict[str, Any]]:
+            nonlocal generated
+            generated = await self.generate_response(
+                on_token=on_token, temperature=temperature, **request)
+            if generated.metadata.get("error"):
+                return None
+            return generated.model_dump(mode="json")
+
+        key = self.cache.make_key(
+            PROMPT_TEMPLATE_VERSION, response_type.value, problem_id, cache_context)
+        payload = await self.cache.get_or_generate(key, response_type.value, generate)
+        if generated is not None:
+            return generated
+        if payload is None:
+            # Waited on a generation that failed; try once more uncached
+            return await self.generate_response(on_token=on_token, **request)
+
+        response = InterviewResponse(**payload)
+        if on_token is not None:
+            on_token(response.content)
+        return response
+
+    async def generate_problem_introduction(
+        self,
+        problem_data: Dict[str, Any],
+        conversation_id: str = "default"
+    ) -> InterviewResponse:
+        return await self._generate_cached(
+            problem_id=problem_data.get("id"),
+            cache_context=f"{problem_data.get('title', 'Unknown')}\n{problem_data.get('description', 'N/A')}",
             user_message="Please introduce this DSA problem",
             response_type=ResponseType.PROBLEM_INTRODUCTION,
-            problem_data=problem_data
+            problem_data=problem_data,
+            conversation_id=conversation_id
         )
 
-    async def generate_hint(self, context: str, hint_level: str = "gentle") -> InterviewResponse:
+    async def generate_hint(
+        self,
+        context: str,
+        hint_level: str = "gentle",
+        conversation_id: str = "default",
+        on_token: Optional[TokenCallback] = None,
+        problem_data: Optional[Dict[str, Any]] = None
+    ) -> InterviewResponse:
+        """
+        Generate a hint. A gentle hint for a known problem (problem_data)
+        is the same for every candidate, so with a response cache it is
+        generated from the problem alone rather than from context and
+        shared through the cache.
+        """
+        if hint_level == "gentle" and problem_data and self.cache is not None:
+            problem_context = (
+                f"Current Problem: {problem_data.get('title', 'Unknown')}\n"
+                f"Difficulty: {problem_data.get('difficulty', 'Unknown')}\n"
+                f"Description: {problem_data.get('description', 'N/A')}")
+            return await self._generate_cached(
+                problem_id=problem_data.get("id"),
+                cache_context=f"{hint_level}\n{problem_context}",
+                on_token=on_token,
+                user_message="I need a hint",
+                response_type=ResponseType.HINT_PROVISION,
+                context=f"Context: {problem_context}. Provide a {hint_level} hint.",
+                conversation_id=conversation_id
+            )
+
         return await self.generate_response(
             user_message="I need a hint",
             response_type=ResponseType.HINT_PROVISION,
-            context=f"Context: {context}. Provide a {hint_level} hint."
+            context=f"Context: {context}. Provide a {hint_level} hint.",
+            conversation_id=conversation_id,
+            on_token=on_token
         )
 
-    async def generate_code_review(self, code: str, problem_context: str) -> InterviewResponse:
+    async def generate_code_review(
+        self,
+        code: str,
+        problem_context: str,
+        conversation_id: str = "default",
+        on_token: Optional[TokenCallback] = None
+    ) -> InterviewResponse:
         return await self.generate_response(
             user_message="Please review my code",
             response_type=ResponseType.CODE_REVIEW,
-            context=f"Problem: {problem_context}\nCode:\n{code}"
+            context=f"Problem: {problem_context}\nCode:\n{code}",
+            conversation_id=conversation_id,
+            on_token=on_token
         )
 
+    def release_thread(self, conversation_id: str) -> None:
+        """Drop the checkpointed history of a conversation"""
+        checkpointer = self.graph.checkpointer
+        if checkpointer is not None:
+            checkpointer.delete_thread(conversation_id)
+
 
 def create_response_generator(api_key: Optional[str] = None, **kwargs) -> TechnicalInterviewerResponseGenerator:
     """
@@ -206,8 +393,14 @@ def create_response_generator(api_key: Optional[str] = None, **kwargs) -> Techni
             max_tokens=kwargs.get('max_tokens', 10000)
         )
 
+        # Jittered variants vary around the LLM's own temperature
+        if "response_cache" in kwargs:
+            cache = kwargs["response_cache"]
+        else:
+            cache = create_response_cache(base_temperature=llm.temperature)
+
         logger.info("✅ Response Generator created successfully with Gemini")
-        return TechnicalInterviewerResponseGenerator(llm=llm, config=config)
+        return TechnicalInterviewerResponseGenerator(llm=llm, config=config, cache=cache)
 
     except Exception as e:
         logger.error(f"❌ Failed to create Response Generator: {str(e)}")
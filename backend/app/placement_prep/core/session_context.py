@@ -0,0 +1,116 @@
+"""
+Session Context Store for AI-Based Mock Interview Platform
+
+Holds the per-session working state of an interview agent (conversation
+state, current problem, timestamps) keyed by session_id, so a single agent
+instance can serve many concurrent interviews. The map can be bounded; when
+it is full the least recently used session is evicted. An owner that bounds
+its sessions itself, like MainInterviewOrchestrator, leaves it unbounded.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class AgentSessionContext:
+    """Everything an agent needs to continue one interview"""
+    session_id: str
+    user_id: str
+    conversation_state: Dict[str, Any]
+    current_problem: Optional[Dict[str, Any]] = None
+    # Session id issued by the InterviewStateManager for this interview
+    state_session_id: Optional[str] = None
+    # Problems presented in this interview, in order
+    problem_ids: List[str] = field(default_factory=list)
+    # Background preparation of the next problem, if one is under way
+    next_opening: Optional[asyncio.Task] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    last_activity: datetime = field(default_factory=datetime.now)
+
+    def touch(self) -> None:
+        self.last_activity = datetime.now()
+
+
+class SessionContextStore(Generic[T]):
+    """
+    LRU-ordered map of session_id -> context, bounded unless max_sessions is None
+
+    All operations are O(1) and guarded by a lock so the store can be shared
+    between the event loop and worker threads.
+    """
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = 1000,
+        on_evict: Optional[Callable[[str, T], None]] = None
+    ):
+        self.max_sessions = max(1, max_sessions) if max_sessions is not None else None
+        self.on_evict = on_evict
+        self._contexts: "OrderedDict[str, T]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._contexts)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._contexts
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._contexts))
+
+    def get(self, session_id: str) -> Optional[T]:
+        """Return a context and mark it most recently used"""
+        with self._lock:
+            context = self._contexts.get(session_id)
+            if context is not None:
+                self._contexts.move_to_end(session_id)
+            return context
+
+    def put(self, session_id: str, context: T) -> None:
+        """Store a context, evicting the least recently used one if full"""
+        evicted: List[Tuple[str, T]] = []
+        with self._lock:
+            self._contexts[session_id] = context
+            self._contexts.move_to_end(session_id)
+            while self.max_sessions is not None and len(self._contexts) > self.max_sessions:
+                evicted.append(self._contexts.popitem(last=False))
+                self.evictions += 1
+
+        for evicted_id, evicted_context in evicted:
+            logger.warning(f"Evicted session context {evicted_id} (store full)")
+            if self.on_evict is not None:
+                self.on_evict(evicted_id, evicted_context)
+
+    def pop(self, session_id: str) -> Optional[T]:
+        """Remove and return a context"""
+        with self._lock:
+            return self._contexts.pop(session_id, None)
+
+    def items(self) -> List[Tuple[str, T]]:
+        """Snapshot of (session_id, context), least recently used first"""
+        with self._lock:
+            return list(self._contexts.items())
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": len(self._contexts),
+            "max_sessions": self.max_sessions,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,675 @@
+"""
+Session Store for AI-Based Mock Interview Platform
+
+External storage for interview session state, so that any API worker can
+serve any session. A session is stored as one compact blob (MessagePack,
+zstd-compressed above a size threshold, or zlib where zstandard is not
+installed) together with a version number. Writers pass the version they
+read; a write against a newer version fails with SessionVersionConflict
+instead of silently overwriting another worker's update.
+
+Implementations:
+- InMemorySessionStore: single process; the default and the reference
+  behaviour for the others
+- MongoSessionStore: one document per session, TTL index on updated_at
+- RedisSessionStore: any server speaking the Redis protocol (RESP2), using
+  WATCH/MULTI/EXEC for the version check and key expiry for the TTL
+- FileSessionStore: one file per session in a local directory, for a single
+  host without a database
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+import struct
+import time
+import zlib
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import ormsgpack
+from pydantic import BaseModel
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Blob header: one format byte, then the payload. JSON blobs are no longer
+# written but are still read.
+_FORMAT_JSON = b"j"
+_FORMAT_ZLIB = b"z"
+_FORMAT_MSGPACK = b"m"
+_FORMAT_MSGPACK_ZLIB = b"x"
+_FORMAT_MSGPACK_ZSTD = b"s"
+COMPRESS_THRESHOLD_BYTES = 512
+ZSTD_LEVEL = 3
+
+
+class SessionStoreError(Exception):
+    """Base error for session store failures"""
+
+
+class SessionVersionConflict(SessionStoreError):
+    """The session changed since it was read"""
+
+    def __init__(self, session_id: str, expected_version: int):
+        super().__init__(
+            f"Session {session_id} was modified concurrently (expected version {expected_version})")
+        self.session_id = session_id
+        self.expected_version = expected_version
+
+
+@dataclass
+class StoredSession:
+    """A session blob and the version it was read at"""
+    session_id: str
+    version: int
+    blob: bytes
+
+    def decode(self) -> Dict[str, Any]:
+        return decode_session(self.blob)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def encode_session(payload: Dict[str, Any]) -> bytes:
+    """Serialize a session payload to a compact blob"""
+    raw = ormsgpack.packb(payload, default=_json_default)
+    if len(raw) >= COMPRESS_THRESHOLD_BYTES:
+        if zstandard is not None:
+            header, compressed = _FORMAT_MSGPACK_ZSTD, zstandard.compress(raw, ZSTD_LEVEL)
+        else:
+            header, compressed = _FORMAT_MSGPACK_ZLIB, zlib.compress(raw, 6)
+        if len(compressed) < len(raw):
+            return header + compressed
+    return _FORMAT_MSGPACK + raw
+
+
+def decode_session(blob: bytes) -> Dict[str, Any]:
+    """Inverse of encode_session"""
+    header, body = blob[:1], blob[1:]
+    if header == _FORMAT_MSGPACK:
+        return ormsgpack.unpackb(body)
+    if header == _FORMAT_MSGPACK_ZSTD:
+        if zstandard is None:
+            raise SessionStoreError("Session blob is zstd-compressed but zstandard is not installed")
+        return ormsgpack.unpackb(zstandard.decompress(body))
+    if header == _FORMAT_MSGPACK_ZLIB:
+        return ormsgpack.unpackb(zlib.decompress(body))
+    if header == _FORMAT_ZLIB:
+        return json.loads(zlib.decompress(body))
+    if header == _FORMAT_JSON:
+        return json.loads(body)
+    raise SessionStoreError(f"Unknown session blob format {header!r}")
+
+
+class SessionStore(ABC):
+    """
+    Versioned key-value storage for serialized sessions
+
+    Versions start at 1 on create and grow by one on every save.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = ttl_seconds
+
+        # Metrics
+        self.reads = 0
+        self.writes = 0
+        self.conflicts = 0
+        self.bytes_written = 0
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[StoredSession]:
+        """Return the stored session, or None if it does not exist"""
+
+    @abstractmethod
+    async def create(self, session_id: str, payload: Dict[str, Any]) -> int:
+        """Store a new session; returns its version (1)"""
+
+    @abstractmethod
+    async def save(
+        self,
+        session_id: str,
+        payload: Dict[str, Any],
+        expected_version: int
+    ) -> int:
+        """
+        Replace a session if it is still at expected_version
+
+        Returns the new version; raises SessionVersionConflict otherwise.
+        """
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> None:
+        """Remove a session"""
+
+    async def close(self) -> None:
+        """Release connections"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "type": type(self).__name__,
+            "reads": self.reads,
+            "writes": self.writes,
+            "conflicts": self.conflicts,
+            "bytes_written": self.bytes_written,
+            "ttl_seconds": self.ttl_seconds
+        }
+
+    def _encode(self, payload: Dict[str, Any]) -> bytes:
+        blob = encode_session(payload)
+        self.writes += 1
+        self.bytes_written += len(blob)
+        return blob
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Process-local store with the same semantics as the shared ones
+
+    Expired sessions are pruned on access and on create.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        super().__init__(ttl_seconds)
+        # session_id -> (version, blob, updated_at monotonic)
+        self._sessions: Dict[str, Tuple[int, bytes, float]] = {}
+        self._next_prune = 0.0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _expired(self, updated_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - updated_at > self.ttl_seconds
+
+    def _prune(self, now: float) -> None:
+        if self.ttl_seconds is None or now < self._next_prune:
+            return
+        self._next_prune = now + min(self.ttl_seconds, 60.0)
+        expired = [
+            session_id for session_id, (_, _, updated_at) in self._sessions.items()
+            if self._expired(updated_at, now)
+        ]
+        for session_id in expired:
+            del self._sessions[session_id]
+
+    async def get(self, session_id: str) -> Optional[StoredSession]:
+        self.reads += 1
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        version, blob, updated_at = entry
+        if self._expired(updated_at, time.monotonic()):
+            del self._sessions[session_id]
+            return None
+        return StoredSession(session_id, version, blob)
+
+    async def create(self, session_id: str, payload: Dict[str, Any]) -> int:
+        now = time.monotonic()
+        self._prune(now)
+        if session_id in self._sessions:
+            raise SessionStoreError(f"Session {session_id} already exists")
+        self._sessions[session_id] = (1, self._encode(payload), now)
+        return 1
+
+    async def save(
+        self,
+        session_id: str,
+        payload: Dict[str, Any],
+        expected_version: int
+    ) -> int:
+        entry = self._sessions.get(session_id)
+        if entry is None or entry[0] != expected_version:
+            self.conflicts += 1
+            raise SessionVersionConflict(session_id, expected_version)
+        version = expected_version + 1
+        self._sessions[session_id] = (version, self._encode(payload), time.monotonic())
+        return version
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **super().get_stats(),
+            "sessions": len(self._sessions),
+            "stored_bytes": sum(len(blob) for _, blob, _ in self._sessions.values())
+        }
+
+
+class MongoSessionStore(SessionStore):
+    """
+    One document per session: {_id, version, blob, updated_at}
+
+    The version check is part of the update filter, so a concurrent writer
+    simply matches nothing. Expiry uses a TTL index on updated_at.
+    """
+
+    def __init__(self, collection: Any, ttl_seconds: Optional[float] = None):
+        super().__init__(ttl_seconds)
+        self.collection = collection
+        self._indexes_ready = False
+
+    async def ensure_indexes(self) -> None:
+        if self._indexes_ready:
+            return
+        if self.ttl_seconds is not None:
+            await self.collection.create_index(
+                "updated_at", expireAfterSeconds=int(self.ttl_seconds))
+        self._indexes_ready = True
+
+    async def get(self, session_id: str) -> Optional[StoredSession]:
+        self.reads += 1
+        document = await self.collection.find_one({"_id": session_id})
+        if document is None:
+            return None
+        return StoredSession(session_id, document["version"], bytes(document["blob"]))
+
+    async def create(self, session_id: str, payload: Dict[str, Any]) -> int:
+        await self.ensure_indexes()
+        await self.collection.insert_one({
+            "_id": session_id,
+            "version": 1,
+            "blob": self._encode(payload),
+            "updated_at": datetime.now(timezone.utc)
+        })
+        return 1
+
+    async def save(
+        self,
+        session_id: str,
+        payload: Dict[str, Any],
+        expected_version: int
+    ) -> int:
+        version = expected_version + 1
+        result = await self.collection.update_one(
+            {"_id": session_id, "version": expected_version},
+            {"$set": {
+                "version": version,
+                "blob": self._encode(payload),
+                "updated_at": datetime.now(timezone.utc)
+            }}
+        )
+        if result.matched_count == 0:
+            self.conflicts += 1
+            raise SessionVersionConflict(session_id, expected_version)
+        return version
+
+    async def delete(self, session_id: str) -> None:
+        await self.collection.delete_one({"_id": session_id})
+
+
+class RespConnection:
+    """Minimal RESP2 client connection over asyncio streams"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, host: str, port: int, db: int = 0,
+                   password: Optional[str] = None) -> "RespConnection":
+        reader, writer = await asyncio.open_connection(host, port)
+        connection = cls(reader, writer)
+        if password:
+            await connection.execute("AUTH", password)
+        if db:
+            await connection.execute("SELECT", db)
+        return connection
+
+    @staticmethod
+    def _encode_command(args: Tuple[Any, ...]) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, bytes):
+                data = arg
+            else:
+                data = str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    async def _read_reply(self) -> Any:
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode("utf-8")
+        if kind == b"-":
+            raise SessionStoreError(body.decode("utf-8"))
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = await self.reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            count = int(body)
+            if count < 0:
+                return None
+            return [await self._read_reply() for _ in range(count)]
+        raise SessionStoreError(f"Unexpected RESP reply {line!r}")
+
+    async def execute(self, *args: Any) -> Any:
+        self.writer.write(self._encode_command(args))
+        await self.writer.drain()
+        return await self._read_reply()
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except Exception:
+            pass
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Sessions in a Redis-protocol server
+
+    Each key holds an 8-byte big-endian version followed by the blob. A save
+    WATCHes the key, checks the version and writes in MULTI/EXEC, which the
+    server aborts if another client changed the key in between. Connections
+    are pooled because WATCH state is per connection.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        key_prefix: str = "interview:session:",
+        ttl_seconds: Optional[float] = None,
+        pool_size: int = 10
+    ):
+        super().__init__(ttl_seconds)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.key_prefix = key_prefix
+        self._pool: List[RespConnection] = []
+        self._pool_slots = asyncio.Semaphore(pool_size)
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisSessionStore":
+        """Build from redis://[:password@]host[:port][/db]"""
+        parsed = urlparse(url)
+        db = int(parsed.path.lstrip("/") or 0)
+        return cls(
+            host=parsed.hostname or "localhost",
+            port=parsed.port or 6379,
+            db=db,
+            password=parsed.password,
+            **kwargs
+        )
+
+    def _key(self, session_id: str) -> str:
+        return self.key_prefix + session_id
+
+    def _expiry_args(self) -> Tuple[Any, ...]:
+        return ("PX", int(self.ttl_seconds * 1000)) if self.ttl_seconds else ()
+
+    async def _acquire(self) -> RespConnection:
+        await self._pool_slots.acquire()
+        if self._pool:
+            return self._pool.pop()
+        try:
+            return await RespConnection.open(self.host, self.port, self.db, self.password)
+        except BaseException:
+            self._pool_slots.release()
+            raise
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[RespConnection]:
+        """
+        Borrow a pooled connection for the duration of the block
+
+        The connection returns to the pool only when the block finishes or
+        raises SessionVersionConflict, which leaves nothing unread and no
+        WATCH/MULTI state behind. Any other exit, including an error reply
+        or cancellation, closes it. The pool slot is released either way.
+        """
+        connection = await self._acquire()
+        reusable = False
+        try:
+            yield connection
+            reusable = True
+        except SessionVersionConflict:
+            reusable = True
+            raise
+        finally:
+            if reusable:
+                self._pool.append(connection)
+            self._pool_slots.release()
+            if not reusable:
+                await connection.close()
+
+    async def _run(self, *args: Any) -> Any:
+        async with self._connection() as connection:
+            return await connection.execute(*args)
+
+    async def get(self, session_id: str) -> Optional[StoredSession]:
+        self.reads += 1
+        value = await self._run("GET", self._key(session_id))
+        if value is None:
+            return None
+        (version,) = struct.unpack(">Q", value[:8])
+        return StoredSession(session_id, version, value[8:])
+
+    async def create(self, session_id: str, payload: Dict[str, Any]) -> int:
+        value = struct.pack(">Q", 1) + self._encode(payload)
+        created = await self._run(
+            "SET", self._key(session_id), value, "NX", *self._expiry_args())
+        if created is None:
+            raise SessionStoreError(f"Session {session_id} already exists")
+        return 1
+
+    async def save(
+        self,
+        session_id: str,
+        payload: Dict[str, Any],
+        expected_version: int
+    ) -> int:
+        key = self._key(session_id)
+        version = expected_version + 1
+        value = struct.pack(">Q", version) + self._encode(payload)
+
+        async with self._connection() as connection:
+            await connection.execute("WATCH", key)
+            current = await connection.execute("GET", key)
+            if current is None or struct.unpack(">Q", current[:8])[0] != expected_version:
+                await connection.execute("UNWATCH")
+                self.conflicts += 1
+                raise SessionVersionConflict(session_id, expected_version)
+            await connection.execute("MULTI")
+            await connection.execute("SET", key, value, *self._expiry_args())
+            result = await connection.execute("EXEC")
+
+        if result is None:
+            # EXEC aborted: the key changed after WATCH
+            self.conflicts += 1
+            raise SessionVersionConflict(session_id, expected_version)
+        return version
+
+    async def delete(self, session_id: str) -> None:
+        await self._run("DEL", self._key(session_id))
+
+    async def close(self) -> None:
+        while self._pool:
+            await self._pool.pop().close()
+
+
+class FileSessionStore(SessionStore):
+    """
+    Sessions as files in a local directory
+
+    Each file holds an 8-byte big-endian version followed by the blob, as in
+    RedisSessionStore. Writes go to a temporary file that atomically
+    replaces the old one, so readers never see a partial session. Creates
+    and saves hold an exclusive flock on the directory's lock file, which
+    makes the version check safe across worker processes on one host.
+    Expiry uses the file modification time. File I/O runs in worker threads.
+    """
+
+    _SAFE_ID = re.compile(r"[A-Za-z0-9_-]{1,128}")
+
+    def __init__(self, directory: str, ttl_seconds: Optional[float] = None):
+        super().__init__(ttl_seconds)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self.directory / ".lock"
+        self._next_prune = 0.0
+
+    def _path(self, session_id: str) -> Path:
+        name = session_id if self._SAFE_ID.fullmatch(session_id) else hashlib.sha256(
+            session_id.encode("utf-8")).hexdigest()
+        return self.directory / f"{name}.session"
+
+    def _expired(self, path: Path) -> bool:
+        return (self.ttl_seconds is not None
+                and time.time() - path.stat().st_mtime > self.ttl_seconds)
+
+    def _read(self, path: Path) -> Optional[Tuple[int, bytes]]:
+        try:
+            if self._expired(path):
+                path.unlink(missing_ok=True)
+                return None
+            value = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        (version,) = struct.unpack(">Q", value[:8])
+        return version, value[8:]
+
+    def _write(self, path: Path, version: int, blob: bytes) -> None:
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(struct.pack(">Q", version) + blob)
+        os.replace(temporary, path)
+
+    def _write_if(self, path: Path, expected_version: Optional[int], version: int,
+                  blob: bytes) -> bool:
+        """Write under the lock if the current version matches (None: absent)"""
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            current = self._read(path)
+            if (current[0] if current else None) != expected_version:
+                return False
+            self._write(path, version, blob)
+            return True
+
+    def _prune(self) -> None:
+        if self.ttl_seconds is None or time.monotonic() < self._next_prune:
+            return
+        self._next_prune = time.monotonic() + min(self.ttl_seconds, 60.0)
+        for path in self.directory.glob("*.session"):
+            try:
+                if self._expired(path):
+                    path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+
+    async def get(self, session_id: str) -> Optional[StoredSession]:
+        self.reads += 1
+        entry = await asyncio.to_thread(self._read, self._path(session_id))
+        if entry is None:
+            return None
+        return StoredSession(session_id, entry[0], entry[1])
+
+    async def create(self, session_id: str, payload: Dict[str, Any]) -> int:
+        await asyncio.to_thread(self._prune)
+        created = await asyncio.to_thread(
+            self._write_if, self._path(session_id), None, 1, self._encode(payload))
+        if not created:
+            raise SessionStoreError(f"Session {session_id} already exists")
+        return 1
+
+    async def save(
+        self,
+        session_id: str,
+        payload: Dict[str, Any],
+        expected_version: int
+    ) -> int:
+        version = expected_version + 1
+        saved = await asyncio.to_thread(
+            self._write_if, self._path(session_id), expected_version, version,
+            self._encode(payload))
+        if not saved:
+            self.conflicts += 1
+            raise SessionVersionConflict(session_id, expected_version)
+        return version
+
+    async def delete(self, session_id: str) -> None:
+        await asyncio.to_thread(self._path(session_id).unlink, missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**super().get_stats(), "directory": str(self.directory)}
+
+
+def create_session_store(backend: Optional[str] = None, **kwargs) -> SessionStore:
+    """
+    Factory function to create the configured SessionStore
+
+    backend (or INTERVIEW_SESSION_STORE) is "memory", "mongo", "redis" or
+    "file" (in INTERVIEW_SESSION_STORE_PATH); INTERVIEW_SESSION_TTL_SECONDS
+    sets the expiry of untouched sessions.
+    """
+    backend = (backend or os.getenv("INTERVIEW_SESSION_STORE", "memory")).lower()
+    ttl_seconds = kwargs.pop(
+        "ttl_seconds", float(os.getenv("INTERVIEW_SESSION_TTL_SECONDS", "86400")))
+
+    if backend == "memory":
+        return InMemorySessionStore(ttl_seconds=ttl_seconds)
+
+    if backend == "mongo":
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        connection_url = kwargs.pop("connection_url", None) or os.getenv("MONGODB_URL")
+        if not connection_url:
+            raise ValueError("MONGODB_URL is required for the mongo session store")
+        client = AsyncIOMotorClient(connection_url)
+        collection = client[kwargs.pop("database_name", "ai_mock_interview")][
+            kwargs.pop("collection_name", "interview_session_state")]
+        return MongoSessionStore(collection, ttl_seconds=ttl_seconds)
+
+    if backend == "redis":
+        url = kwargs.pop("url", None) or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        return RedisSessionStore.from_url(url, ttl_seconds=ttl_seconds, **kwargs)
+
+    if backend == "file":
+        directory = kwargs.pop("directory", None) or os.getenv(
+            "INTERVIEW_SESSION_STORE_PATH", "data/sessions")
+        return FileSessionStore(directory, ttl_seconds=ttl_seconds)
+
+    raise ValueError(f"Unknown session store backend: {backend}")
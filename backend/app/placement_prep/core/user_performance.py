@@ -0,0 +1,392 @@
+"""
+User Performance Aggregates for AI-Based Mock Interview Platform
+
+Running per-user statistics used by problem recommendations. Every finished
+problem attempt updates the aggregate in O(1) and is appended to a JSONL
+journal shared by the host's worker processes, so recommendation cost does
+not grow with a user's history and the aggregates survive restarts.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Category thresholds, as in the original history-based analysis
+STRONG_CATEGORY_RATE = 0.7
+WEAK_CATEGORY_RATE = 0.3
+
+
+@dataclass
+class CategoryStats:
+    """Attempts and successes within one problem category"""
+    attempts: int = 0
+    successes: int = 0
+
+
+@dataclass
+class UserPerformanceAggregate:
+    """Running totals for one user"""
+    user_id: str
+    total_attempts: int = 0
+    successful_attempts: int = 0
+    total_time: float = 0.0
+    attempted_problems: Set[str] = field(default_factory=set)
+    completed_problems: Set[str] = field(default_factory=set)
+    category_stats: Dict[str, CategoryStats] = field(default_factory=dict)
+
+    # Completed-problem row mask for the features it was built from
+    _mask_features: Any = field(default=None, repr=False, compare=False)
+    _completed_mask: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+
+    def record(
+        self,
+        problem_id: str,
+        category: Optional[str],
+        solution_correct: bool,
+        time_taken: float
+    ) -> None:
+        """Fold one finished attempt into the totals"""
+        self.total_attempts += 1
+        self.total_time += time_taken
+        self.attempted_problems.add(problem_id)
+        if solution_correct:
+            self.successful_attempts += 1
+            self.completed_problems.add(problem_id)
+            if self._completed_mask is not None:
+                row = self._mask_features.rows.get(problem_id)
+                if row is not None:
+                    self._completed_mask[row] = True
+
+        if category:
+            stats = self.category_stats.setdefault(category, CategoryStats())
+            stats.attempts += 1
+            if solution_correct:
+                stats.successes += 1
+
+    @property
+    def success_rate(self) -> float:
+        return self.successful_attempts / self.total_attempts if self.total_attempts else 0.0
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.total_attempts if self.total_attempts else 0.0
+
+    def category_split(self) -> Dict[str, List[str]]:
+        """Strong and weak categories by success rate"""
+        split: Dict[str, List[str]] = {"strong": [], "weak": []}
+        for category, stats in self.category_stats.items():
+            rate = stats.successes / stats.attempts if stats.attempts else 0.0
+            if rate > STRONG_CATEGORY_RATE:
+                split["strong"].append(category)
+            elif rate < WEAK_CATEGORY_RATE:
+                split["weak"].append(category)
+        return split
+
+    def completed_mask(self, features: Any) -> np.ndarray:
+        """
+        Boolean row mask of completed problems for a feature table
+
+        Built once per catalog version and then kept current by record().
+        """
+        if self._mask_features is not features:
+            # Snapshot: record() may add to the set from another thread
+            self._completed_mask = features.row_mask(tuple(self.completed_problems))
+            self._mask_features = features
+        return self._completed_mask
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "user_id": self.user_id,
+            "total_attempts": self.total_attempts,
+            "successful_attempts": self.successful_attempts,
+            "total_time": self.total_time,
+            "attempted_problems": sorted(self.attempted_problems),
+            "completed_problems": sorted(self.completed_problems),
+            "category_stats": {
+                category: [stats.attempts, stats.successes]
+                for category, stats in self.category_stats.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UserPerformanceAggregate":
+        return cls(
+            user_id=data["user_id"],
+            total_attempts=data.get("total_attempts", 0),
+            successful_attempts=data.get("successful_attempts", 0),
+            total_time=data.get("total_time", 0.0),
+            attempted_problems=set(data.get("attempted_problems", [])),
+            completed_problems=set(data.get("completed_problems", [])),
+            category_stats={
+                category: CategoryStats(attempts, successes)
+                for category, (attempts, successes) in data.get("category_stats", {}).items()
+            }
+        )
+
+
+class UserPerformanceStore:
+    """
+    Per-user aggregates backed by an append-only JSONL journal
+
+    Journal lines are {"type": "attempt", ...} for a single attempt,
+    {"type": "seed", ...} for a history imported before the user's first
+    recorded attempt, or {"type": "aggregate", ...} for a compacted user.
+
+    Every worker process on a host appends to the same journal. Writes hold
+    an exclusive flock on the journal's lock file and first replay the lines
+    other workers appended since this process last read, so each worker's
+    aggregates follow the file and compaction never drops another worker's
+    attempts. A worker that finds the file replaced by another worker's
+    compaction reloads it from the start. All methods do blocking file I/O;
+    async callers run them in a worker thread.
+    """
+
+    def __init__(self, journal_path: Optional[Path] = None, compact_threshold: int = 10000):
+        self.journal_path = journal_path
+        self.compact_threshold = compact_threshold
+        self._aggregates: Dict[str, UserPerformanceAggregate] = {}
+        self._journal_lines = 0
+        # Bytes of the journal replayed so far, and the file they came from
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._lock_path = (
+            journal_path.with_name(journal_path.name + ".lock") if journal_path else None
+        )
+        self._lock = threading.Lock()
+        self._load()
+
+    @contextmanager
+    def _file_lock(self, operation: int = fcntl.LOCK_EX) -> Iterator[None]:
+        """Hold the flock that serializes journal writers across processes"""
+        if self._lock_path is None:
+            yield
+            return
+        self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, operation)
+            yield
+
+    def _load(self) -> None:
+        """Replay the journal into memory"""
+        if self.journal_path is None or not self.journal_path.exists():
+            return
+
+        with self._lock:
+            with self._file_lock(fcntl.LOCK_SH):
+                self._sync_locked()
+        logger.info(
+            f"Loaded performance aggregates for {len(self._aggregates)} users")
+        if self._journal_lines > self.compact_threshold + len(self._aggregates):
+            self.compact()
+
+    def refresh(self) -> None:
+        """Pick up attempts other workers have journaled since the last read"""
+        with self._lock:
+            with self._file_lock(fcntl.LOCK_SH):
+                self._sync_locked()
+
+    def _sync_locked(self) -> None:
+        """Replay journal lines written since the last sync (caller holds both locks)"""
+        if self.journal_path is None:
+            return
+        try:
+            with open(self.journal_path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_ino != self._inode or stat.st_size < self._offset:
+                    # Replaced by a compaction: start over from the new file
+                    self._aggregates = {}
+                    self._journal_lines = 0
+                    self._offset = 0
+                    self._inode = stat.st_ino
+                f.seek(self._offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        # A line without its newline is still being written; leave it for later
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._apply(json.loads(line))
+            except Exception as e:
+                logger.warning(f"Skipping bad performance journal line: {e}")
+            self._journal_lines += 1
+        self._offset += complete
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        """Fold one journal line into the aggregates"""
+        kind = entry.get("type")
+        if kind == "aggregate":
+            aggregate = UserPerformanceAggregate.from_dict(entry)
+            self._aggregates[aggregate.user_id] = aggregate
+        elif kind == "seed":
+            # A seed only stands in for history when nothing preceded it
+            if entry["user_id"] not in self._aggregates:
+                aggregate = UserPerformanceAggregate.from_dict(entry)
+                self._aggregates[aggregate.user_id] = aggregate
+        else:
+            self._get_or_create(entry["user_id"]).record(
+                entry["problem_id"],
+                entry.get("category"),
+                entry.get("solution_correct", False),
+                entry.get("time_taken", 0)
+            )
+
+    def _get_or_create(self, user_id: str) -> UserPerformanceAggregate:
+        aggregate = self._aggregates.get(user_id)
+        if aggregate is None:
+            aggregate = UserPerformanceAggregate(user_id=user_id)
+            self._aggregates[user_id] = aggregate
+        return aggregate
+
+    def _append(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Append journal lines (caller holds both locks and has synced)"""
+        if self.journal_path is None:
+            return
+        lines = [json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries]
+        if not lines:
+            return
+        try:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, "ab") as f:
+                f.write("".join(lines).encode("utf-8"))
+                self._offset = f.tell()
+                self._inode = os.fstat(f.fileno()).st_ino
+            self._journal_lines += len(lines)
+        except OSError as e:
+            logger.error(f"Error writing performance journal: {e}")
+
+    def get(self, user_id: str) -> Optional[UserPerformanceAggregate]:
+        return self._aggregates.get(user_id)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._aggregates
+
+    def record_attempt(
+        self,
+        user_id: str,
+        problem_id: str,
+        category: Optional[str],
+        solution_correct: bool,
+        time_taken: float
+    ) -> UserPerformanceAggregate:
+        """Update a user's aggregate and journal the attempt"""
+        with self._lock:
+            with self._file_lock():
+                self._sync_locked()
+                aggregate = self._get_or_create(user_id)
+                aggregate.record(problem_id, category, solution_correct, time_taken)
+                self._append([{
+                    "type": "attempt",
+                    "user_id": user_id,
+                    "problem_id": problem_id,
+                    "category": category,
+                    "solution_correct": solution_correct,
+                    "time_taken": time_taken,
+                    "recorded_at": datetime.now().isoformat()
+                }])
+                if self._journal_lines > self.compact_threshold + len(self._aggregates):
+                    self._compact_locked()
+                return aggregate
+
+    def seed(
+        self,
+        user_id: str,
+        attempts: List[Dict[str, Any]]
+    ) -> UserPerformanceAggregate:
+        """
+        Build a user's aggregate from an existing history, once
+
+        Does nothing if the user already has an aggregate, including one
+        recorded by another worker.
+        """
+        with self._lock:
+            with self._file_lock():
+                self._sync_locked()
+                aggregate = self._aggregates.get(user_id)
+                if aggregate is not None:
+                    return aggregate
+                aggregate = self._get_or_create(user_id)
+                for attempt in attempts:
+                    aggregate.record(
+                        attempt["problem_id"],
+                        attempt.get("category"),
+                        attempt.get("solution_correct", False),
+                        attempt.get("time_taken", 0)
+                    )
+                self._append([{"type": "seed", **aggregate.to_dict()}])
+                return aggregate
+
+    def compact(self) -> None:
+        """Rewrite the journal as one aggregate line per user"""
+        with self._lock:
+            with self._file_lock():
+                self._sync_locked()
+                self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        """Rewrite the journal (caller holds both locks and has synced)"""
+        if self.journal_path is None:
+            return
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.journal_path.parent, prefix=".performance-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for aggregate in self._aggregates.values():
+                    f.write(json.dumps(
+                        {"type": "aggregate", **aggregate.to_dict()},
+                        separators=(",", ":")) + "\n")
+                f.flush()
+                offset = f.tell()
+                inode = os.fstat(f.fileno()).st_ino
+            os.replace(tmp_name, self.journal_path)
+            self._offset = offset
+            self._inode = inode
+            self._journal_lines = len(self._aggregates)
+        except Exception as e:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            logger.error(f"Error compacting performance journal: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "users": len(self._aggregates),
+            "journal_lines": self._journal_lines,
+            "journal_path": str(self.journal_path) if self.journal_path else None
+        }
+
+
+# Process-wide stores, one per journal path
+_performance_stores: Dict[Optional[str], UserPerformanceStore] = {}
+_performance_stores_lock = threading.Lock()
+
+
+def get_performance_store(journal_path: Optional[Path] = None) -> UserPerformanceStore:
+    """Return the shared store for a journal path, loading it once"""
+    key = str(journal_path.resolve()) if journal_path else None
+    with _performance_stores_lock:
+        store = _performance_stores.get(key)
+        if store is None:
+            store = UserPerformanceStore(journal_path)
+            _performance_stores[key] = store
+        return store
@@ -14,15 +14,19 @@ Date: July 2025
 import asyncio
 import logging
 import os
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 from datetime import datetime
 import uuid
 
+from langgraph.checkpoint.memory import MemorySaver
+
+from ..core.admission_control import AdmissionController
 from ..core.base_agent import BaseInterviewAgent, AgentState
 from ..core.response_generator import (
     TechnicalInterviewerResponseGenerator,
     ResponseType,
     InterviewResponse,
+    TokenCallback,
     create_response_generator
 )
 from ..core.conversation_manager import (
@@ -37,7 +41,7 @@ from ..core.problem_database import (
     ProblemDatabase,
     ProblemDifficulty,
     ProblemCategory,
-    ProblemFilter,
+    Problem,
     create_problem_database
 )
 from ..core.interview_state_manager import (
@@ -45,14 +49,20 @@ from ..core.interview_state_manager import (
     SessionStatus,
     create_interview_state_manager
 )
+from ..core.session_context import AgentSessionContext, SessionContextStore
 
 # Import Gemini utility
 from ..utils.gemini_chat import create_interview_gemini_chat
+from ..utils.memory_usage import deep_sizeof
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Phases after which the next problem is prepared in the background
+PREFETCH_PHASES = (InterviewPhase.CODE_REVIEW, InterviewPhase.WRAP_UP)
+NEXT_PROBLEM_KEYWORDS = ("next problem", "next question", "another problem", "move on")
+
 
 class DSAInterviewAgent(BaseInterviewAgent):
     """AI agent specialized in conducting DSA interviews with full component integration"""
@@ -84,10 +94,15 @@ class DSAInterviewAgent(BaseInterviewAgent):
             "difficulty_progression": True
         }
 
-        # Current session state
-        self.current_session_id: Optional[str] = None
-        self.current_conversation_state: Optional[ConversationState] = None
-        self.current_problem: Optional[Dict[str, Any]] = None
+        # Limit on concurrent LLM calls, shared with the orchestrator; only
+        # background preparation acquires it here, message turns are
+        # admitted by the orchestrator
+        self.admission: Optional[AdmissionController] = None
+
+        # Per-session state, so one agent can run many interviews at once
+        self.session_contexts: SessionContextStore[AgentSessionContext] = SessionContextStore(
+            max_sessions=self.session_config.get("max_active_sessions", 1000),
+            on_evict=self._release_context)
 
         logger.info(
             f"DSA Interview Agent initialized with components: {self._component_status()}")
@@ -101,31 +116,46 @@ class DSAInterviewAgent(BaseInterviewAgent):
             "interview_state_manager": self.interview_state_manager is not None
         }
 
-    async def initialize_session(self, user_id: str, session_id: str) -> AgentState:
-        """Initialize DSA interview session with all components"""
+    async def initialize_session(
+        self,
+        user_id: str,
+        session_id: str,
+        problem_id: Optional[str] = None,
+        introduction: Optional[str] = None
+    ) -> AgentState:
+        """
+        Initialize DSA interview session with all components
+
+        problem_id and introduction come from an opening prepared ahead of
+        time by prepare_opening; without them the first problem is selected
+        here.
+        """
         try:
             logger.info(
                 f"Initializing DSA interview session {session_id} for user {user_id}")
 
-            # Initialize interview state manager session
+            # Join the orchestrator's state session (created here if absent)
             session_data = await self.interview_state_manager.create_session(
                 user_id=user_id,
                 session_type="dsa",
                 duration_limit=self.session_config.get(
-                    "time_limit_minutes", 45)
+                    "time_limit_minutes", 45) * 60,
+                session_id=session_id
             )
 
-            # Select first problem
-            first_problem = await self._select_initial_problem(user_id)
+            # Select first problem, unless one was prepared
+            first_problem = None
+            if problem_id:
+                problem = self.problem_database.get_problem(problem_id)
+                first_problem = self._problem_to_dict(problem) if problem else None
+            if not first_problem:
+                introduction = None
+                first_problem = await self._select_initial_problem(user_id)
             if not first_problem:
                 raise ValueError("No suitable problems found for interview")
 
-            # Store session state
-            self.current_session_id = session_id
-            self.current_problem = first_problem
-
             # Initialize conversation state
-            self.current_conversation_state = {
+            conversation_state: ConversationState = {
                 "messages": [],
                 "conversation_id": session_id,
                 "current_phase": InterviewPhase.STARTING,
@@ -142,6 +172,16 @@ class DSAInterviewAgent(BaseInterviewAgent):
                 }
             }
 
+            # Store session state
+            self.session_contexts.put(session_id, AgentSessionContext(
+                session_id=session_id,
+                user_id=user_id,
+                conversation_state=conversation_state,
+                current_problem=first_problem,
+                state_session_id=session_data.get("session_id"),
+                problem_ids=[first_problem["id"]]
+            ))
+
             # Create agent state
             agent_state = AgentState(
                 session_id=session_id,
@@ -156,6 +196,7 @@ class DSAInterviewAgent(BaseInterviewAgent):
                     "hints_used": 0,
                     "start_time": datetime.now().isoformat(),
                     "session_status": "active",
+                    "problem_introduction": introduction,
                     "components_initialized": self._component_status()
                 }
             )
@@ -169,52 +210,84 @@ class DSAInterviewAgent(BaseInterviewAgent):
                 f"Failed to initialize DSA interview session: {str(e)}")
             raise
 
-    async def _select_initial_problem(self, user_id: str) -> Optional[Dict[str, Any]]:
+    async def prepare_opening(
+        self,
+        difficulty: Optional[ProblemDifficulty] = None,
+        with_introduction: bool = True,
+        user_id: Optional[str] = None,
+        exclude_ids: Optional[List[str]] = None,
+        admit: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Select a problem and generate its introduction ahead of time
+
+        Used to pre-warm sessions before any user is known (the result is
+        passed back to initialize_session as problem_id and introduction),
+        and to prefetch the next problem of a running interview. Background
+        callers pass admit=True so the introduction's LLM call waits for a
+        slot from self.admission (and may raise AdmissionRejected).
+        """
+        problem = await self._select_initial_problem(
+            user_id,
+            difficulties=[difficulty] if difficulty else None,
+            exclude_ids=exclude_ids)
+        if not problem:
+            return None
+
+        introduction = None
+        if with_introduction and self.response_generator is not None:
+            conversation_id = f"opening-{uuid.uuid4()}"
+            try:
+                if admit and self.admission is not None:
+                    async with self.admission.admit():
+                        response = await self.response_generator.generate_problem_introduction(
+                            problem, conversation_id=conversation_id)
+                else:
+                    response = await self.response_generator.generate_problem_introduction(
+                        problem, conversation_id=conversation_id)
+                introduction = response.content
+            finally:
+                self.response_generator.release_thread(conversation_id)
+
+        return {"problem": problem, "introduction": introduction}
+
+    async def _select_initial_problem(
+        self,
+        user_id: Optional[str],
+        difficulties: Optional[List[ProblemDifficulty]] = None,
+        exclude_ids: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """Select appropriate first problem for the interview"""
         try:
-            # Create filter for initial problem (medium difficulty by default)
-            problem_filter = ProblemFilter(
-                difficulties=[ProblemDifficulty.MEDIUM],
+            # Draw from the opening categories, following the configured
+            # difficulty distribution and skipping problems the user solved
+            record = self.problem_database.sample_problem(
+                difficulties=difficulties or self.session_config.get("difficulties"),
                 categories=[
                     ProblemCategory.ARRAY,
                     ProblemCategory.STRING,
                     ProblemCategory.TWO_POINTERS
-                ]
+                ],
+                exclude_ids=exclude_ids,
+                user_id=user_id
             )
+            problem = self.problem_database.get_problem(
+                record.id) if record else None
 
-            # Search for suitable problems
-            problems = self.problem_database.search_problems(problem_filter)
-
-            if problems:
-                # Convert Problem object to dict and select first one
-                problem = problems[0]
-                problem_dict = {
-                    "id": problem.id,
-                    "title": problem.title,
-                    "description": problem.description,
-                    "difficulty": problem.difficulty.value,
-                    "category": problem.category.value,
-                    "hints": problem.hints,
-                    "test_cases": problem.test_cases
-                }
+            if problem:
+                problem_dict = self._problem_to_dict(problem)
                 logger.info(
                     f"Selected initial problem: {problem.title} ({problem.difficulty.value})")
                 return problem_dict
 
-            # Fallback: get any problem
-            all_problems = self.problem_database.problems
-            if all_problems:
-                problem = list(all_problems.values())[0]  # Get first problem
-                problem_dict = {
-                    "id": problem.id,
-                    "title": problem.title,
-                    "description": problem.description,
-                    "difficulty": problem.difficulty.value,
-                    "category": problem.category.value,
-                    "hints": problem.hints,
-                    "test_cases": problem.test_cases
-                }
-                return problem_dict
+            # Fallback: get any problem not already used
+            excluded = set(exclude_ids or ())
+            first_problem_id = next(
+                (pid for pid in self.problem_database.records if pid not in excluded), None)
+            problem = self.problem_database.get_problem(
+                first_problem_id) if first_problem_id else None
+            if problem:
+                return self._problem_to_dict(problem)
 
             logger.warning("No problems found in database")
             return None
@@ -223,23 +296,61 @@ class DSAInterviewAgent(BaseInterviewAgent):
             logger.error(f"Error selecting initial problem: {str(e)}")
             return None
 
-    async def process_message(self, message: str, state: AgentState) -> Dict[str, Any]:
-        """Process user message in DSA interview context"""
+    @staticmethod
+    def _problem_to_dict(problem: Problem) -> Dict[str, Any]:
+        """Problem fields the conversation works with"""
+        return {
+            "id": problem.id,
+            "title": problem.title,
+            "description": problem.description,
+            "difficulty": problem.difficulty.value,
+            "category": problem.category.value,
+            "hints": problem.hints,
+            "test_cases": problem.test_cases
+        }
+
+    async def process_message(
+        self,
+        message: str,
+        state: AgentState,
+        on_token: Optional[TokenCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Process user message in DSA interview context
+
+        on_token, if given, receives the generated reply piece by piece.
+        """
         try:
             logger.info(
                 f"🎯 DSA INTERVIEWER: Received message: {message[:100]}...")
 
-            if not self.current_conversation_state or not self.current_session_id:
+            context = self.session_contexts.get(state.session_id)
+            if context is None:
                 raise ValueError(
                     "No active conversation state. Please initialize session first.")
+            context.touch()
+            conversation_state = context.conversation_state
+            max_problems = state.metadata.get(
+                "max_problems", self.session_config.get("max_problems", 3))
+
+            # Move on to the (usually already prepared) next problem
+            if (conversation_state.get("current_phase") in PREFETCH_PHASES
+                    and len(context.problem_ids) < max_problems
+                    and any(k in message.lower() for k in NEXT_PROBLEM_KEYWORDS)):
+                next_problem_response = await self._advance_problem(context, state)
+                if next_problem_response is not None:
+                    return next_problem_response
 
             logger.info(
-                f"🔄 DSA INTERVIEWER: Processing through conversation manager for session {self.current_session_id}")
+                f"🔄 DSA INTERVIEWER: Processing through conversation manager for session {context.session_id}")
 
-            # Process message through conversation manager
+            # Process message through conversation manager; the session's
+            # problem and hint count go in and come back updated
             response = await self.conversation_manager.process_user_message(
-                conversation_id=self.current_session_id,
-                user_message=message
+                conversation_id=context.session_id,
+                user_message=message,
+                on_token=on_token,
+                session_state=conversation_state
             )
 
             logger.info(f"📤 CONVERSATION MANAGER RESPONSE: {response}")
@@ -253,13 +364,17 @@ class DSAInterviewAgent(BaseInterviewAgent):
             updated_metadata.update({
                 "last_message_time": datetime.now().isoformat(),
                 "current_phase": response.current_phase.value if response.current_phase else "unknown",
-                "hints_used": self.current_conversation_state.get("hints_given", 0) if self.current_conversation_state else 0
+                "hints_used": conversation_state.get("hints_given", 0)
             })
 
             # Check if we need to transition to next problem or end interview
             action = self._determine_next_action(response, state)
             logger.info(f"🎬 DETERMINED ACTION: {action}")
 
+            conversation_state["current_phase"] = response.current_phase
+            if response.current_phase in PREFETCH_PHASES:
+                self._prefetch_next_problem(context, max_problems)
+
             final_response = {
                 "message": response.message,  # Changed from "response" to "message" for consistency
                 "phase": response.current_phase.value if response.current_phase else "unknown",
@@ -272,11 +387,11 @@ class DSAInterviewAgent(BaseInterviewAgent):
                 },
                 "conversation_metadata": {
                     "phase": response.current_phase.value if response.current_phase else "unknown",
-                    "problem_id": self.current_problem.get("id") if self.current_problem else None,
+                    "problem_id": context.current_problem.get("id") if context.current_problem else None,
                     "hints_remaining": (
-                        self.current_conversation_state.get("max_hints", 3) -
-                        self.current_conversation_state.get("hints_given", 0)
-                    ) if self.current_conversation_state else 3
+                        conversation_state.get("max_hints", 3) -
+                        conversation_state.get("hints_given", 0)
+                    )
                 }
             }
 
@@ -296,6 +411,193 @@ class DSAInterviewAgent(BaseInterviewAgent):
                 "error": str(e)
             }
 
+    def _prefetch_next_problem(self, context: AgentSessionContext, max_problems: int) -> None:
+        """Start preparing the next problem while the user finishes this one"""
+        if context.next_opening is not None or len(context.problem_ids) >= max_problems:
+            return
+        context.next_opening = asyncio.get_running_loop().create_task(self.prepare_opening(
+            user_id=context.user_id, exclude_ids=list(context.problem_ids), admit=True))
+        logger.info(f"⏩ DSA INTERVIEWER: Prefetching next problem for session {context.session_id}")
+
+    async def _advance_problem(
+        self,
+        context: AgentSessionContext,
+        state: AgentState
+    ) -> Optional[Dict[str, Any]]:
+        """Switch the session to its next problem, prepared in the background if possible"""
+        opening = None
+        task, context.next_opening = context.next_opening, None
+        if task is not None:
+            try:
+                opening = await task
+            except Exception as e:
+                logger.error(f"❌ DSA INTERVIEWER: Prefetch failed, preparing inline: {e}")
+        if opening is None:
+            opening = await self.prepare_opening(
+                user_id=context.user_id, exclude_ids=list(context.problem_ids))
+        if opening is None:
+            return None
+
+        problem = opening["problem"]
+        context.current_problem = problem
+        context.problem_ids.append(problem["id"])
+        context.conversation_state.update({
+            "current_phase": InterviewPhase.PROBLEM_INTRODUCTION,
+            "problem_data": problem,
+            "user_code": None,
+            "code_language": None,
+            "hints_given": 0,
+            "last_activity_time": datetime.now()
+        })
+        # The next problem starts a fresh conversation thread
+        self.conversation_manager.release_conversation(context.session_id)
+
+        message = opening["introduction"] or (
+            f'Great work! Let\'s move on to the next problem: "{problem.get("title")}"\n\n'
+            f'{problem.get("description", "")}')
+        logger.info(f"➡️ DSA INTERVIEWER: Session {context.session_id} moved to {problem.get('title')}")
+        return {
+            "message": message,
+            "phase": InterviewPhase.PROBLEM_INTRODUCTION.value,
+            "suggested_actions": [
+                "Ask clarifying questions",
+                "Start thinking about the approach",
+                "Request a hint if needed"
+            ],
+            "session_completed": False,
+            "action": "next_problem",
+            "state_update": {
+                "metadata": {**state.metadata, "current_problem_id": problem["id"]},
+                "current_step": self._get_current_step("present_problem")
+            },
+            "conversation_metadata": {
+                "phase": InterviewPhase.PROBLEM_INTRODUCTION.value,
+                "problem_id": problem["id"],
+                "hints_remaining": context.conversation_state.get("max_hints", 3)
+            }
+        }
+
+    def end_session(self, session_id: str) -> Optional[AgentSessionContext]:
+        """Drop the per-session context of a finished interview"""
+        context = self.session_contexts.pop(session_id)
+        self._release_context(session_id, context)
+        if context is not None:
+            logger.info(f"🧹 DSA INTERVIEWER: Released context for session {session_id}")
+        return context
+
+    def _release_context(self, session_id: str, context: Optional[AgentSessionContext]) -> None:
+        """Free the conversation and state-manager threads of a session"""
+        if context is not None and context.next_opening is not None:
+            context.next_opening.cancel()
+            context.next_opening = None
+        try:
+            self.conversation_manager.release_conversation(session_id)
+            if context is not None and context.state_session_id:
+                self.interview_state_manager.release_session(context.state_session_id)
+        except Exception as e:
+            logger.error(f"❌ DSA INTERVIEWER: Error releasing session {session_id}: {e}")
+
+    def export_context(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Plain-data form of a session's context for an external session store
+
+        The problem is kept by id and rebuilt from the problem database on
+        import; LangGraph messages are exported by export_conversation.
+        """
+        context = self.session_contexts.get(session_id)
+        if context is None:
+            return None
+        return {
+            "user_id": context.user_id,
+            "state_session_id": context.state_session_id,
+            "problem_ids": context.problem_ids,
+            "problem_id": context.current_problem.get("id") if context.current_problem else None,
+            "conversation_state": {
+                key: value for key, value in context.conversation_state.items()
+                if key not in ("problem_data", "messages")
+            },
+            "created_at": context.created_at,
+            "last_activity": context.last_activity
+        }
+
+    def import_context(self, session_id: str, data: Dict[str, Any]) -> AgentSessionContext:
+        """Rebuild a context exported by export_context, possibly on another worker"""
+        problem = self.problem_database.get_problem(
+            data["problem_id"]) if data.get("problem_id") else None
+        current_problem = self._problem_to_dict(problem) if problem else None
+
+        conversation_state = dict(data.get("conversation_state", {}))
+        conversation_state["messages"] = []
+        conversation_state["problem_data"] = current_problem
+        if conversation_state.get("current_phase"):
+            conversation_state["current_phase"] = InterviewPhase(
+                conversation_state["current_phase"])
+        for key in ("session_start_time", "last_activity_time"):
+            if isinstance(conversation_state.get(key), str):
+                conversation_state[key] = datetime.fromisoformat(conversation_state[key])
+
+        context = AgentSessionContext(
+            session_id=session_id,
+            user_id=data["user_id"],
+            conversation_state=conversation_state,
+            current_problem=current_problem,
+            state_session_id=data.get("state_session_id"),
+            problem_ids=list(data.get("problem_ids", [])),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            last_activity=datetime.fromisoformat(data["last_activity"])
+        )
+        self.session_contexts.put(session_id, context)
+        return context
+
+    async def export_conversation(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Conversation messages of a session, or None without a context"""
+        if session_id not in self.session_contexts:
+            return None
+        return await self.conversation_manager.export_conversation(session_id)
+
+    async def import_conversation(self, session_id: str, messages: List[Dict[str, Any]]) -> None:
+        """Restore messages exported by export_conversation, replacing any held here"""
+        self.conversation_manager.release_conversation(session_id)
+        await self.conversation_manager.import_conversation(session_id, messages)
+
+    def conversation_is_process_local(self) -> bool:
+        """Whether conversation messages live only in this process's checkpointer"""
+        graph = getattr(self.conversation_manager, "graph", None)
+        return isinstance(getattr(graph, "checkpointer", None), MemorySaver)
+
+    def reap_orphans(self, live_session_ids: Set[str]) -> List[str]:
+        """End contexts whose orchestrator session no longer exists"""
+        orphans = [
+            session_id for session_id, _ in self.session_contexts.items()
+            if session_id not in live_session_ids
+        ]
+        for session_id in orphans:
+            self.end_session(session_id)
+        return orphans
+
+    def get_llm_clients(self) -> List[Any]:
+        """Distinct LLM clients used by this agent's components"""
+        clients = []
+        for generator in (self.response_generator,
+                          getattr(self.conversation_manager, "response_generator", None)):
+            llm = getattr(generator, "llm", None)
+            if llm is not None and all(llm is not c for c in clients):
+                clients.append(llm)
+        return clients
+
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """Resident state held by this agent and its components"""
+        return {
+            "session_contexts": {
+                **self.session_contexts.get_stats(),
+                "approx_bytes": deep_sizeof(self.session_contexts.items())
+            },
+            **self.conversation_manager.get_memory_stats(),
+            "state_manager": self.interview_state_manager.get_memory_stats(),
+            "response_cache": self.response_generator.cache.get_stats()
+            if getattr(self.response_generator, "cache", None) is not None else None
+        }
+
     def _determine_next_action(self, response: ConversationResponse, state: AgentState) -> str:
         """Determine the next action based on conversation response"""
         try:
@@ -333,7 +635,9 @@ class DSAInterviewAgent(BaseInterviewAgent):
         try:
             logger.info(f"Evaluating DSA response: {response[:100]}...")
 
-            if not self.current_problem:
+            context = self.session_contexts.get(state.session_id)
+            current_problem = context.current_problem if context else None
+            if not current_problem:
                 return {
                     "score": 0,
                     "feedback": "No active problem to evaluate against.",
@@ -345,10 +649,10 @@ class DSAInterviewAgent(BaseInterviewAgent):
 
             if not code:
                 # If no code, provide general feedback on explanation
-                return await self._evaluate_explanation(response, state)
+                return await self._evaluate_explanation(response, current_problem)
 
             # Evaluate code solution
-            return await self._evaluate_code_solution(code, response, state)
+            return await self._evaluate_code_solution(code, response, current_problem)
 
         except Exception as e:
             logger.error(f"Error evaluating DSA response: {str(e)}")
@@ -383,14 +687,18 @@ class DSAInterviewAgent(BaseInterviewAgent):
             logger.error(f"Error extracting code: {str(e)}")
             return None
 
-    async def _evaluate_explanation(self, explanation: str, state: AgentState) -> Dict[str, Any]:
+    async def _evaluate_explanation(
+        self,
+        explanation: str,
+        current_problem: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         """Evaluate user's explanation or approach"""
         try:
             # Create problem context for evaluation
-            problem_title = self.current_problem.get(
-                'title', 'Unknown') if self.current_problem else 'Unknown'
-            problem_desc = self.current_problem.get(
-                'description', 'No description') if self.current_problem else 'No description'
+            problem_title = current_problem.get(
+                'title', 'Unknown') if current_problem else 'Unknown'
+            problem_desc = current_problem.get(
+                'description', 'No description') if current_problem else 'No description'
 
             problem_context = f"""
 Problem: {problem_title}
@@ -431,16 +739,21 @@ User's explanation: {explanation}
                 "evaluation_type": "explanation"
             }
 
-    async def _evaluate_code_solution(self, code: str, full_response: str, state: AgentState) -> Dict[str, Any]:
+    async def _evaluate_code_solution(
+        self,
+        code: str,
+        full_response: str,
+        current_problem: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         """Evaluate code solution"""
         try:
             # Create comprehensive problem context
-            problem_title = self.current_problem.get(
-                'title', 'Unknown') if self.current_problem else 'Unknown'
-            problem_desc = self.current_problem.get(
-                'description', 'No description') if self.current_problem else 'No description'
-            problem_difficulty = self.current_problem.get(
-                'difficulty', 'Unknown') if self.current_problem else 'Unknown'
+            problem_title = current_problem.get(
+                'title', 'Unknown') if current_problem else 'Unknown'
+            problem_desc = current_problem.get(
+                'description', 'No description') if current_problem else 'No description'
+            problem_difficulty = current_problem.get(
+                'difficulty', 'Unknown') if current_problem else 'Unknown'
 
             problem_context = f"""
 Problem: {problem_title}
@@ -561,6 +874,8 @@ def create_dsa_interviewer(
     api_key: Optional[str] = None,
     model_name: Optional[str] = None,
     session_config: Optional[Dict[str, Any]] = None,
+    problem_database: Optional[ProblemDatabase] = None,
+    interview_state_manager: Optional[InterviewStateManager] = None,
     **kwargs
 ) -> DSAInterviewAgent:
     """
@@ -570,6 +885,8 @@ def create_dsa_interviewer(
         api_key: Deprecated, not needed for Gemini (uses GOOGLE_API_KEY from env)
         model_name: Deprecated, Gemini model is configured automatically
         session_config: Interview session configuration
+        problem_database: Existing problem database to reuse instead of creating one
+        interview_state_manager: Existing state manager to share instead of creating one
         **kwargs: Additional configuration options
 
     Returns:
@@ -580,9 +897,12 @@ def create_dsa_interviewer(
 
         # Create core components with Gemini
         response_generator = create_response_generator(**kwargs)
-        conversation_manager = create_conversation_manager(**kwargs)
-        problem_database = create_problem_database(**kwargs)
-        interview_state_manager = create_interview_state_manager(**kwargs)
+        conversation_manager = create_conversation_manager(
+            response_generator=response_generator, **kwargs)
+        if problem_database is None:
+            problem_database = create_problem_database(**kwargs)
+        if interview_state_manager is None:
+            interview_state_manager = create_interview_state_manager(**kwargs)
 
         # Create DSA interviewer agent
         dsa_agent = DSAInterviewAgent(
@@ -0,0 +1,117 @@
+"""
+Shared fixtures: an interview stack wired to an in-process fake LLM
+
+No API keys or network access are needed; the problem database falls back
+to its built-in problems when the data directory is empty. Problem files
+written with write_problem go to the same directory.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, List, Optional
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from app.placement_prep.core.conversation_manager import TechnicalInterviewConversationManager
+from app.placement_prep.core.interview_state_manager import create_interview_state_manager
+from app.placement_prep.core.problem_database import ProblemDatabase, create_problem_database
+from app.placement_prep.core.response_generator import TechnicalInterviewerResponseGenerator
+from app.placement_prep.interviewer_agents.dsa_interviewer import DSAInterviewAgent
+from app.placement_prep.workflows.interview_orchestrator import MainInterviewOrchestrator
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model that answers every prompt with a numbered JSON reply"""
+    temperature: float = 0.6
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        text = json.dumps({
+            "content": f"Interviewer reply {self.calls}",
+            "response_type": "encouragement"
+        })
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+
+@pytest.fixture
+def fake_llm() -> FakeChatModel:
+    return FakeChatModel()
+
+
+@pytest.fixture
+def write_problem(tmp_path):
+    """Write a minimal valid problem file into tmp_path/problems"""
+
+    def write(problem_id: str, **fields: Any) -> Path:
+        directory = tmp_path / "problems"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{problem_id}.json"
+        path.write_text(json.dumps({
+            "id": problem_id,
+            "title": problem_id.replace("-", " ").title(),
+            "slug": problem_id,
+            "difficulty": "easy",
+            "category": "array",
+            "description": f"Solve {problem_id}.",
+            **fields
+        }))
+        return path
+
+    return write
+
+
+@pytest.fixture
+def problem_database(tmp_path):
+    """Factory for a private ProblemDatabase on tmp_path/problems"""
+
+    def build(**config: Any) -> ProblemDatabase:
+        settings = {
+            "performance_journal_path": str(tmp_path / "user_performance.jsonl"),
+            "vector_index_directory": None,
+            **config
+        }
+        return create_problem_database(str(tmp_path / "problems"), shared=False, **settings)
+
+    return build
+
+
+@pytest.fixture
+def build_orchestrator(tmp_path, fake_llm):
+    """Factory for an orchestrator whose components all share fake_llm"""
+
+    def build(cache=None, session_config=None, session_store=None, admission=None,
+              **config) -> MainInterviewOrchestrator:
+        problem_database = create_problem_database(
+            str(tmp_path / "problems"),
+            performance_journal_path=str(tmp_path / "user_performance.jsonl"),
+            vector_index_directory=None
+        )
+        interview_state_manager = create_interview_state_manager(
+            api_key="test", model_name="test")
+        response_generator = TechnicalInterviewerResponseGenerator(fake_llm, cache=cache)
+        dsa_interviewer = DSAInterviewAgent(
+            response_generator=response_generator,
+            conversation_manager=TechnicalInterviewConversationManager(response_generator),
+            problem_database=problem_database,
+            interview_state_manager=interview_state_manager,
+            session_config=session_config
+        )
+        return MainInterviewOrchestrator(
+            problem_database=problem_database,
+            interview_state_manager=interview_state_manager,
+            dsa_interviewer=dsa_interviewer,
+            config=config,
+            session_store=session_store,
+            admission=admission
+        )
+
+    return build
@@ -0,0 +1,100 @@
+"""
+Tests for interview admission control
+
+Each test holds the only slot of a one-slot controller so that further
+callers queue behind it.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.placement_prep.core.admission_control import AdmissionRejected, create_admission_controller
+
+
+def test_full_queue_is_rejected_with_a_retry_delay():
+    async def scenario():
+        admission = create_admission_controller(
+            max_concurrent=1, max_queue=1, max_queue_wait_seconds=30, initial_service_seconds=2.5)
+        await admission.acquire()
+        queued = asyncio.create_task(admission.acquire())
+        await asyncio.sleep(0)
+        assert admission.queued == 1
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await admission.acquire()
+        assert rejected.value.reason == "queue full"
+        assert rejected.value.retry_after_header == "5"
+        assert admission.rejected_queue_full == 1
+
+        admission.release()
+        await queued
+        assert admission.active == 1
+        assert admission.queued == 0
+
+    asyncio.run(scenario())
+
+
+def test_waiter_is_dropped_when_its_deadline_passes():
+    async def scenario():
+        admission = create_admission_controller(
+            max_concurrent=1, max_queue=4, max_queue_wait_seconds=0.1, initial_service_seconds=0.05)
+        await admission.acquire()
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await admission.acquire()
+        assert rejected.value.reason == "queue deadline exceeded"
+        assert admission.timed_out == 1
+        assert admission.queued == 0
+
+        # The expired waiter holds nothing, so the slot goes straight back
+        admission.release()
+        assert admission.active == 0
+        await admission.acquire()
+        assert admission.admitted == 2
+
+    asyncio.run(scenario())
+
+
+def test_slot_granted_to_a_cancelled_waiter_passes_to_the_next():
+    async def scenario():
+        admission = create_admission_controller(
+            max_concurrent=1, max_queue=4, max_queue_wait_seconds=30)
+        await admission.acquire()
+        first = asyncio.create_task(admission.acquire())
+        second = asyncio.create_task(admission.acquire())
+        await asyncio.sleep(0)
+        assert admission.queued == 2
+
+        # The first waiter is cancelled and, in the same loop iteration,
+        # granted the slot; it must hand the slot on rather than keep it
+        first.cancel()
+        admission.release()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        await asyncio.wait_for(second, timeout=1)
+        assert admission.active == 1
+        assert admission.queued == 0
+        assert admission.admitted == 2
+
+    asyncio.run(scenario())
+
+
+def test_rejected_start_returns_429_with_retry_after():
+    from routers import interviews
+
+    class BusyOrchestrator:
+        async def start_interview(self, session_id):
+            raise AdmissionRejected("queue full", 3.2)
+
+    app = FastAPI()
+    app.include_router(interviews.router)
+    app.dependency_overrides[interviews.get_orchestrator] = lambda: BusyOrchestrator()
+
+    response = TestClient(app).post("/api/v1/interviews/session-1/start")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "4"
+    assert "queue full" in response.json()["detail"]
@@ -0,0 +1,200 @@
+"""
+Tests for the MongoDB LangGraph checkpoint saver
+
+An in-memory Motor-style collection stands in for MongoDB. It understands
+the filters, updates and bulk writes the saver issues, and nothing more.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from langgraph.checkpoint.base import ERROR, empty_checkpoint
+
+from app.placement_prep.utils.checkpointer import MongoCheckpointSaver
+
+
+def _matches(document, query):
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(_matches(document, clause) for clause in condition):
+                return False
+        elif field == "$nor":
+            if any(_matches(document, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict) and "$in" in condition:
+            if document.get(field) not in condition["$in"]:
+                return False
+        elif isinstance(condition, dict) and "$lt" in condition:
+            if not document.get(field, "") < condition["$lt"]:
+                return False
+        elif document.get(field) != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, key, direction=None):
+        keys = [(key, direction)] if isinstance(key, str) else key
+        for field, field_direction in reversed(keys):
+            self.documents.sort(key=lambda d: d.get(field), reverse=field_direction < 0)
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count]
+        return self
+
+    async def to_list(self, length=None):
+        return self.documents
+
+
+class FakeCollection:
+    delegate = None
+
+    def __init__(self):
+        self.documents = []
+
+    async def create_index(self, *args, **kwargs):
+        return None
+
+    def find(self, query, projection=None):
+        return FakeCursor([dict(d) for d in self.documents if _matches(d, query)])
+
+    async def find_one(self, query):
+        found = self.find(query).documents
+        return found[0] if found else None
+
+    def _upsert(self, query, update, upsert):
+        document = next((d for d in self.documents if _matches(d, query)), None)
+        if document is None:
+            if not upsert:
+                return
+            document = {k: v for k, v in query.items() if not k.startswith("$")}
+            self.documents.append(document)
+            document.update(update.get("$setOnInsert", {}))
+        document.update(update.get("$set", {}))
+
+    async def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            self._upsert(operation._filter, operation._doc, operation._upsert)
+
+    async def replace_one(self, query, replacement, upsert=False):
+        self.documents = [d for d in self.documents if not _matches(d, query)]
+        self.documents.append(dict(replacement))
+
+    async def delete_many(self, query):
+        self.documents = [d for d in self.documents if not _matches(d, query)]
+
+
+def _saver(keep_latest=3):
+    database = {}
+    saver = MongoCheckpointSaver(
+        type("Database", (), {"__getitem__": lambda self, name: database.setdefault(
+            name, FakeCollection())})(),
+        graph="conversation", keep_latest=keep_latest)
+    return saver, saver._collections
+
+
+async def _put(saver, parent_config, values, new_channels, previous=None):
+    """Checkpoint values, bumping the version of new_channels only"""
+    checkpoint = empty_checkpoint()
+    versions = dict(previous["channel_versions"]) if previous else {}
+    for channel in new_channels:
+        versions[channel] = saver.get_next_version(versions.get(channel), None)
+    checkpoint["channel_values"] = dict(values)
+    checkpoint["channel_versions"] = versions
+    config = await saver.aput(
+        parent_config, checkpoint, {"source": "loop", "step": 1},
+        {channel: versions[channel] for channel in new_channels})
+    return config, checkpoint
+
+
+def test_put_and_get_round_trip():
+    async def scenario():
+        saver, _ = _saver()
+        root = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        notes = "x" * 5000  # Stored compressed
+        config, checkpoint = await _put(
+            saver, root, {"messages": ["hi"], "notes": notes}, ["messages", "notes"])
+
+        loaded = await saver.aget_tuple(root)
+        assert loaded.config == config
+        assert loaded.checkpoint["id"] == checkpoint["id"]
+        assert loaded.checkpoint["channel_values"] == {"messages": ["hi"], "notes": notes}
+        assert loaded.metadata["step"] == 1
+        assert loaded.parent_config is None
+
+        child, _ = await _put(saver, config, {"messages": ["hi", "yo"], "notes": notes},
+                              ["messages"], previous=checkpoint)
+        loaded = await saver.aget_tuple(child)
+        assert loaded.checkpoint["channel_values"]["messages"] == ["hi", "yo"]
+        assert loaded.parent_config == config
+
+    asyncio.run(scenario())
+
+
+def test_prune_keeps_blobs_shared_with_kept_checkpoints():
+    async def scenario():
+        saver, (checkpoints, blobs, _) = _saver(keep_latest=2)
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        config, checkpoint = await _put(
+            saver, config, {"profile": "p", "turn": 0}, ["profile", "turn"])
+        profile_version = checkpoint["channel_versions"]["profile"]
+        turn_versions = [checkpoint["channel_versions"]["turn"]]
+        for turn in range(1, 4):
+            config, checkpoint = await _put(
+                saver, config, {"profile": "p", "turn": turn}, ["turn"], previous=checkpoint)
+            turn_versions.append(checkpoint["channel_versions"]["turn"])
+
+        assert len(checkpoints.documents) == 2
+        # The profile blob written with the first checkpoint is still referenced
+        assert sorted((b["channel"], b["version"]) for b in blobs.documents) == sorted(
+            [("profile", profile_version)] + [("turn", v) for v in turn_versions[-2:]])
+        loaded = await saver.aget_tuple(config)
+        assert loaded.checkpoint["channel_values"] == {"profile": "p", "turn": 3}
+
+    asyncio.run(scenario())
+
+
+def test_reused_blobs_are_touched_on_every_put():
+    async def scenario():
+        saver, (checkpoints, blobs, _) = _saver()
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        config, checkpoint = await _put(
+            saver, config, {"profile": "p", "turn": 0}, ["profile", "turn"])
+        stale = datetime.now(timezone.utc) - timedelta(days=30)
+        for blob in blobs.documents:
+            blob["updated_at"] = stale
+
+        config, checkpoint = await _put(
+            saver, config, {"profile": "p", "turn": 1}, ["turn"], previous=checkpoint)
+        latest = next(d for d in checkpoints.documents
+                      if d["checkpoint_id"] == checkpoint["id"])
+        profile = next(b for b in blobs.documents if b["channel"] == "profile")
+        assert profile["updated_at"] == latest["updated_at"]
+
+    asyncio.run(scenario())
+
+
+def test_put_writes_keeps_regular_writes_and_overwrites_special_ones():
+    async def scenario():
+        saver, _ = _saver()
+        root = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        config, _ = await _put(saver, root, {"messages": []}, ["messages"])
+
+        await saver.aput_writes(config, [("messages", "a"), ("notes", "b")], "task-1")
+        await saver.aput_writes(config, [("messages", "replayed")], "task-1")
+        await saver.aput_writes(config, [(ERROR, "first failure")], "task-2")
+        await saver.aput_writes(config, [(ERROR, "second failure")], "task-2")
+        await saver.aput_writes(config, [], "task-3")
+
+        loaded = await saver.aget_tuple(config)
+        assert sorted(loaded.pending_writes) == sorted([
+            ("task-1", "messages", "a"),
+            ("task-1", "notes", "b"),
+            ("task-2", ERROR, "second failure"),
+        ])
+
+    asyncio.run(scenario())
@@ -0,0 +1,173 @@
+"""
+Tests for the interview orchestrator, driven end to end with a fake LLM
+"""
+
+import asyncio
+
+from langchain_core.runnables import RunnableConfig
+
+from app.placement_prep.core.admission_control import create_admission_controller
+from app.placement_prep.core.session_store import FileSessionStore
+from app.placement_prep.workflows.interview_orchestrator import InterviewSessionConfig
+from app.placement_prep.workflows.session_reaper import create_session_reaper
+
+
+def test_ungraded_session_is_recorded_as_attempted(build_orchestrator):
+    orchestrator = build_orchestrator()
+
+    async def run():
+        created = await orchestrator.create_session(InterviewSessionConfig(user_id="alice"))
+        session_id = created.session_id
+        started = await orchestrator.start_interview(session_id)
+        problem_id = started.session_state.current_problem.id
+        await orchestrator.process_message(session_id, "Can I use a hash map?")
+        await orchestrator.process_message(session_id, "What about duplicates?")
+        await orchestrator.end_session(session_id)
+        return problem_id
+
+    problem_id = asyncio.run(run())
+
+    aggregate = orchestrator.problem_database.user_performance.get("alice")
+    assert aggregate.total_attempts == 1
+    assert aggregate.successful_attempts == 0
+    assert aggregate.attempted_problems == {problem_id}
+    assert aggregate.completed_problems == set()
+
+
+def test_concurrent_sessions_keep_their_own_context(build_orchestrator):
+    # The agent's own context bound is far below the session count; under the
+    # orchestrator it must not evict live sessions
+    orchestrator = build_orchestrator(session_config={
+        "max_problems": 3,
+        "time_limit_minutes": 45,
+        "hints_per_problem": 3,
+        "max_active_sessions": 50
+    })
+    agent = orchestrator.dsa_interviewer
+    session_count = 200
+
+    async def start(index):
+        created = await orchestrator.create_session(
+            InterviewSessionConfig(user_id=f"user-{index}"))
+        started = await orchestrator.start_interview(created.session_id)
+        return created.session_id, started.session_state.current_problem.id
+
+    async def drive(session_id, problem_id):
+        for turn in range(3):
+            response = await orchestrator.process_message(
+                session_id, f"{session_id} turn {turn}: can I sort the input first?")
+            assert response.current_phase != "dsa_interview_error"
+            assert "encountered an issue" not in response.message
+            assert agent.session_contexts.get(session_id).current_problem["id"] == problem_id
+
+        messages = await agent.export_conversation(session_id)
+        user_messages = [m for m in messages if m.get("type") == "human"]
+        assert len(user_messages) == 3
+        assert all(m["data"]["content"].startswith(session_id) for m in user_messages)
+
+    async def run():
+        sessions = await asyncio.gather(*(start(i) for i in range(session_count)))
+        await asyncio.gather(*(drive(*session) for session in sessions))
+        assert len(agent.session_contexts) == session_count
+        assert agent.session_contexts.evictions == 0
+        for session_id, _ in sessions:
+            await orchestrator.end_session(session_id)
+        assert len(agent.session_contexts) == 0
+
+    asyncio.run(run())
+
+
+def test_eviction_skips_sessions_with_a_message_in_flight(build_orchestrator):
+    orchestrator = build_orchestrator()
+    reaper = create_session_reaper(
+        orchestrator, idle_ttl_seconds=0.001, hibernate_after_seconds=0, max_sessions=10)
+
+    async def run():
+        created = await orchestrator.create_session(InterviewSessionConfig(user_id="alice"))
+        session_id = created.session_id
+        await orchestrator.start_interview(session_id)
+        idle = await orchestrator.create_session(InterviewSessionConfig(user_id="bob"))
+        await asyncio.sleep(0.01)
+
+        message = asyncio.create_task(
+            orchestrator.process_message(session_id, "Is the input sorted?"))
+        await asyncio.sleep(0)
+        assert session_id in orchestrator.busy_session_ids()
+        assert not orchestrator.evict_session(session_id)
+        # Over the cap the busy session is older, but the idle one goes
+        assert orchestrator.enforce_session_cap(1) == [idle.session_id]
+        assert await reaper.sweep() == {"hibernated": 0, "idle": 0, "over_cap": 0, "orphans": 0}
+
+        response = await message
+        assert response.current_phase != "dsa_interview_error"
+        assert session_id in orchestrator.dsa_interviewer.session_contexts
+
+        # Once the message is done the session is fair game again
+        await asyncio.sleep(0.01)
+        assert orchestrator.reap_idle_sessions(0.001) == [session_id]
+
+    asyncio.run(run())
+
+
+def test_follow_up_on_another_worker_keeps_the_conversation(build_orchestrator, tmp_path):
+    # Two orchestrators with their own in-memory checkpointers stand in for
+    # two workers sharing a session store
+    store_directory = str(tmp_path / "sessions")
+    first = build_orchestrator(session_store=FileSessionStore(store_directory))
+    second = build_orchestrator(session_store=FileSessionStore(store_directory))
+
+    async def run():
+        created = await first.create_session(InterviewSessionConfig(user_id="alice"))
+        session_id = created.session_id
+        started = await first.start_interview(session_id)
+        await first.process_message(session_id, "Can the array be empty?")
+        await first.process_message(session_id, "Should I return indices?")
+
+        response = await second.process_message(session_id, "I would use a hash map.")
+        assert response.current_phase != "dsa_interview_error"
+        assert response.session_state.current_problem.id == started.session_state.current_problem.id
+
+        messages = await second.dsa_interviewer.export_conversation(session_id)
+        return [m["data"]["content"] for m in messages if m["type"] == "human"]
+
+    assert asyncio.run(run()) == [
+        "Can the array be empty?",
+        "Should I return indices?",
+        "I would use a hash map."
+    ]
+
+
+def test_next_problem_reaches_the_graph_and_the_journal(build_orchestrator):
+    admission = create_admission_controller(max_concurrent=4)
+    orchestrator = build_orchestrator(admission=admission)
+    agent = orchestrator.dsa_interviewer
+
+    async def run():
+        created = await orchestrator.create_session(InterviewSessionConfig(user_id="alice"))
+        session_id = created.session_id
+        started = await orchestrator.start_interview(session_id)
+        first_problem = started.session_state.current_problem.id
+
+        # A code submission moves to code review, which prefetches the next
+        # problem; the prefetch takes its own admission slot
+        admitted = admission.admitted
+        await orchestrator.process_message(session_id, "```\ndef solve(nums):\n    return nums\n```")
+        await agent.session_contexts.get(session_id).next_opening
+        assert admission.admitted == admitted + 2
+
+        moved = await orchestrator.process_message(session_id, "Let's move on to the next problem")
+        second_problem = moved.session_state.current_problem.id
+        assert second_problem != first_problem
+        assert moved.session_state.problems_completed == [first_problem]
+
+        await orchestrator.process_message(session_id, "Is the input sorted?")
+        snapshot = await agent.conversation_manager.graph.aget_state(
+            RunnableConfig(configurable={"thread_id": session_id}))
+        assert snapshot.values["problem_data"]["id"] == second_problem
+        return first_problem
+
+    first_problem = asyncio.run(run())
+
+    aggregate = orchestrator.problem_database.user_performance.get("alice")
+    assert aggregate.attempted_problems == {first_problem}
+    assert aggregate.completed_problems == set()
@@ -0,0 +1,24 @@
+"""
+Tests for the problem catalog and its loaders
+
+Problem files are written into a temporary directory; an empty directory
+yields the five built-in default problems.
+"""
+
+from app.placement_prep.core.problem_database import (
+    create_problem_database,
+    preload_problem_catalog
+)
+
+
+def test_preload_and_factory_share_the_configured_directory(tmp_path, monkeypatch, write_problem):
+    write_problem("climbing-stairs")
+    monkeypatch.setenv("PROBLEM_DATA_DIRECTORY", str(tmp_path / "problems"))
+
+    preloaded = preload_problem_catalog(freeze_gc=False)
+    database = create_problem_database(
+        performance_journal_path=str(tmp_path / "journal.jsonl"),
+        vector_index_directory=None)
+
+    assert database.shared_catalog is preloaded
+    assert list(database.catalog.records) == ["climbing-stairs"]
@@ -0,0 +1,78 @@
+"""
+Tests for similar-problem retrieval through the local vector index
+"""
+
+import pytest
+
+from app.placement_prep.core.problem_database import Problem
+from app.placement_prep.core.problem_embeddings import ProblemVectorIndex, catalog_fingerprint
+
+PROBLEMS = {
+    "reverse-linked-list": ("Reverse Linked List", "linked_list",
+                            "Reverse a singly linked list by rewiring each node pointer."),
+    "reverse-linked-list-ii": ("Reverse Linked List II", "linked_list",
+                               "Reverse the linked list nodes between two positions using node pointers."),
+    "maximum-depth-of-binary-tree": ("Maximum Depth of Binary Tree", "tree",
+                                     "Return the maximum depth of a binary tree from root to leaf."),
+    "minimum-depth-of-binary-tree": ("Minimum Depth of Binary Tree", "tree",
+                                     "Return the minimum depth of a binary tree from root to nearest leaf."),
+    "coin-change": ("Coin Change", "dynamic_programming",
+                    "Fewest coins that make up an amount of money."),
+}
+
+
+@pytest.fixture
+def vector_database(tmp_path, write_problem, problem_database):
+    for problem_id, (title, category, description) in PROBLEMS.items():
+        write_problem(problem_id, title=title, category=category, description=description)
+    write_problem("coin-change-ii", title="Coin Change II", category="dynamic_programming",
+                  description="Number of coin combinations for an amount.",
+                  similar_problems=["maximum-depth-of-binary-tree"])
+
+    def build():
+        database = problem_database(vector_index_directory=str(tmp_path / "vectors"))
+        database.prepare_vector_index()
+        return database
+
+    return build
+
+
+def test_nearest_neighbours_share_vocabulary(vector_database):
+    database = vector_database()
+
+    assert [r.id for r in database.similar("reverse-linked-list", 1)] == ["reverse-linked-list-ii"]
+    assert [r.id for r in database.similar("minimum-depth-of-binary-tree", 1)] == [
+        "maximum-depth-of-binary-tree"]
+    # Curated similar problems come before the embedding neighbours
+    assert [r.id for r in database.similar("coin-change-ii", 2)] == [
+        "maximum-depth-of-binary-tree", "coin-change"]
+    assert database.similar("missing") == []
+
+
+def test_saved_index_is_reused_for_an_unchanged_catalog(tmp_path, vector_database):
+    database = vector_database()
+    fingerprint = catalog_fingerprint(database.records.values())
+    saved = ProblemVectorIndex.load(tmp_path / "vectors", fingerprint)
+    assert saved is not None
+    assert sorted(saved.ids) == sorted(database.records)
+
+    reloaded = vector_database()
+    assert reloaded.vector_index.fingerprint == fingerprint
+
+
+def test_catalog_change_rebuilds_the_index_in_the_background(vector_database):
+    database = vector_database()
+    database.add_problem(Problem(
+        id="reverse-nodes-in-k-group", title="Reverse Nodes in k-Group", slug="reverse-nodes-in-k-group",
+        difficulty="hard", category="linked_list",
+        description="Reverse the nodes of a linked list k node pointers at a time."))
+
+    # Stale: never served and never rebuilt on the caller's thread
+    assert database.vector_index is None
+    database._vector_index_rebuild.join(timeout=30)
+
+    index = database.vector_index
+    assert index is not None
+    assert "reverse-nodes-in-k-group" in index.ids
+    assert "reverse-nodes-in-k-group" in [
+        r.id for r in database.similar("reverse-linked-list-ii", 2)]
@@ -0,0 +1,107 @@
+"""
+Tests for the prerequisite graph and curriculum ordering
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.placement_prep.core.problem_database import ProblemDifficulty
+from app.placement_prep.core.problem_graph import ProblemGraph
+
+
+def _graph(problems, frequency=None):
+    """problems: id -> (difficulty, prerequisites, similar_problems)"""
+    ids = list(problems)
+    records = {
+        problem_id: SimpleNamespace(
+            difficulty=ProblemDifficulty(difficulty),
+            prerequisites=prerequisites,
+            similar_problems=similar)
+        for problem_id, (difficulty, prerequisites, similar) in problems.items()
+    }
+    frequency = np.asarray(
+        [(frequency or {}).get(problem_id, 0.0) for problem_id in ids], dtype=np.float64)
+    return ProblemGraph.build(ids, records, frequency)
+
+
+def _positions(graph):
+    return {graph.ids[row]: position for position, row in enumerate(graph.order)}
+
+
+def _parents(graph):
+    return {graph.ids[row]: [graph.ids[p] for p in parents]
+            for row, parents in enumerate(graph.parents)}
+
+
+def _mask(graph, problem_ids):
+    mask = np.zeros(len(graph.ids), dtype=bool)
+    mask[[graph.rows[p] for p in problem_ids]] = True
+    return mask
+
+
+def test_topological_order_levels_and_closure():
+    graph = _graph({
+        "merge-sorted": ("medium", ["arrays", "pointers"], []),
+        "pointers": ("easy", ["arrays"], []),
+        "arrays": ("easy", [], []),
+        "hashing": ("easy", ["arrays", "not-in-catalog"], []),
+        "strings": ("easy", [], []),
+    }, frequency={"strings": 0.9, "pointers": 0.2, "hashing": 0.8})
+
+    positions = _positions(graph)
+    assert len(positions) == 5
+    for child, parents in _parents(graph).items():
+        assert all(positions[parent] < positions[child] for parent in parents)
+    levels = {graph.ids[row]: int(level) for row, level in enumerate(graph.levels)}
+    assert levels == {"arrays": 0, "strings": 0, "pointers": 1, "hashing": 1, "merge-sorted": 2}
+    assert sorted(graph.all_prerequisites("merge-sorted")) == ["arrays", "pointers"]
+    assert graph.cyclic_ids == []
+
+    solved = _mask(graph, ["arrays"])
+    # Level first, then frequency
+    assert [graph.ids[r] for r in graph.next_eligible(solved)] == ["strings", "hashing", "pointers"]
+    assert graph.missing_prerequisites("merge-sorted", solved) == ["pointers"]
+
+
+def test_hard_cycle_is_broken_and_reported():
+    graph = _graph({
+        "a": ("easy", ["c"], []),
+        "b": ("easy", ["a"], []),
+        "c": ("easy", ["b"], []),
+        "d": ("medium", ["a"], []),
+        "e": ("easy", [], []),
+    })
+
+    assert sorted(graph.cyclic_ids) == ["a", "b", "c"]
+    assert len(graph.order) == 5
+    # Only the edges inside the cycle are dropped
+    assert _parents(graph) == {"a": [], "b": [], "c": [], "d": ["a"], "e": []}
+    assert _positions(graph)["a"] < _positions(graph)["d"]
+    assert graph.get_stats()["cyclic_problems"] == 3
+
+
+def test_soft_similar_edges_give_way_to_prerequisites():
+    # two-sum-ii lists the easier two-sum as similar (soft: two-sum first),
+    # but two-sum declares two-sum-ii as a hard prerequisite
+    graph = _graph({
+        "two-sum": ("easy", ["two-sum-ii"], ["two-sum-ii"]),
+        "two-sum-ii": ("medium", [], ["two-sum"]),
+        "three-sum": ("hard", [], ["two-sum-ii"]),
+    })
+
+    assert graph.cyclic_ids == []
+    positions = _positions(graph)
+    assert positions["two-sum-ii"] < positions["two-sum"]
+    # Soft edges outside the cycle stay
+    assert _parents(graph)["three-sum"] == ["two-sum-ii"]
+
+
+def test_catalog_graph_is_built_from_problem_files(write_problem, problem_database):
+    write_problem("arrays")
+    write_problem("pointers", prerequisites=["arrays"])
+    write_problem("merge-sorted", difficulty="medium", prerequisites=["pointers"])
+
+    graph = problem_database().catalog.graph
+    assert sorted(graph.all_prerequisites("merge-sorted")) == ["arrays", "pointers"]
+    assert graph.get_stats()["levels"] == 3
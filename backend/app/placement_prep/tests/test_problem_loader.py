@@ -0,0 +1,45 @@
+"""
+Tests for the parallel problem loader
+
+A bad file must be reported on its own and skipped, whether the directory
+is loaded sequentially or on the thread and process pools.
+"""
+
+import pytest
+
+from app.placement_prep.core.problem_loader import ParallelProblemLoader
+
+
+@pytest.fixture
+def mixed_directory(tmp_path, write_problem):
+    write_problem("two-sum")
+    write_problem("climbing-stairs")
+    write_problem("valid-parentheses")
+    write_problem("bad-difficulty", difficulty="impossible")
+    data_path = tmp_path / "problems"
+    (data_path / "truncated.json").write_text('{"id": "truncated", "title": ')
+    (data_path / "notes.txt").write_text("not a problem")
+    return data_path
+
+
+@pytest.mark.parametrize("loader", [
+    ParallelProblemLoader(parallel_threshold=1000),
+    ParallelProblemLoader(max_threads=4, max_processes=2, chunk_size=1, parallel_threshold=1),
+], ids=["sequential", "parallel"])
+def test_bad_files_are_reported_and_skipped(mixed_directory, loader):
+    result = loader.load_directory(mixed_directory)
+
+    assert sorted(p.id for p in result.problems) == [
+        "climbing-stairs", "two-sum", "valid-parentheses"]
+    errors = {error.path.rsplit("/", 1)[-1]: error.error for error in result.errors}
+    assert sorted(errors) == ["bad-difficulty.json", "truncated.json"]
+    assert errors["truncated.json"].startswith("JSONDecodeError")
+    assert errors["bad-difficulty.json"].startswith("ValidationError")
+
+
+def test_database_loads_the_good_files_and_keeps_the_errors(mixed_directory, problem_database):
+    database = problem_database()
+
+    assert sorted(database.catalog.records) == ["climbing-stairs", "two-sum", "valid-parentheses"]
+    assert sorted(e.path.rsplit("/", 1)[-1] for e in database.load_errors) == [
+        "bad-difficulty.json", "truncated.json"]
@@ -0,0 +1,139 @@
+"""
+Tests for the MongoDB problem source
+
+An in-memory collection stands in for DSA_Problems.Leetcode. It evaluates
+the _id / updated_at watermark queries the source issues, so refreshes
+only see documents that were inserted or updated after the last fetch.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from app.placement_prep.core import problem_database as problem_database_module
+from app.placement_prep.core.problem_database import (
+    CompanyTag,
+    ProblemCategory,
+    ProblemDifficulty,
+    create_problem_database
+)
+from app.placement_prep.core.problem_mongo_source import MongoProblemSource, document_to_problem
+
+START = datetime(2025, 1, 1)
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, field, direction):
+        return iter(sorted(self.documents, key=lambda d: d[field], reverse=direction < 0))
+
+
+class FakeCollection:
+    def __init__(self):
+        self.documents = {}
+        self.queries = []
+
+    def upsert(self, document_id, name, updated_at=START, **fields):
+        self.documents[document_id] = {
+            "_id": document_id,
+            "name": name,
+            "link": f"https://leetcode.com/problems/{name.lower().replace(' ', '-')}/",
+            "updated_at": updated_at,
+            **fields
+        }
+
+    def _matches(self, document, query):
+        if "$or" in query:
+            return any(self._matches(document, clause) for clause in query["$or"])
+        return all(document.get(field) is not None and document[field] > condition["$gt"]
+                   for field, condition in query.items())
+
+    def find(self, query, projection, batch_size):
+        self.queries.append(query)
+        return FakeCursor([dict(d) for d in self.documents.values() if self._matches(d, query)])
+
+
+class FakeMongoSource(MongoProblemSource):
+    def __init__(self, collection, **kwargs):
+        super().__init__(connection_url="mongodb://unused", **kwargs)
+        self.collection = collection
+
+    @contextmanager
+    def _collection(self):
+        yield self.collection
+
+
+def test_document_tags_and_difficulty_are_mapped():
+    problem = document_to_problem({
+        "_id": 7,
+        "name": "Top K Frequent Elements",
+        "link": "https://leetcode.com/problems/top-k-frequent-elements/description/",
+        "difficulty": "Medium",
+        "main_tag": "Heap (Priority Queue)",
+        "other_tags": ["Hash Table", "Bucket Sort", None],
+        "companies": ["Meta", "Google", "Unknown Startup", "facebook"],
+        "problem_number": 347
+    })
+
+    assert problem.id == "top-k-frequent-elements"
+    assert problem.difficulty == ProblemDifficulty.MEDIUM
+    assert problem.category == ProblemCategory.HEAP
+    assert problem.subcategories == [ProblemCategory.HASH_TABLE]
+    assert problem.tags == ["heap_priority_queue", "hash_table", "bucket_sort"]
+    assert problem.company_tags == [CompanyTag.FACEBOOK, CompanyTag.GOOGLE]
+    assert problem.leetcode_id == 347
+
+    untagged = document_to_problem({"_id": 8, "name": "Mystery", "difficulty": "Insane"})
+    assert untagged.category == ProblemCategory.ARRAY
+    assert untagged.difficulty == ProblemDifficulty.MEDIUM
+    assert untagged.slug == "mystery"
+
+
+def test_refresh_fetches_only_documents_past_the_watermarks(tmp_path):
+    collection = FakeCollection()
+    collection.upsert(1, "Two Sum", difficulty="Easy")
+    collection.upsert(2, "Valid Parentheses", difficulty="Easy")
+    cache_path = tmp_path / ".leetcode.cache"
+
+    source = FakeMongoSource(collection, cache_path=cache_path)
+    assert {p.id for p in source.load()} == {"two-sum", "valid-parentheses"}
+    assert collection.queries == [{}]
+
+    collection.upsert(1, "Two Sum", difficulty="Hard", updated_at=START + timedelta(days=1))
+    collection.upsert(3, "Climbing Stairs", difficulty="Easy")
+    changed = source.refresh()
+    assert sorted(p.id for p in changed) == ["climbing-stairs", "two-sum"]
+    assert collection.queries[-1] == {"$or": [
+        {"_id": {"$gt": 2}}, {"updated_at": {"$gt": START}}]}
+    assert source.refresh() == []
+
+    # A new process resumes from the cached watermarks
+    restarted = FakeMongoSource(collection, cache_path=cache_path)
+    problems = {p.id: p for p in restarted.load()}
+    assert len(problems) == 3
+    assert problems["two-sum"].difficulty == ProblemDifficulty.HARD
+    assert collection.queries[-1] == {"$or": [
+        {"_id": {"$gt": 3}}, {"updated_at": {"$gt": START + timedelta(days=1)}}]}
+
+
+def test_refresh_from_source_publishes_a_new_catalog_version(tmp_path, monkeypatch):
+    collection = FakeCollection()
+    collection.upsert(1, "Two Sum", difficulty="Easy")
+    monkeypatch.setattr(
+        problem_database_module, "create_mongo_source",
+        lambda config: FakeMongoSource(
+            collection, cache_path=problem_database_module._mongo_cache_path(config)))
+
+    database = create_problem_database(
+        str(tmp_path / "problems"), shared=False, source="mongo",
+        performance_journal_path=str(tmp_path / "journal.jsonl"),
+        vector_index_directory=None)
+    version = database.catalog.version
+    assert list(database.catalog.records) == ["two-sum"]
+
+    collection.upsert(2, "Valid Parentheses", difficulty="Easy")
+    assert database.refresh_from_source() == 1
+    assert database.catalog.version > version
+    assert database.get_problem("valid-parentheses").difficulty == ProblemDifficulty.EASY
+    assert database.refresh_from_source() == 0
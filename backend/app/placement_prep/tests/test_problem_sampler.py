@@ -0,0 +1,103 @@
+"""
+Tests for weighted problem sampling
+
+Draws use a seeded random source, and the observed shares are compared
+with the configured distribution using a tolerance of a few percent.
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from app.placement_prep.core.problem_database import ProblemCategory, ProblemDifficulty
+from app.placement_prep.core.problem_sampler import AliasTable
+
+DRAWS = 20000
+
+
+@pytest.fixture
+def sampling_database(write_problem, problem_database):
+    for difficulty in ("easy", "medium", "hard"):
+        write_problem(f"{difficulty}-array", difficulty=difficulty, frequency=0.9)
+        write_problem(f"{difficulty}-tree", difficulty=difficulty, category="tree", frequency=0.1)
+
+    def build(**config):
+        database = problem_database(**config)
+        database._rng = random.Random(7)
+        return database
+
+    return build
+
+
+def _shares(draws):
+    counts = Counter(draws)
+    return {key: count / len(draws) for key, count in counts.items()}
+
+
+def test_alias_table_follows_its_weights():
+    table = AliasTable([10, 20, 30], [1.0, 2.0, 7.0])
+    rng = random.Random(3)
+    shares = _shares([table.draw(rng) for _ in range(DRAWS)])
+
+    assert shares == pytest.approx({10: 0.1, 20: 0.2, 30: 0.7}, abs=0.02)
+    assert len(AliasTable([], [])) == 0
+
+
+def test_draws_follow_the_difficulty_distribution_and_frequency(sampling_database):
+    database = sampling_database()
+    draws = [database.sample_problem() for _ in range(DRAWS)]
+
+    difficulty_shares = _shares([r.difficulty.value for r in draws])
+    assert difficulty_shares == pytest.approx(
+        {"easy": 0.3, "medium": 0.5, "hard": 0.2}, abs=0.02)
+    # Within a difficulty, problems are weighted by frequency
+    easy_shares = _shares([r.id for r in draws if r.difficulty == ProblemDifficulty.EASY])
+    assert easy_shares == pytest.approx({"easy-array": 0.9, "easy-tree": 0.1}, abs=0.03)
+
+
+def test_random_algorithm_ignores_frequency(sampling_database):
+    database = sampling_database(recommendation_algorithm="random")
+    draws = [database.sample_problem(difficulties=[ProblemDifficulty.HARD]) for _ in range(DRAWS)]
+
+    assert _shares([r.id for r in draws]) == pytest.approx(
+        {"hard-array": 0.5, "hard-tree": 0.5}, abs=0.02)
+
+
+def test_filters_are_honoured(sampling_database):
+    database = sampling_database()
+    draws = {
+        database.sample_problem(
+            difficulties=[ProblemDifficulty.EASY, ProblemDifficulty.MEDIUM],
+            categories=[ProblemCategory.TREE]).id
+        for _ in range(500)
+    }
+    assert draws == {"easy-tree", "medium-tree"}
+
+
+def test_solved_and_excluded_problems_are_never_drawn(sampling_database):
+    database = sampling_database()
+    for problem_id in ("easy-array", "medium-array", "hard-array", "hard-tree"):
+        database.user_performance.record_attempt("alice", problem_id, "array", True, 60.0)
+    database.user_performance.record_attempt("alice", "medium-tree", "tree", False, 60.0)
+
+    draws = {database.sample_problem(user_id="alice").id for _ in range(500)}
+    # An unsolved attempt does not exclude a problem
+    assert draws == {"easy-tree", "medium-tree"}
+
+    # Every remaining candidate excluded: the rejection fallback finds nothing
+    assert database.sample_problem(
+        user_id="alice", exclude_ids=["easy-tree", "medium-tree"]) is None
+    # Other users are unaffected
+    assert database.sample_problem(
+        user_id="bob", difficulties=[ProblemDifficulty.HARD]).id in {"hard-array", "hard-tree"}
+
+
+def test_sequential_algorithm_skips_solved_problems(sampling_database):
+    database = sampling_database(recommendation_algorithm="sequential")
+    first = database.sample_problem(difficulties=[ProblemDifficulty.EASY])
+    assert first.id == "easy-array"
+
+    database.user_performance.record_attempt("alice", "easy-array", "array", True, 60.0)
+    assert database.sample_problem(
+        difficulties=[ProblemDifficulty.EASY], user_id="alice").id == "easy-tree"
@@ -0,0 +1,55 @@
+"""
+Tests for the compiled problem snapshot
+
+The snapshot must be reused while the JSON sources are unchanged and
+rebuilt as soon as one of them changes.
+"""
+
+import os
+
+from app.placement_prep.core.problem_snapshot import ProblemSnapshot
+
+
+def _touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_snapshot_is_rebuilt_when_a_source_file_changes(tmp_path, write_problem, problem_database):
+    data_path = tmp_path / "problems"
+    write_problem("two-sum")
+    write_problem("climbing-stairs", title="Climbing Stairs")
+    assert problem_database().get_problem("climbing-stairs").title == "Climbing Stairs"
+    assert ProblemSnapshot(data_path).load() is not None
+
+    _touch(write_problem("climbing-stairs", title="Climbing Stairs II"))
+    assert ProblemSnapshot(data_path).load() is None
+
+    assert problem_database().get_problem("climbing-stairs").title == "Climbing Stairs II"
+    assert ProblemSnapshot(data_path).load() is not None
+
+
+def test_snapshot_survives_a_touch_without_content_changes(tmp_path, write_problem, problem_database):
+    data_path = tmp_path / "problems"
+    path = write_problem("two-sum")
+    problem_database()
+
+    _touch(path)
+    snapshot = ProblemSnapshot(data_path)
+    loaded = snapshot.load()
+    assert loaded is not None
+    records, _ = loaded
+    assert list(records) == ["two-sum"]
+    # The refreshed stats match, so the next start skips hashing
+    assert snapshot._read_payload().stat_fingerprint == snapshot._stat_fingerprint()
+
+
+def test_added_and_removed_files_invalidate_the_snapshot(tmp_path, write_problem, problem_database):
+    write_problem("two-sum")
+    removed = write_problem("climbing-stairs")
+    problem_database()
+
+    write_problem("valid-parentheses")
+    removed.unlink()
+    assert ProblemSnapshot(tmp_path / "problems").load() is None
+    assert sorted(problem_database().catalog.records) == ["two-sum", "valid-parentheses"]
@@ -0,0 +1,70 @@
+"""
+Tests for the problem body store and its LRU decode cache
+"""
+
+from app.placement_prep.core.problem_database import Problem
+from app.placement_prep.core.problem_store import ProblemBodyStore, write_body_file
+
+
+def _problem(problem_id, title=None):
+    return Problem(
+        id=problem_id, title=title or problem_id, slug=problem_id,
+        difficulty="easy", category="array", description=f"Solve {problem_id}.")
+
+
+def test_lru_keeps_the_most_recently_read_bodies():
+    store = ProblemBodyStore.from_problems([_problem(p) for p in "abc"], max_cached=2)
+
+    assert store.get("a").id == "a"
+    assert store.get("b").id == "b"
+    assert store.get("a") is store.get("a")
+    assert store.get("c").id == "c"  # Evicts b, the least recently read
+
+    assert (store.hits, store.misses) == (2, 3)
+    store.get("a")
+    assert store.hits == 3
+    store.get("b")
+    assert store.misses == 4
+    stats = store.get_stats()
+    assert stats["cached_problems"] == 2
+    assert stats["stored_problems"] == 3
+    assert store.get("missing") is None
+
+
+def test_uncached_reads_leave_the_lru_alone():
+    store = ProblemBodyStore.from_problems([_problem("a"), _problem("b")], max_cached=1)
+    store.get("a")
+
+    assert store.get("b", use_cache=False).id == "b"
+    assert store.get_stats()["cached_problems"] == 1
+    assert store.get("a") is store.get("a")
+
+
+def test_memory_mapped_file_and_overlay(tmp_path):
+    problems = [_problem("a", "Alpha"), _problem("b", "Beta")]
+    offsets, _ = write_body_file(tmp_path / "bodies", problems)
+    store = ProblemBodyStore.open_file(tmp_path / "bodies", offsets, max_cached=4)
+    assert store.get_stats()["memory_mapped"]
+    assert store.get("b").title == "Beta"
+
+    updated = store.with_problems([_problem("a", "Alpha II"), _problem("c", "Gamma")])
+    assert updated.get("a").title == "Alpha II"
+    assert updated.get("b").title == "Beta"
+    assert updated.get("c").title == "Gamma"
+    # Readers of the older store keep their view
+    assert store.get("a").title == "Alpha"
+    assert "c" not in store
+    assert len(updated) == 3
+
+
+def test_database_reads_bodies_through_the_snapshot_store(write_problem, problem_database):
+    for problem_id in ("two-sum", "climbing-stairs", "valid-parentheses"):
+        write_problem(problem_id)
+    problem_database()
+
+    database = problem_database(body_cache_size=1)
+    body_store = database.catalog.body_store
+    assert body_store.get_stats()["memory_mapped"]
+    assert database.get_problem("climbing-stairs").description == "Solve climbing-stairs."
+    database.get_problem("two-sum")
+    assert body_store.get_stats()["cached_problems"] == 1
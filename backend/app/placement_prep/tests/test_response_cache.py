@@ -0,0 +1,39 @@
+"""
+Tests for the response cache on the interview message path
+"""
+
+import asyncio
+
+from app.placement_prep.core.base_agent import AgentState
+from app.placement_prep.core.response_cache import ResponseCache
+
+
+def test_first_hint_is_shared_through_process_message(build_orchestrator, fake_llm):
+    cache = ResponseCache()
+    agent = build_orchestrator(cache=cache).dsa_interviewer
+
+    async def ask(session_id, message):
+        state = AgentState(session_id=session_id, user_id=session_id, current_step="discussion")
+        return await agent.process_message(message, state)
+
+    async def run():
+        for session_id in ("first", "second"):
+            await agent.initialize_session(session_id, session_id, problem_id="two-sum")
+
+        first_hint = await ask("first", "Could I get a hint?")
+        calls = fake_llm.calls
+        second_hint = await ask("second", "Could I get a hint?")
+        # Same problem, same gentle hint, no second LLM call
+        assert second_hint["message"] == first_hint["message"]
+        assert fake_llm.calls == calls
+        assert cache.get_stats()["by_type"]["hint_provision"]["memory_hits"] == 1
+
+        # The hint count survives between turns, so the next hint is a fresh
+        # moderate one rather than the cached gentle one
+        follow_up = await ask("second", "Another hint please")
+        assert follow_up["message"] != first_hint["message"]
+        assert fake_llm.calls == calls + 1
+        assert follow_up["conversation_metadata"]["hints_remaining"] == 1
+        assert agent.session_contexts.get("second").conversation_state["hints_given"] == 2
+
+    asyncio.run(run())
@@ -0,0 +1,146 @@
+"""
+Tests for the Redis session store's connection pool
+
+A small RESP server stands in for Redis. It keeps string keys, honours
+WATCH/MULTI/EXEC, and can be told to answer a command with an error reply,
+to never answer it, or to abort the next EXEC as if another client had
+written the watched key.
+"""
+
+import asyncio
+
+import pytest
+
+from app.placement_prep.core.session_store import (
+    RedisSessionStore,
+    SessionStoreError,
+    SessionVersionConflict
+)
+
+
+class RespStandIn:
+    """Just enough of Redis for RedisSessionStore"""
+
+    def __init__(self):
+        self.data = {}
+        self.error_commands = set()
+        self.stall_commands = set()
+        self.abort_next_exec = False
+        self.connections = 0
+
+    async def _read_command(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _run(self, args):
+        command = args[0].upper()
+        if command == b"GET":
+            value = self.data.get(args[1])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+        if command == b"SET":
+            if b"NX" in [arg.upper() for arg in args[3:]] and args[1] in self.data:
+                return b"$-1\r\n"
+            self.data[args[1]] = args[2]
+            return b"+OK\r\n"
+        if command == b"DEL":
+            return b":%d\r\n" % (self.data.pop(args[1], None) is not None)
+        return b"-ERR unknown command\r\n"
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        queued = None
+        while True:
+            args = await self._read_command(reader)
+            if args is None:
+                break
+            command = args[0].upper()
+            if command in self.stall_commands:
+                await asyncio.sleep(3600)
+            if command in self.error_commands:
+                reply = b"-WRONGTYPE Operation against a key holding the wrong kind of value\r\n"
+            elif command in (b"WATCH", b"UNWATCH"):
+                reply = b"+OK\r\n"
+            elif command == b"MULTI":
+                queued, reply = [], b"+OK\r\n"
+            elif command == b"EXEC":
+                if self.abort_next_exec:
+                    self.abort_next_exec = False
+                    reply = b"*-1\r\n"
+                else:
+                    reply = b"*%d\r\n" % len(queued) + b"".join(self._run(a) for a in queued)
+                queued = None
+            elif queued is not None:
+                queued.append(args)
+                reply = b"+QUEUED\r\n"
+            else:
+                reply = self._run(args)
+            writer.write(reply)
+            await writer.drain()
+        writer.close()
+
+
+async def _with_store(scenario):
+    stand_in = RespStandIn()
+    server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    store = RedisSessionStore(host="127.0.0.1", port=port, pool_size=1)
+    try:
+        await asyncio.wait_for(scenario(store, stand_in), timeout=10)
+    finally:
+        await store.close()
+        server.close()
+
+
+def test_error_reply_does_not_leak_the_pool_slot():
+    async def scenario(store, stand_in):
+        stand_in.error_commands.add(b"GET")
+        for _ in range(3):
+            with pytest.raises(SessionStoreError):
+                await store.get("s1")
+
+        stand_in.error_commands.clear()
+        assert await store.create("s1", {"turn": 1}) == 1
+        assert (await store.get("s1")).version == 1
+
+    asyncio.run(_with_store(scenario))
+
+
+def test_cancelled_call_frees_the_slot_and_drops_the_connection():
+    async def scenario(store, stand_in):
+        await store.create("s1", {"turn": 1})
+        stand_in.stall_commands.add(b"MULTI")
+        pending = asyncio.create_task(store.save("s1", {"turn": 2}, expected_version=1))
+        await asyncio.sleep(0.2)
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+
+        # The stalled connection is closed rather than pooled mid-reply, so
+        # the next call opens a fresh one
+        stand_in.stall_commands.clear()
+        assert await store.save("s1", {"turn": 2}, expected_version=1) == 2
+        assert stand_in.connections == 2
+
+    asyncio.run(_with_store(scenario))
+
+
+def test_watch_conflict_raises_and_keeps_the_connection():
+    async def scenario(store, stand_in):
+        await store.create("s1", {"turn": 1})
+        stand_in.abort_next_exec = True
+        with pytest.raises(SessionVersionConflict):
+            await store.save("s1", {"turn": 2}, expected_version=1)
+        with pytest.raises(SessionVersionConflict):
+            await store.save("s1", {"turn": 2}, expected_version=5)
+        assert store.conflicts == 2
+
+        assert await store.save("s1", {"turn": 2}, expected_version=1) == 2
+        assert stand_in.connections == 1
+
+    asyncio.run(_with_store(scenario))
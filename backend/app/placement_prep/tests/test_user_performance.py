@@ -0,0 +1,81 @@
+"""
+Tests for the shared user performance journal
+
+Two UserPerformanceStore instances on one path stand in for two worker
+processes appending to the same journal.
+"""
+
+import json
+
+from app.placement_prep.core.user_performance import UserPerformanceStore
+
+
+def _record(store, user_id, problem_id, solved=True):
+    store.record_attempt(user_id, problem_id, "array", solved, 60.0)
+
+
+def test_compaction_keeps_other_workers_attempts(tmp_path):
+    journal = tmp_path / "user_performance.jsonl"
+    first = UserPerformanceStore(journal)
+    second = UserPerformanceStore(journal)
+
+    _record(first, "alice", "two-sum")
+    _record(second, "bob", "valid-parentheses")
+    _record(second, "alice", "add-two-numbers", solved=False)
+    first.compact()
+
+    reloaded = UserPerformanceStore(journal)
+    assert reloaded.get("alice").total_attempts == 2
+    assert reloaded.get("bob").completed_problems == {"valid-parentheses"}
+
+    # The other worker follows the compacted file instead of appending to
+    # its own stale view
+    _record(second, "bob", "two-sum")
+    assert second.get("alice").total_attempts == 2
+    assert UserPerformanceStore(journal).get("bob").total_attempts == 2
+
+
+def test_seed_does_not_replace_recorded_attempts(tmp_path):
+    journal = tmp_path / "user_performance.jsonl"
+    recorder = UserPerformanceStore(journal)
+    seeder = UserPerformanceStore(journal)
+
+    _record(recorder, "alice", "two-sum")
+    aggregate = seeder.seed("alice", [
+        {"problem_id": "valid-parentheses", "solution_correct": True}
+    ])
+
+    assert aggregate.completed_problems == {"two-sum"}
+    assert UserPerformanceStore(journal).get("alice").total_attempts == 1
+
+
+def test_seed_is_replayed_for_new_users(tmp_path):
+    journal = tmp_path / "user_performance.jsonl"
+    UserPerformanceStore(journal).seed("carol", [
+        {"problem_id": "two-sum", "solution_correct": True},
+        {"problem_id": "valid-parentheses", "solution_correct": False}
+    ])
+
+    types = [json.loads(line)["type"] for line in journal.read_text().splitlines()]
+    assert types == ["seed"]
+    aggregate = UserPerformanceStore(journal).get("carol")
+    assert aggregate.total_attempts == 2
+    assert aggregate.completed_problems == {"two-sum"}
+
+
+def test_partial_line_is_left_for_the_next_sync(tmp_path):
+    journal = tmp_path / "user_performance.jsonl"
+    store = UserPerformanceStore(journal)
+    _record(store, "alice", "two-sum")
+
+    line = json.dumps({"type": "attempt", "user_id": "alice", "problem_id": "add-two-numbers",
+                       "solution_correct": True, "time_taken": 1.0})
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write(line[:10])
+    store.refresh()
+    assert store.get("alice").total_attempts == 1
+
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write(line[10:] + "\n")
+    store.refresh()
+    assert store.get("alice").completed_problems == {"two-sum", "add-two-numbers"}
@@ -0,0 +1,116 @@
+"""
+Tests for write-behind persistence of interview sessions and transcripts
+
+A fake repository stores writes in memory. It can fail its next calls
+with a given error, or reject any batch that contains a given message.
+"""
+
+import asyncio
+
+from pymongo.errors import AutoReconnect, OperationFailure
+
+from database import InterviewMessageDocument, WriteBehindQueue
+
+
+class FakeRepository:
+    def __init__(self):
+        self.sessions = {}
+        self.messages = []
+        self.failures = []
+        self.rejected_message_ids = set()
+        self.session_batches = []
+
+    async def upsert_sessions(self, updates):
+        if not updates:
+            return 0
+        self.session_batches.append({sid: dict(fields) for sid, fields in updates.items()})
+        if self.failures:
+            raise self.failures.pop(0)
+        for session_id, fields in updates.items():
+            self.sessions.setdefault(session_id, {}).update(fields)
+        return len(updates)
+
+    async def insert_messages(self, messages):
+        if not messages:
+            return 0
+        if any(m.message_id in self.rejected_message_ids for m in messages):
+            raise OperationFailure("Document failed validation", code=121)
+        self.messages.extend(m.message_id for m in messages)
+        return len(messages)
+
+
+def _message(message_id, session_id="s1"):
+    return InterviewMessageDocument(
+        message_id=message_id, session_id=session_id,
+        sender="user", message_type="text", content=message_id)
+
+
+def test_unreachable_database_requeues_and_coalesces():
+    async def scenario():
+        repository = FakeRepository()
+        queue = WriteBehindQueue(repository, max_batch_attempts=2)
+        queue.enqueue_session_update("s1", {"phase": "coding"})
+        queue.enqueue_message(_message("m1"))
+
+        repository.failures = [AutoReconnect("connection reset")] * 5
+        for _ in range(5):
+            await queue.flush()
+        assert queue.failed_flushes == 5
+        assert queue.depth == 2
+
+        # Newer fields merge into the requeued update; no attempt cap applies
+        queue.enqueue_session_update("s1", {"phase": "review", "score": 7})
+        queue.enqueue_message(_message("m2"))
+        await queue.flush()
+
+        assert repository.sessions == {"s1": {"phase": "review", "score": 7}}
+        assert repository.session_batches[-1] == {"s1": {"phase": "review", "score": 7}}
+        assert repository.messages == ["m1", "m2"]
+        assert queue.discarded == 0
+        assert queue.depth == 0
+
+    asyncio.run(scenario())
+
+
+def test_rejected_document_is_discarded_after_the_attempt_cap():
+    async def scenario():
+        repository = FakeRepository()
+        repository.rejected_message_ids = {"bad"}
+        queue = WriteBehindQueue(repository, max_batch_attempts=2)
+        for message_id in ("m1", "bad", "m3"):
+            queue.enqueue_message(_message(message_id))
+
+        await queue.flush()
+        await queue.flush()
+        assert repository.messages == []
+        assert queue.depth == 3
+
+        # Written one at a time: only the rejected message is lost
+        await queue.flush()
+        assert repository.messages == ["m1", "m3"]
+        assert queue.discarded == 1
+        assert queue.depth == 0
+
+        # Later batches are written whole again
+        queue.enqueue_message(_message("m4"))
+        queue.enqueue_message(_message("m5"))
+        await queue.flush()
+        assert repository.messages == ["m1", "m3", "m4", "m5"]
+
+    asyncio.run(scenario())
+
+
+def test_stop_flushes_pending_writes():
+    async def scenario():
+        repository = FakeRepository()
+        queue = WriteBehindQueue(repository, flush_interval_ms=60000)
+        queue.start()
+        queue.enqueue_session_update("s1", {"phase": "coding"})
+        queue.enqueue_message(_message("m1"))
+
+        await asyncio.wait_for(queue.stop(), timeout=5)
+        assert repository.sessions == {"s1": {"phase": "coding"}}
+        assert repository.messages == ["m1"]
+        assert queue.depth == 0
+
+    asyncio.run(scenario())
@@ -10,6 +10,9 @@ from .gemini_chat import (
     create_interview_gemini_chat,
     create_conversation_gemini_chat,
     create_response_gemini_chat,
+    get_shared_gemini_chat,
+    get_gemini_client_registry,
+    get_llm_client_stats,
     get_available_models,
     GEMINI_MODELS
 )
@@ -19,6 +22,9 @@ __all__ = [
     "create_interview_gemini_chat",
     "create_conversation_gemini_chat",
     "create_response_gemini_chat",
+    "get_shared_gemini_chat",
+    "get_gemini_client_registry",
+    "get_llm_client_stats",
     "get_available_models",
     "GEMINI_MODELS"
 ]
@@ -0,0 +1,521 @@
+"""
+LangGraph Checkpointer Utility
+
+Checkpointer selection for the LangGraph workflows, and a MongoDB-backed
+saver for deployments with more than one worker or long-lived sessions.
+
+MongoCheckpointSaver stores the same three kinds of records as LangGraph's
+InMemorySaver: checkpoints (without channel values), channel value blobs
+keyed by (channel, version) so unchanged channels are not rewritten, and
+pending writes. Serialized values are zlib-compressed above a size
+threshold. Only the latest keep_latest checkpoints per thread are kept, and
+a TTL index on updated_at removes abandoned threads. Every put refreshes
+updated_at on all blobs the new checkpoint references, including reused
+ones.
+
+The async API runs on Motor. The sync API runs the same code against the
+underlying pymongo collections.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import asyncio
+import logging
+import os
+import random
+import zlib
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+from langgraph.checkpoint.memory import MemorySaver
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+COMPRESS_THRESHOLD_BYTES = 1024
+
+
+class _SyncCursor:
+    """Motor-style cursor over a pymongo cursor"""
+
+    def __init__(self, cursor: Any):
+        self._cursor = cursor
+
+    def sort(self, *args: Any, **kwargs: Any) -> "_SyncCursor":
+        self._cursor = self._cursor.sort(*args, **kwargs)
+        return self
+
+    def limit(self, count: int) -> "_SyncCursor":
+        self._cursor = self._cursor.limit(count)
+        return self
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        return list(self._cursor)
+
+
+class _SyncCollection:
+    """
+    Motor-style facade over a pymongo collection
+
+    Its coroutines never suspend, so the saver's async code can be run to
+    completion from sync methods without an event loop.
+    """
+
+    def __init__(self, collection: Any):
+        self._collection = collection
+
+    def find(self, *args: Any, **kwargs: Any) -> _SyncCursor:
+        return _SyncCursor(self._collection.find(*args, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._collection, name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return method(*args, **kwargs)
+        return call
+
+
+def _run_sync(coroutine: Any) -> Any:
+    """Drive a coroutine that only awaits _SyncCollection calls"""
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return done.value
+    coroutine.close()
+    raise RuntimeError("Synchronous checkpoint operation tried to suspend")
+
+
+class MongoCheckpointSaver(BaseCheckpointSaver[str]):
+    """
+    LangGraph checkpoint saver on MongoDB
+
+    Several graphs can share the collections; each saver is scoped by a
+    graph name so that equal thread ids in different graphs do not collide.
+    """
+
+    def __init__(
+        self,
+        database: Any,
+        graph: str,
+        keep_latest: int = 3,
+        ttl_seconds: Optional[int] = 7 * 24 * 3600,
+        collection_prefix: str = "langgraph_",
+        serde: Any = None
+    ):
+        super().__init__(serde=serde)
+        self.graph = graph
+        self.keep_latest = max(1, keep_latest)
+        self.ttl_seconds = ttl_seconds
+        self._collections = (
+            database[f"{collection_prefix}checkpoints"],
+            database[f"{collection_prefix}checkpoint_blobs"],
+            database[f"{collection_prefix}checkpoint_writes"],
+        )
+        # Motor objects wrap the pymongo ones used by the sync API
+        self._sync_collections = tuple(
+            _SyncCollection(collection.delegate) for collection in self._collections)
+        self._indexes_ready = False
+        self._background: Set[asyncio.Task] = set()
+
+    # Serialization
+
+    def _pack(self, value: Any) -> Dict[str, Any]:
+        type_, data = self.serde.dumps_typed(value)
+        compressed = len(data) >= COMPRESS_THRESHOLD_BYTES
+        if compressed:
+            data = zlib.compress(data, 6)
+        return {"type": type_, "data": data, "zlib": compressed}
+
+    def _unpack(self, packed: Dict[str, Any]) -> Any:
+        data = bytes(packed["data"])
+        if packed.get("zlib"):
+            data = zlib.decompress(data)
+        return self.serde.loads_typed((packed["type"], data))
+
+    def _scope(self, thread_id: str, checkpoint_ns: str) -> Dict[str, Any]:
+        return {"graph": self.graph, "thread_id": thread_id, "checkpoint_ns": checkpoint_ns}
+
+    @staticmethod
+    def _config(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> RunnableConfig:
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+            }
+        }
+
+    # Shared implementation, run against Motor or pymongo collections
+
+    async def _ensure_indexes(self, collections: Tuple[Any, Any, Any]) -> None:
+        if self._indexes_ready:
+            return
+        checkpoints, blobs, writes = collections
+        scope = [("graph", ASCENDING), ("thread_id", ASCENDING), ("checkpoint_ns", ASCENDING)]
+        await checkpoints.create_index(scope + [("checkpoint_id", DESCENDING)], unique=True)
+        await blobs.create_index(scope + [("channel", ASCENDING), ("version", ASCENDING)], unique=True)
+        await writes.create_index(
+            scope + [("checkpoint_id", ASCENDING), ("task_id", ASCENDING), ("idx", ASCENDING)],
+            unique=True)
+        if self.ttl_seconds:
+            for collection in collections:
+                await collection.create_index("updated_at", expireAfterSeconds=self.ttl_seconds)
+        self._indexes_ready = True
+
+    async def _load_tuple(
+        self,
+        collections: Tuple[Any, Any, Any],
+        document: Dict[str, Any]
+    ) -> CheckpointTuple:
+        _, blobs, writes = collections
+        thread_id = document["thread_id"]
+        checkpoint_ns = document["checkpoint_ns"]
+        checkpoint_id = document["checkpoint_id"]
+        scope = self._scope(thread_id, checkpoint_ns)
+
+        checkpoint: Checkpoint = self._unpack(document["checkpoint"])
+        channel_values: Dict[str, Any] = {}
+        versions = checkpoint["channel_versions"]
+        if versions:
+            blob_documents = await blobs.find({
+                **scope,
+                "$or": [{"channel": c, "version": str(v)} for c, v in versions.items()]
+            }).to_list(None)
+            for blob in blob_documents:
+                if blob["value"] is not None:
+                    channel_values[blob["channel"]] = self._unpack(blob["value"])
+
+        write_documents = await writes.find(
+            {**scope, "checkpoint_id": checkpoint_id}).to_list(None)
+        write_documents.sort(
+            key=lambda w: writes_sort_key(w["task_path"], w["task_id"], w["idx"]))
+
+        parent_checkpoint_id = document.get("parent_checkpoint_id")
+        return CheckpointTuple(
+            config=self._config(thread_id, checkpoint_ns, checkpoint_id),
+            checkpoint={**checkpoint, "channel_values": channel_values},
+            metadata=self._unpack(document["metadata"]),
+            parent_config=(
+                self._config(thread_id, checkpoint_ns, parent_checkpoint_id)
+                if parent_checkpoint_id else None
+            ),
+            pending_writes=[
+                (w["task_id"], w["channel"], self._unpack(w["value"])) for w in write_documents
+            ],
+        )
+
+    async def _get_tuple(
+        self,
+        collections: Tuple[Any, Any, Any],
+        config: RunnableConfig
+    ) -> Optional[CheckpointTuple]:
+        checkpoints = collections[0]
+        scope = self._scope(
+            config["configurable"]["thread_id"],
+            config["configurable"].get("checkpoint_ns", ""))
+        if checkpoint_id := get_checkpoint_id(config):
+            document = await checkpoints.find_one({**scope, "checkpoint_id": checkpoint_id})
+        else:
+            found = await checkpoints.find(scope).sort(
+                "checkpoint_id", DESCENDING).limit(1).to_list(1)
+            document = found[0] if found else None
+        if document is None:
+            return None
+        return await self._load_tuple(collections, document)
+
+    async def _list(
+        self,
+        collections: Tuple[Any, Any, Any],
+        config: Optional[RunnableConfig],
+        filter: Optional[Dict[str, Any]],
+        before: Optional[RunnableConfig],
+        limit: Optional[int]
+    ) -> List[CheckpointTuple]:
+        query: Dict[str, Any] = {"graph": self.graph}
+        if config:
+            query["thread_id"] = config["configurable"]["thread_id"]
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                query["checkpoint_ns"] = checkpoint_ns
+            if checkpoint_id := get_checkpoint_id(config):
+                query["checkpoint_id"] = checkpoint_id
+        if before and (before_id := get_checkpoint_id(before)):
+            query.setdefault("checkpoint_id", {})
+            if isinstance(query["checkpoint_id"], dict):
+                query["checkpoint_id"]["$lt"] = before_id
+
+        documents = await collections[0].find(query).sort(
+            [("thread_id", ASCENDING), ("checkpoint_ns", ASCENDING),
+             ("checkpoint_id", DESCENDING)]).to_list(None)
+        results: List[CheckpointTuple] = []
+        for document in documents:
+            if limit is not None and len(results) >= limit:
+                break
+            if filter:
+                metadata = self._unpack(document["metadata"])
+                if not all(metadata.get(k) == v for k, v in filter.items()):
+                    continue
+            results.append(await self._load_tuple(collections, document))
+        return results
+
+    async def _put(
+        self,
+        collections: Tuple[Any, Any, Any],
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        await self._ensure_indexes(collections)
+        checkpoints, blobs, _ = collections
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        scope = self._scope(thread_id, checkpoint_ns)
+        now = datetime.now(timezone.utc)
+
+        stripped = checkpoint.copy()
+        values: Dict[str, Any] = stripped.pop("channel_values")  # type: ignore[misc]
+        operations = [
+            UpdateOne(
+                {**scope, "channel": channel, "version": str(version)},
+                {"$set": {
+                    "value": self._pack(values[channel]) if channel in values else None,
+                    "updated_at": now
+                }},
+                upsert=True
+            )
+            for channel, version in new_versions.items()
+        ]
+        # Unchanged channels reuse an earlier checkpoint's blob; touch it so
+        # the TTL index expires it together with the checkpoints using it
+        operations.extend(
+            UpdateOne(
+                {**scope, "channel": channel, "version": str(version)},
+                {"$set": {"updated_at": now}}
+            )
+            for channel, version in stripped["channel_versions"].items()
+            if channel not in new_versions
+        )
+        if operations:
+            await blobs.bulk_write(operations, ordered=False)
+
+        await checkpoints.replace_one(
+            {**scope, "checkpoint_id": checkpoint["id"]},
+            {
+                **scope,
+                "checkpoint_id": checkpoint["id"],
+                "parent_checkpoint_id": config["configurable"].get("checkpoint_id"),
+                "checkpoint": self._pack(stripped),
+                "metadata": self._pack(get_checkpoint_metadata(config, metadata)),
+                "channel_versions": [[c, str(v)] for c, v in stripped["channel_versions"].items()],
+                "updated_at": now
+            },
+            upsert=True
+        )
+        await self._prune(collections, scope)
+        return self._config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    async def _prune(self, collections: Tuple[Any, Any, Any], scope: Dict[str, Any]) -> None:
+        """Drop all but the latest keep_latest checkpoints of a thread"""
+        checkpoints, blobs, writes = collections
+        documents = await checkpoints.find(
+            scope, {"checkpoint_id": 1, "channel_versions": 1}
+        ).sort("checkpoint_id", DESCENDING).to_list(None)
+        if len(documents) <= self.keep_latest:
+            return
+
+        kept, stale = documents[:self.keep_latest], documents[self.keep_latest:]
+        stale_ids = [d["checkpoint_id"] for d in stale]
+        await checkpoints.delete_many({**scope, "checkpoint_id": {"$in": stale_ids}})
+        await writes.delete_many({**scope, "checkpoint_id": {"$in": stale_ids}})
+
+        # Blobs are shared between checkpoints while a channel is unchanged
+        referenced = {tuple(pair) for d in kept for pair in d.get("channel_versions", [])}
+        await blobs.delete_many({
+            **scope,
+            "$nor": [{"channel": c, "version": v} for c, v in referenced]
+        } if referenced else scope)
+
+    async def _put_writes(
+        self,
+        collections: Tuple[Any, Any, Any],
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str
+    ) -> None:
+        if not writes:
+            return
+        await self._ensure_indexes(collections)
+        scope = self._scope(
+            config["configurable"]["thread_id"],
+            config["configurable"].get("checkpoint_ns", ""))
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        now = datetime.now(timezone.utc)
+
+        operations = []
+        for position, (channel, value) in enumerate(writes):
+            idx = WRITES_IDX_MAP.get(channel, position)
+            fields = {
+                "channel": channel,
+                "value": self._pack(value),
+                "task_path": task_path,
+                "updated_at": now
+            }
+            # Regular writes are written once; special channels overwrite
+            operations.append(UpdateOne(
+                {**scope, "checkpoint_id": checkpoint_id, "task_id": task_id, "idx": idx},
+                {"$setOnInsert": fields} if idx >= 0 else {"$set": fields},
+                upsert=True
+            ))
+        await collections[2].bulk_write(operations, ordered=False)
+
+    async def _delete_thread(self, collections: Tuple[Any, Any, Any], thread_id: str) -> None:
+        query = {"graph": self.graph, "thread_id": thread_id}
+        for collection in collections:
+            await collection.delete_many(query)
+
+    # Async API (Motor)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await self._get_tuple(self._collections, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        for item in await self._list(self._collections, config, filter, before, limit):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await self._put(self._collections, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await self._put_writes(self._collections, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await self._delete_thread(self._collections, thread_id)
+
+    # Sync API (pymongo)
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return _run_sync(self._get_tuple(self._sync_collections, config))
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        yield from _run_sync(self._list(self._sync_collections, config, filter, before, limit))
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return _run_sync(self._put(
+            self._sync_collections, config, checkpoint, metadata, new_versions))
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        _run_sync(self._put_writes(
+            self._sync_collections, config, writes, task_id, task_path))
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete a thread; on the event loop this runs in the background"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _run_sync(self._delete_thread(self._sync_collections, thread_id))
+            return
+        # Session cleanup calls this synchronously from the event loop
+        task = loop.create_task(self.adelete_thread(thread_id))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        # Same version format as InMemorySaver
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+
+# One Motor client per process, shared by every graph's saver
+_mongo_client: Any = None
+
+
+def create_checkpointer(graph: str, backend: Optional[str] = None) -> BaseCheckpointSaver:
+    """
+    Factory function for the checkpointer of one LangGraph workflow
+
+    backend (or LANGGRAPH_CHECKPOINTER) is "memory" (default) or "mongo";
+    the Mongo saver reads MONGODB_URL, LANGGRAPH_CHECKPOINT_KEEP and
+    LANGGRAPH_CHECKPOINT_TTL_SECONDS.
+    """
+    global _mongo_client
+    backend = (backend or os.getenv("LANGGRAPH_CHECKPOINTER", "memory")).lower()
+
+    if backend == "memory":
+        return MemorySaver()
+
+    if backend == "mongo":
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        connection_url = os.getenv("MONGODB_URL")
+        if not connection_url:
+            raise ValueError("MONGODB_URL is required for the mongo checkpointer")
+        if _mongo_client is None:
+            _mongo_client = AsyncIOMotorClient(connection_url)
+        ttl_seconds = int(os.getenv("LANGGRAPH_CHECKPOINT_TTL_SECONDS", str(7 * 24 * 3600)))
+        return MongoCheckpointSaver(
+            _mongo_client[os.getenv("LANGGRAPH_CHECKPOINT_DATABASE", "ai_mock_interview")],
+            graph=graph,
+            keep_latest=int(os.getenv("LANGGRAPH_CHECKPOINT_KEEP", "3")),
+            ttl_seconds=ttl_seconds or None
+        )
+
+    raise ValueError(f"Unknown checkpointer backend: {backend}")
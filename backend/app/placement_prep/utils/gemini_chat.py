@@ -2,7 +2,9 @@
 Gemini Chat Utility
 
 Centralized utility for creating and configuring Google Gemini chat instances
-using LangChain's ChatGoogleGenerativeAI.
+using LangChain's ChatGoogleGenerativeAI. The create_*_gemini_chat helpers
+hand out shared instances from a process-wide registry, one per model and
+parameter set, each with a tuned HTTP connection pool.
 
 Author: AI Mock Interview Platform Team
 Date: July 2025
@@ -10,8 +12,14 @@ Date: July 2025
 
 import os
 import logging
-from typing import Optional, Dict, Any
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple
+
+import httpx
 from langchain_google_genai import ChatGoogleGenerativeAI
+from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +75,156 @@ def create_gemini_chat(
         raise
 
 
+class GeminiPoolConfig(BaseModel):
+    """HTTP connection pool settings for each shared Gemini client"""
+    # Kept in line with the admission controller's default concurrency, so a
+    # full burst of LLM calls reuses warm connections instead of opening new ones
+    max_connections: int = Field(default=64, ge=1)
+    max_keepalive_connections: int = Field(default=32, ge=0)
+    keepalive_expiry_seconds: float = Field(default=60.0, gt=0)
+
+    def client_args(self) -> Dict[str, Any]:
+        """httpx client arguments for ChatGoogleGenerativeAI(client_args=...)"""
+        return {"limits": httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry_seconds
+        )}
+
+
+@dataclass
+class _RegisteredClient:
+    chat: ChatGoogleGenerativeAI
+    uses: int = 1
+
+
+class GeminiClientRegistry:
+    """
+    Shared ChatGoogleGenerativeAI instances keyed by model and parameters
+
+    Components asking for the same model and parameters get the same
+    instance, so the process holds one HTTP connection pool per distinct
+    configuration rather than one per component.
+    """
+
+    def __init__(self, pool: Optional[GeminiPoolConfig] = None):
+        self.pool = pool or GeminiPoolConfig()
+        self._clients: Dict[Tuple[Any, ...], _RegisteredClient] = {}
+        # Components may be built in worker threads
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.created = 0
+        self.reused = 0
+
+    @staticmethod
+    def _key(model_name: str, temperature: float, max_tokens: Optional[int],
+             kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (model_name, temperature, max_tokens, tuple(sorted(
+            (name, repr(value)) for name, value in kwargs.items())))
+
+    def get(
+        self,
+        model_name: str = "gemini-2.5-flash",
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = 2048,
+        **kwargs: Any
+    ) -> ChatGoogleGenerativeAI:
+        """Shared chat instance for these parameters, created on first use"""
+        key = self._key(model_name, temperature, max_tokens, kwargs)
+        with self._lock:
+            registered = self._clients.get(key)
+            if registered is not None:
+                registered.uses += 1
+                self.reused += 1
+                return registered.chat
+
+            kwargs.setdefault("client_args", self.pool.client_args())
+            chat = create_gemini_chat(model_name, temperature, max_tokens, **kwargs)
+            self._clients[key] = _RegisteredClient(chat)
+            self.created += 1
+            return chat
+
+    def clients(self) -> List[ChatGoogleGenerativeAI]:
+        with self._lock:
+            return [registered.chat for registered in self._clients.values()]
+
+    @staticmethod
+    def _pool_stats(chat: ChatGoogleGenerativeAI) -> Optional[Dict[str, Any]]:
+        """Connection usage of a chat's async HTTP pool (httpx internals)"""
+        try:
+            pool = chat.client._api_client._async_httpx_client._transport._pool
+            connections = list(pool.connections)
+            active = sum(1 for connection in connections if not connection.is_idle())
+            return {
+                "connections": len(connections),
+                "active": active,
+                "idle": len(connections) - active,
+                "queued_requests": sum(1 for request in pool._requests if request.is_queued()),
+                "max_connections": pool._max_connections,
+                "utilization": round(active / pool._max_connections, 3)
+            }
+        except Exception:
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            registered = list(self._clients.items())
+        return {
+            "live_clients": len(registered),
+            "created": self.created,
+            "reused": self.reused,
+            "pool": self.pool.model_dump(),
+            "clients": [
+                {
+                    "model": key[0],
+                    "temperature": key[1],
+                    "max_tokens": key[2],
+                    "uses": entry.uses,
+                    "http_pool": self._pool_stats(entry.chat)
+                }
+                for key, entry in registered
+            ]
+        }
+
+
+_registry: Optional[GeminiClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_gemini_client_registry() -> GeminiClientRegistry:
+    """
+    Process-wide client registry
+
+    Pool limits come from GEMINI_MAX_CONNECTIONS, GEMINI_MAX_KEEPALIVE_CONNECTIONS
+    and GEMINI_KEEPALIVE_SECONDS.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = GeminiClientRegistry(GeminiPoolConfig(
+                max_connections=int(os.getenv("GEMINI_MAX_CONNECTIONS", "64")),
+                max_keepalive_connections=int(os.getenv("GEMINI_MAX_KEEPALIVE_CONNECTIONS", "32")),
+                keepalive_expiry_seconds=float(os.getenv("GEMINI_KEEPALIVE_SECONDS", "60"))
+            ))
+        return _registry
+
+
+def get_shared_gemini_chat(
+    model_name: str = "gemini-2.5-flash",
+    temperature: float = 0.7,
+    max_tokens: Optional[int] = 2048,
+    **kwargs: Any
+) -> ChatGoogleGenerativeAI:
+    """Shared counterpart of create_gemini_chat"""
+    return get_gemini_client_registry().get(model_name, temperature, max_tokens, **kwargs)
+
+
+def get_llm_client_stats() -> Dict[str, Any]:
+    """Live shared clients and their connection pool usage"""
+    return get_gemini_client_registry().get_stats()
+
+
 def create_interview_gemini_chat() -> ChatGoogleGenerativeAI:
     """
     Create a Gemini chat instance optimized for interview scenarios
@@ -74,7 +232,7 @@ def create_interview_gemini_chat() -> ChatGoogleGenerativeAI:
     Returns:
         Configured ChatGoogleGenerativeAI for interviews
     """
-    return create_gemini_chat(
+    return get_shared_gemini_chat(
         model_name="gemini-2.5-flash",
         temperature=0.7,  # Balanced creativity and consistency
         max_tokens=1024,  # Reasonable response length for interviews
@@ -88,7 +246,7 @@ def create_conversation_gemini_chat() -> ChatGoogleGenerativeAI:
     Returns:
         Configured ChatGoogleGenerativeAI for conversation
     """
-    return create_gemini_chat(
+    return get_shared_gemini_chat(
         model_name="gemini-2.5-flash",
         temperature=0.8,  # Slightly more creative for natural conversation
         max_tokens=2048,  # Longer responses for detailed explanations
@@ -102,13 +260,25 @@ def create_response_gemini_chat() -> ChatGoogleGenerativeAI:
     Returns:
         Configured ChatGoogleGenerativeAI for response generation
     """
-    return create_gemini_chat(
+    return get_shared_gemini_chat(
         model_name="gemini-2.5-flash",
         temperature=0.6,  # More consistent for structured responses
         max_tokens=1536,  # Medium length responses
     )
 
 
+async def preconnect_gemini_chat(chat: ChatGoogleGenerativeAI) -> float:
+    """
+    Open the HTTP connection of a chat instance before its first request
+
+    Fetches the model's metadata, which costs no tokens but pays for DNS,
+    TLS and connection setup up front. Returns the elapsed time in ms.
+    """
+    started = time.perf_counter()
+    await chat.client.aio.models.get(model=chat.model)
+    return (time.perf_counter() - started) * 1000
+
+
 # Available Gemini models
 GEMINI_MODELS = {
     "flash": "gemini-2.5-flash",      # Fast, efficient
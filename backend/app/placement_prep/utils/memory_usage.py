@@ -0,0 +1,69 @@
+"""
+Memory Usage Utility
+
+Approximate memory accounting for in-memory session stores and LangGraph
+checkpointers, used by the admin memory report.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import sys
+from typing import Any, Dict, Optional, Set
+
+from pydantic import BaseModel
+
+
+def deep_sizeof(obj: Any, max_objects: int = 200000) -> int:
+    """
+    Approximate recursive size of an object graph in bytes
+
+    Follows containers, pydantic models and plain objects' __dict__; each
+    object is counted once. Stops after max_objects to bound the cost on
+    very large stores, so the result is a lower bound in that case.
+    """
+    seen: Set[int] = set()
+    stack = [obj]
+    total = 0
+
+    while stack and len(seen) < max_objects:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, (str, bytes, bytearray, int, float, bool, type(None))):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif isinstance(current, BaseModel):
+            stack.append(current.__dict__)
+        elif hasattr(current, "__dict__"):
+            stack.append(vars(current))
+
+    return total
+
+
+def checkpointer_stats(checkpointer: Optional[Any]) -> Dict[str, Any]:
+    """Thread count and approximate size of an in-memory checkpointer"""
+    if checkpointer is None:
+        return {"threads": 0, "approx_bytes": 0}
+
+    storage = getattr(checkpointer, "storage", None)
+    if storage is None:
+        # Out-of-process checkpointers keep nothing resident
+        return {"threads": None, "approx_bytes": 0, "type": type(checkpointer).__name__}
+
+    return {
+        "threads": len(storage),
+        "approx_bytes": deep_sizeof([
+            storage,
+            getattr(checkpointer, "writes", None),
+            getattr(checkpointer, "blobs", None)
+        ]),
+        "type": type(checkpointer).__name__
+    }
@@ -12,8 +12,11 @@ Date: July 2025
 import asyncio
 import logging
 import os
+import time
 import uuid
-from typing import Dict, Any, Optional, List, Union
+import weakref
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, Any, Optional, List, Set, Tuple, Union
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -33,10 +36,21 @@ from ..core.interview_state_manager import (
     SessionStatus,
     create_interview_state_manager
 )
+from ..core.admission_control import AdmissionController, create_admission_controller
+from ..core.response_generator import TokenCallback
+from ..core.session_store import (
+    InMemorySessionStore,
+    SessionStore,
+    SessionVersionConflict,
+    StoredSession,
+    create_session_store
+)
 from ..interviewer_agents.dsa_interviewer import (
     DSAInterviewAgent,
     create_dsa_interviewer
 )
+from ..utils.memory_usage import deep_sizeof
+from .session_pool import WarmSessionPool, create_session_pool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -71,11 +85,17 @@ class SessionState(BaseModel):
     status: SessionStatus
     current_agent: Optional[str] = None
     current_problem: Optional[Problem] = None
+    current_problem_started: Optional[datetime] = None
     problems_completed: List[str] = Field(default_factory=list)
     start_time: datetime
     end_time: Optional[datetime] = None
     total_score: float = 0.0
     performance_metrics: Dict[str, Any] = Field(default_factory=dict)
+    last_activity: datetime = Field(default_factory=datetime.now)
+    state_session_id: Optional[str] = None
+    # Opening claimed from the warm pool, used when the interview starts
+    prepared_problem_id: Optional[str] = None
+    prepared_introduction: Optional[str] = None
 
 
 class OrchestratorResponse(BaseModel):
@@ -99,7 +119,10 @@ class MainInterviewOrchestrator:
         problem_database: ProblemDatabase,
         interview_state_manager: InterviewStateManager,
         dsa_interviewer: DSAInterviewAgent,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        session_store: Optional[SessionStore] = None,
+        session_pool: Optional[WarmSessionPool] = None,
+        admission: Optional[AdmissionController] = None
     ):
         """
         Initialize the orchestrator with all required components
@@ -109,14 +132,59 @@ class MainInterviewOrchestrator:
             interview_state_manager: Manager for interview state
             dsa_interviewer: DSA interview agent
             config: Optional configuration parameters
+            session_store: Optional shared session storage; without one,
+                sessions live only in this process
+            session_pool: Optional pool of pre-warmed interview openings
+            admission: Optional limit on concurrent LLM-bound operations
         """
         self.problem_database = problem_database
         self.interview_state_manager = interview_state_manager
         self.dsa_interviewer = dsa_interviewer
         self.config = config or {}
-
-        # Active sessions storage
+        self.session_store = session_store
+        self.session_pool = session_pool
+        self.admission = admission
+        if admission is not None:
+            # Background problem preparation counts against the same limit
+            self.dsa_interviewer.admission = admission
+        # Sessions are bounded here (enforce_session_cap and the reaper evict
+        # whole sessions through evict_session), so the agent must not drop a
+        # live session's context on its own when its store fills up
+        self.dsa_interviewer.session_contexts.max_sessions = None
+        # Other workers can only continue a session if they can read its
+        # conversation too; with the in-process checkpointer the messages
+        # travel in the stored session instead
+        self._store_conversation = (
+            session_store is not None
+            and not isinstance(session_store, InMemorySessionStore)
+            and dsa_interviewer.conversation_is_process_local())
+        if self._store_conversation:
+            logger.warning(
+                "⚠️ ORCHESTRATOR: Shared session store with the in-memory conversation "
+                "checkpointer; conversations are copied into every stored session. "
+                "Set LANGGRAPH_CHECKPOINTER=mongo to share them instead.")
+        # Construction time of each component in ms, filled in by the factory
+        self.component_init_ms: Dict[str, float] = {}
+
+        # Active sessions storage (a local cache when a session store is set)
         self.active_sessions: Dict[str, SessionState] = {}
+        # Store version each cached session was read or written at
+        self._session_versions: Dict[str, int] = {}
+
+        # One operation per session at a time; a lock lives while it is in use
+        self._session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+            weakref.WeakValueDictionary())
+        # Operations in flight by (session_id, operation, payload)
+        self._inflight: Dict[Tuple[str, ...], asyncio.Task] = {}
+        self.coalesced_requests = 0
+        self.contended_requests = 0
+
+        # Hibernation metrics
+        self.hibernations = 0
+        self.rehydrations = 0
+        self._hibernate_ms_total = 0.0
+        self._recent_rehydrate_ms: Deque[float] = deque(maxlen=1000)
+        self._rehydrate_ms_total = 0.0
 
         logger.info("MainInterviewOrchestrator initialized successfully")
 
@@ -145,6 +213,16 @@ class MainInterviewOrchestrator:
                 start_time=datetime.now()
             )
 
+            # Take a pre-warmed opening if one fits this session
+            if self.session_pool is not None:
+                warm = self.session_pool.claim(
+                    session_config.interview_type.value,
+                    session_config.difficulty_range,
+                    session_config.user_id)
+                if warm is not None:
+                    session_state.prepared_problem_id = warm.problem_id
+                    session_state.prepared_introduction = warm.introduction
+
             # Store session
             self.active_sessions[session_id] = session_state
 
@@ -152,8 +230,16 @@ class MainInterviewOrchestrator:
             session_data = await self.interview_state_manager.create_session(
                 user_id=session_config.user_id,
                 session_type="dsa",
-                duration_limit=session_config.duration_minutes * 60  # Convert to seconds
+                duration_limit=session_config.duration_minutes * 60,  # Convert to seconds
+                session_id=session_id
             )
+            session_state.state_session_id = session_data.get("session_id")
+
+            if self.session_store is not None:
+                self._session_versions[session_id] = await self.session_store.create(
+                    session_id, self._session_payload(session_state))
+
+            self.enforce_session_cap()
 
             logger.info(f"Created new interview session: {session_id}")
 
@@ -174,6 +260,51 @@ class MainInterviewOrchestrator:
             logger.error(f"Error creating session: {str(e)}")
             raise
 
+    async def _serialized(
+        self,
+        key: Tuple[str, ...],
+        operation: Callable[[], Awaitable[OrchestratorResponse]],
+        admit: bool = False
+    ) -> OrchestratorResponse:
+        """
+        Run an operation on a session under that session's lock
+
+        key is (session_id, operation, payload...). A request identical to
+        one still in flight (a double click or client retry) waits for that
+        run and gets its result instead of running again. The run is
+        shielded, so a disconnecting client does not abort it half-way.
+        With admit, the run also needs a slot from the admission
+        controller and raises AdmissionRejected when it gets none.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced_requests += 1
+            logger.info(f"🔁 ORCHESTRATOR: Joined in-flight {key[1]} for session {key[0]}")
+            return await asyncio.shield(inflight)
+
+        lock = self._session_lock(key[0])
+
+        async def run() -> OrchestratorResponse:
+            if lock.locked():
+                self.contended_requests += 1
+            async with lock:
+                if admit and self.admission is not None:
+                    async with self.admission.admit():
+                        return await operation()
+                return await operation()
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def _session_lock(self, session_id: str) -> asyncio.Lock:
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._session_locks[session_id] = lock
+        return lock
+
     async def start_interview(self, session_id: str) -> OrchestratorResponse:
         """
         Start the actual interview for a session
@@ -184,21 +315,27 @@ class MainInterviewOrchestrator:
         Returns:
             OrchestratorResponse with first problem/interaction
         """
-        try:
-            if session_id not in self.active_sessions:
-                raise ValueError(f"Session {session_id} not found")
+        return await self._serialized(
+            (session_id, "start"), lambda: self._start_interview(session_id), admit=True)
 
-            session_state = self.active_sessions[session_id]
+    async def _start_interview(self, session_id: str) -> OrchestratorResponse:
+        try:
+            session_state = await self._load_session(session_id)
+            session_state.last_activity = datetime.now()
+            self._resume(session_state)
 
             # Update session state
             session_state.current_agent = "dsa_interviewer"
 
             # Start with first problem based on interview type
             if session_state.config.interview_type == InterviewType.DSA_ONLY:
-                return await self._start_dsa_interview(session_id)
+                response = await self._start_dsa_interview(session_id)
             else:
                 # For now, default to DSA interview (will expand for other types)
-                return await self._start_dsa_interview(session_id)
+                response = await self._start_dsa_interview(session_id)
+
+            await self._save_session(session_state)
+            return response
 
         except Exception as e:
             logger.error(f"Error starting interview {session_id}: {str(e)}")
@@ -212,15 +349,29 @@ class MainInterviewOrchestrator:
             # Initialize DSA interviewer session
             agent_state = await self.dsa_interviewer.initialize_session(
                 user_id=session_state.config.user_id or "anonymous",
-                session_id=session_id
+                session_id=session_id,
+                problem_id=session_state.prepared_problem_id,
+                introduction=session_state.prepared_introduction
             )
+            session_state.prepared_problem_id = None
+            session_state.prepared_introduction = None
 
             # Extract current problem from agent state metadata
             current_problem_title = agent_state.metadata.get(
                 "problem_title", "Unknown Problem")
-
-            # Create a welcome message for the DSA interview
-            welcome_message = f"""Welcome to your DSA interview! 
+            current_problem_id = agent_state.metadata.get("current_problem_id")
+            if current_problem_id:
+                session_state.current_problem = self.problem_database.get_problem(
+                    current_problem_id)
+                session_state.current_problem_started = datetime.now()
+
+            # Create a welcome message for the DSA interview, with the
+            # pre-generated problem introduction when there is one
+            introduction = agent_state.metadata.get("problem_introduction")
+            if introduction:
+                welcome_message = f"Welcome to your DSA interview!\n\n{introduction}"
+            else:
+                welcome_message = f"""Welcome to your DSA interview! 
 
 I've selected a problem for you: "{current_problem_title}"
 
@@ -266,21 +417,79 @@ Let me know when you're ready to see the problem statement, or if you have any q
         Returns:
             OrchestratorResponse with AI response
         """
+        return await self._serialized(
+            (session_id, "message", user_message),
+            lambda: self._process_message(session_id, user_message),
+            admit=True)
+
+    async def stream_message(
+        self,
+        session_id: str,
+        user_message: str
+    ) -> AsyncIterator[Union[str, OrchestratorResponse]]:
+        """
+        Process a user message, yielding the reply as it is generated
+
+        Yields pieces of the reply text, then the OrchestratorResponse. The
+        final response's message is authoritative; it differs from the
+        streamed text only when generation failed half-way. Replies that are
+        not generated token by token (canned messages, or a request that
+        joined an identical one in flight) arrive as a single piece. Errors
+        (including AdmissionRejected) are raised before the first piece.
+        The run is shielded as in process_message: a client that stops
+        reading does not abort it.
+        """
+        pieces: asyncio.Queue = asyncio.Queue()
+        run = asyncio.get_running_loop().create_task(self._serialized(
+            (session_id, "message", user_message),
+            lambda: self._process_message(session_id, user_message, on_token=pieces.put_nowait),
+            admit=True))
+        streamed = False
+        try:
+            while not run.done() or not pieces.empty():
+                if pieces.empty():
+                    next_piece = asyncio.ensure_future(pieces.get())
+                    await asyncio.wait({next_piece, run}, return_when=asyncio.FIRST_COMPLETED)
+                    if not next_piece.done():
+                        next_piece.cancel()
+                        continue
+                    piece = next_piece.result()
+                else:
+                    piece = pieces.get_nowait()
+                streamed = True
+                yield piece
+
+            response = run.result()
+            if not streamed:
+                yield response.message
+            yield response
+        finally:
+            if not run.done():
+                # Only stops waiting; the shielded operation itself completes
+                run.cancel()
+
+    async def _process_message(
+        self,
+        session_id: str,
+        user_message: str,
+        on_token: Optional[TokenCallback] = None
+    ) -> OrchestratorResponse:
         try:
             logger.info(
                 f"🎯 ORCHESTRATOR: Processing message for session {session_id}")
             logger.info(f"📝 USER MESSAGE: {user_message}")
 
-            if session_id not in self.active_sessions:
-                raise ValueError(f"Session {session_id} not found")
-
-            session_state = self.active_sessions[session_id]
+            session_state = await self._load_session(session_id)
+            session_state.last_activity = datetime.now()
+            self._resume(session_state)
             logger.info(
                 f"📊 SESSION STATE: Agent={session_state.current_agent}, Status={session_state.status}")
 
             # Route to appropriate agent based on current agent
             if session_state.current_agent == "dsa_interviewer":
-                response = await self._process_dsa_message(session_id, user_message)
+                response = await self._process_dsa_message(
+                    session_state, user_message, on_token=on_token)
+                await self._save_session(session_state)
                 logger.info(
                     f"✅ ORCHESTRATOR RESPONSE: {response.message[:100]}...")
                 return response
@@ -295,11 +504,17 @@ Let me know when you're ready to see the problem statement, or if you have any q
 
     async def _process_dsa_message(
         self,
-        session_id: str,
-        user_message: str
+        session_state: SessionState,
+        user_message: str,
+        on_token: Optional[TokenCallback] = None
     ) -> OrchestratorResponse:
-        """Process message through DSA interviewer"""
-        session_state = self.active_sessions[session_id]
+        """
+        Process message through DSA interviewer
+
+        Works on the session_state loaded by the caller rather than looking
+        it up again, so an eviction racing with the request cannot fail it.
+        """
+        session_id = session_state.session_id
         logger.info(
             f"🤖 DSA AGENT: Processing message for session {session_id}")
 
@@ -309,7 +524,10 @@ Let me know when you're ready to see the problem statement, or if you have any q
                 session_id=session_id,
                 user_id=session_state.config.user_id or "anonymous",
                 current_step="processing_message",
-                metadata={"session_active": True}
+                metadata={
+                    "session_active": True,
+                    "max_problems": session_state.config.max_problems
+                }
             )
 
             logger.info(
@@ -318,7 +536,8 @@ Let me know when you're ready to see the problem statement, or if you have any q
             # Process through DSA interviewer
             dsa_response = await self.dsa_interviewer.process_message(
                 message=user_message,
-                state=agent_state
+                state=agent_state,
+                on_token=on_token
             )
 
             logger.info(f"🎯 DSA AGENT RAW RESPONSE: {dsa_response}")
@@ -331,6 +550,15 @@ Let me know when you're ready to see the problem statement, or if you have any q
             logger.info(f"📤 DSA AGENT EXTRACTED MESSAGE: {response_message}")
             logger.info(f"📊 DSA AGENT CURRENT PHASE: {current_phase}")
 
+            if dsa_response.get("action") == "next_problem":
+                if session_state.current_problem:
+                    await self._record_problem_attempt(session_state)
+                    session_state.problems_completed.append(
+                        session_state.current_problem.id)
+                session_state.current_problem = self.problem_database.get_problem(
+                    dsa_response["conversation_metadata"]["problem_id"])
+                session_state.current_problem_started = datetime.now()
+
             # Check if session should be completed
             is_complete = dsa_response.get("session_completed", False)
             if is_complete:
@@ -368,18 +596,16 @@ Let me know when you're ready to see the problem statement, or if you have any q
 
     async def get_session_status(self, session_id: str) -> SessionState:
         """Get current status of a session"""
-        if session_id not in self.active_sessions:
-            raise ValueError(f"Session {session_id} not found")
-
-        return self.active_sessions[session_id]
+        return await self._load_session(session_id)
 
     async def end_session(self, session_id: str) -> OrchestratorResponse:
         """End an interview session"""
-        try:
-            if session_id not in self.active_sessions:
-                raise ValueError(f"Session {session_id} not found")
+        return await self._serialized(
+            (session_id, "end"), lambda: self._end_session(session_id))
 
-            session_state = self.active_sessions[session_id]
+    async def _end_session(self, session_id: str) -> OrchestratorResponse:
+        try:
+            session_state = await self._load_session(session_id)
             session_state.status = SessionStatus.COMPLETED
             session_state.end_time = datetime.now()
 
@@ -394,6 +620,14 @@ Let me know when you're ready to see the problem statement, or if you have any q
                     "completion_status": "completed"
                 }
 
+            await self._record_problem_attempt(session_state)
+            self.dsa_interviewer.end_session(session_id)
+            if session_state.state_session_id:
+                self.interview_state_manager.release_session(
+                    session_state.state_session_id)
+                session_state.state_session_id = None
+            await self._save_session(session_state)
+
             return OrchestratorResponse(
                 session_id=session_id,
                 message="Interview session completed successfully! Thank you for participating.",
@@ -408,6 +642,348 @@ Let me know when you're ready to see the problem statement, or if you have any q
             logger.error(f"Error ending session {session_id}: {str(e)}")
             raise
 
+    async def pause_session(self, session_id: str) -> OrchestratorResponse:
+        """
+        Pause an interview and hibernate it
+
+        The next message resumes the session where it left off.
+        """
+        return await self._serialized(
+            (session_id, "pause"), lambda: self._pause_session(session_id))
+
+    async def _pause_session(self, session_id: str) -> OrchestratorResponse:
+        session_state = await self._load_session(session_id)
+        if session_state.status in (SessionStatus.COMPLETED, SessionStatus.TERMINATED):
+            return OrchestratorResponse(
+                session_id=session_id,
+                message="This interview has already ended.",
+                current_phase="session_completed",
+                session_state=session_state,
+                requires_user_input=False,
+                is_session_complete=True
+            )
+
+        session_state.last_activity = datetime.now()
+        if not await self._hibernate_session(session_id, reason="paused"):
+            # No session store to hibernate to; the session stays resident
+            session_state.status = SessionStatus.PAUSED
+
+        return OrchestratorResponse(
+            session_id=session_id,
+            message="Interview paused. Send a message whenever you are ready to continue.",
+            current_phase="paused",
+            suggested_actions=["Resume the interview", "End the interview"],
+            session_state=session_state,
+            requires_user_input=False
+        )
+
+    def _resume(self, session_state: SessionState) -> None:
+        if session_state.status == SessionStatus.PAUSED:
+            session_state.status = SessionStatus.ACTIVE
+            logger.info(f"▶️ ORCHESTRATOR: Resumed session {session_state.session_id}")
+
+    async def hibernate_session(self, session_id: str, reason: str = "idle") -> bool:
+        """
+        Move a resident session to the session store and free its memory
+
+        Returns False when the session is not resident, there is no session
+        store, or an operation on the session is in progress.
+        """
+        lock = self._session_lock(session_id)
+        if lock.locked():
+            return False
+        async with lock:
+            return await self._hibernate_session(session_id, reason)
+
+    async def _hibernate_session(self, session_id: str, reason: str) -> bool:
+        """Hibernate a session; the caller holds its lock"""
+        session_state = self.active_sessions.get(session_id)
+        if session_state is None or self.session_store is None:
+            return False
+
+        started = time.perf_counter()
+        conversation = await self.dsa_interviewer.export_conversation(session_id)
+        if session_state.status == SessionStatus.ACTIVE:
+            session_state.status = SessionStatus.PAUSED
+        try:
+            await self._save_session(session_state, conversation=conversation, hibernated=True)
+        except SessionVersionConflict:
+            # Another worker holds a newer copy; ours is stale anyway
+            pass
+        self._drop_resident(session_id)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.hibernations += 1
+        self._hibernate_ms_total += elapsed_ms
+        logger.info(
+            f"💤 ORCHESTRATOR: Hibernated session {session_id} ({reason}, "
+            f"{len(conversation or [])} messages, {elapsed_ms:.1f} ms)")
+        return True
+
+    async def hibernate_idle_sessions(self, idle_seconds: float) -> List[str]:
+        """Hibernate sessions without activity for idle_seconds"""
+        if self.session_store is None:
+            return []
+        cutoff = datetime.now() - timedelta(seconds=idle_seconds)
+        idle = [
+            session_id for session_id, session_state in list(self.active_sessions.items())
+            if session_state.last_activity < cutoff
+        ]
+        return [
+            session_id for session_id in idle
+            if await self.hibernate_session(session_id)
+        ]
+
+    def _session_payload(self, session_state: SessionState) -> Dict[str, Any]:
+        """Compact form of a session for the session store"""
+        return {
+            "session": session_state.model_dump(mode="json", exclude={"current_problem"}),
+            "problem_id": session_state.current_problem.id if session_state.current_problem else None,
+            "agent": self.dsa_interviewer.export_context(session_state.session_id)
+        }
+
+    async def _restore_session(self, stored: StoredSession) -> SessionState:
+        """
+        Rebuild a session (and its agent context) from the store
+
+        A hibernated session, or any session when conversations travel in
+        the store, also brings its messages back into the conversation
+        checkpointer, replacing whatever this worker still held.
+        """
+        started = time.perf_counter()
+        payload = stored.decode()
+        session_state = SessionState.model_validate(payload["session"])
+        if payload.get("problem_id"):
+            session_state.current_problem = self.problem_database.get_problem(
+                payload["problem_id"])
+        if payload.get("agent"):
+            self.dsa_interviewer.import_context(stored.session_id, payload["agent"])
+        if payload.get("conversation"):
+            await self.dsa_interviewer.import_conversation(
+                stored.session_id, payload["conversation"])
+
+        self.active_sessions[stored.session_id] = session_state
+        self._session_versions[stored.session_id] = stored.version
+
+        if payload.get("hibernated"):
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.rehydrations += 1
+            self._rehydrate_ms_total += elapsed_ms
+            self._recent_rehydrate_ms.append(elapsed_ms)
+            logger.info(
+                f"☀️ ORCHESTRATOR: Rehydrated session {stored.session_id} ({elapsed_ms:.1f} ms)")
+        return session_state
+
+    async def _load_session(self, session_id: str) -> SessionState:
+        """
+        Current state of a session
+
+        With a session store the local copy is only used while it is at the
+        stored version; otherwise the session is rebuilt from the store, so
+        requests can land on any worker.
+        """
+        if self.session_store is None:
+            if session_id not in self.active_sessions:
+                raise ValueError(f"Session {session_id} not found")
+            return self.active_sessions[session_id]
+
+        stored = await self.session_store.get(session_id)
+        if stored is None:
+            # Gone for good, so drop it even while the caller holds its lock
+            if self._drop_resident(session_id) is not None:
+                logger.info(f"🧹 ORCHESTRATOR: Evicted session {session_id} (not in session store)")
+            raise ValueError(f"Session {session_id} not found")
+
+        session_state = self.active_sessions.get(session_id)
+        if (session_state is not None
+                and self._session_versions.get(session_id) == stored.version
+                and (session_state.current_agent is None
+                     or session_id in self.dsa_interviewer.session_contexts)):
+            return session_state
+        return await self._restore_session(stored)
+
+    async def _save_session(
+        self,
+        session_state: SessionState,
+        conversation: Optional[List[Dict[str, Any]]] = None,
+        hibernated: bool = False
+    ) -> None:
+        """
+        Write a session back to the store, failing if another worker changed it
+
+        conversation (from DSAInterviewAgent.export_conversation) is stored
+        when hibernating, and on every save when the conversation
+        checkpointer is process-local but the store is shared. Otherwise a
+        resident session's messages live in the conversation checkpointer.
+        """
+        if self.session_store is None:
+            return
+
+        session_id = session_state.session_id
+        payload = self._session_payload(session_state)
+        if conversation is None and self._store_conversation:
+            conversation = await self.dsa_interviewer.export_conversation(session_id)
+        if conversation is not None:
+            payload["conversation"] = conversation
+        if hibernated:
+            payload["hibernated"] = True
+        try:
+            self._session_versions[session_id] = await self.session_store.save(
+                session_id,
+                payload,
+                expected_version=self._session_versions.get(session_id, 0)
+            )
+        except SessionVersionConflict:
+            # The local copy is stale; the next request reloads it
+            self._session_versions.pop(session_id, None)
+            logger.warning(
+                f"⚠️ ORCHESTRATOR: Session {session_id} was updated elsewhere, change rejected")
+            raise
+
+    def busy_session_ids(self) -> Set[str]:
+        """Sessions with an operation queued or running; eviction skips them"""
+        busy = {key[0] for key in self._inflight}
+        busy.update(
+            session_id for session_id, lock in list(self._session_locks.items())
+            if lock.locked())
+        return busy
+
+    def evict_session(self, session_id: str, reason: str = "evicted") -> bool:
+        """
+        Forget a session and release everything held for it
+
+        Used for sessions that were never ended. Without a session store
+        the session is gone from the API afterwards; with one only this
+        worker's copy is dropped. Returns False, leaving the session alone,
+        while an operation on it is queued or running, as hibernate_session
+        does.
+        """
+        if session_id in self.busy_session_ids():
+            return False
+        if self._drop_resident(session_id) is None:
+            return False
+        logger.info(f"🧹 ORCHESTRATOR: Evicted session {session_id} ({reason})")
+        return True
+
+    def _drop_resident(self, session_id: str) -> Optional[SessionState]:
+        """Release this worker's copy of a session and the agent state behind it"""
+        self._session_versions.pop(session_id, None)
+        session_state = self.active_sessions.pop(session_id, None)
+        if session_state is None:
+            return None
+
+        self.dsa_interviewer.end_session(session_id)
+        if session_state.state_session_id:
+            self.interview_state_manager.release_session(
+                session_state.state_session_id)
+        return session_state
+
+    def reap_idle_sessions(self, idle_ttl_seconds: float) -> List[str]:
+        """Evict sessions without activity for idle_ttl_seconds, unless busy"""
+        cutoff = datetime.now() - timedelta(seconds=idle_ttl_seconds)
+        busy = self.busy_session_ids()
+        idle = [
+            session_id for session_id, session_state in list(self.active_sessions.items())
+            if session_state.last_activity < cutoff and session_id not in busy
+        ]
+        for session_id in idle:
+            self.evict_session(session_id, reason="idle")
+        return idle
+
+    def enforce_session_cap(self, max_sessions: Optional[int] = None) -> List[str]:
+        """
+        Evict least recently active sessions beyond the cap
+
+        Busy sessions are never evicted, so the count can stay above the
+        cap until they finish.
+        """
+        cap = max_sessions or self.config.get("max_active_sessions")
+        if not cap or len(self.active_sessions) <= cap:
+            return []
+
+        overflow = len(self.active_sessions) - cap
+        busy = self.busy_session_ids()
+        oldest = sorted(
+            (item for item in self.active_sessions.items() if item[0] not in busy),
+            key=lambda item: item[1].last_activity
+        )[:overflow]
+        evicted = [session_id for session_id, _ in oldest]
+        for session_id in evicted:
+            self.evict_session(session_id, reason="session cap")
+        return evicted
+
+    def get_memory_report(self) -> Dict[str, Any]:
+        """Entries and approximate bytes held by each in-memory store"""
+        return {
+            "orchestrator_sessions": {
+                "entries": len(self.active_sessions),
+                "approx_bytes": deep_sizeof(self.active_sessions)
+            },
+            "state_manager": self.interview_state_manager.get_memory_stats(),
+            "dsa_interviewer": self.dsa_interviewer.get_memory_stats(),
+            "session_store": self.session_store.get_stats() if self.session_store else None,
+            "session_pool": self.session_pool.get_stats() if self.session_pool else None,
+            "in_flight": {
+                "operations": len(self._inflight),
+                "session_locks": len(self._session_locks),
+                "coalesced_requests": self.coalesced_requests,
+                "contended_requests": self.contended_requests
+            },
+            "admission": self.admission.get_stats() if self.admission else None,
+            "hibernation": self._hibernation_stats()
+        }
+
+    def _hibernation_stats(self) -> Dict[str, Any]:
+        rehydrate_ms = sorted(self._recent_rehydrate_ms)
+        return {
+            "hibernations": self.hibernations,
+            "rehydrations": self.rehydrations,
+            "avg_hibernate_ms": round(
+                self._hibernate_ms_total / self.hibernations, 2) if self.hibernations else 0.0,
+            "rehydrate_ms": {
+                "avg": round(
+                    self._rehydrate_ms_total / self.rehydrations, 2) if self.rehydrations else 0.0,
+                "p95": round(rehydrate_ms[int(len(rehydrate_ms) * 0.95)], 2) if rehydrate_ms else 0.0,
+                "max": round(rehydrate_ms[-1], 2) if rehydrate_ms else 0.0
+            }
+        }
+
+    def _problem_solved(self, session_state: SessionState, problem: Problem) -> bool:
+        """
+        Whether the state manager graded the problem as correctly solved
+
+        Only InterviewStateManager.complete_problem sets a grade; a problem
+        that was never graded counts as attempted, not solved.
+        """
+        state_session = self.interview_state_manager.active_sessions.get(
+            session_state.state_session_id) if session_state.state_session_id else None
+        if state_session is None:
+            return False
+        return any(
+            metric.problem_title == problem.title and metric.solution_correct
+            for metric in state_session.performance_metrics
+        )
+
+    async def _record_problem_attempt(self, session_state: SessionState) -> None:
+        """Feed the finished problem into the user's performance aggregate"""
+        problem = session_state.current_problem
+        if not session_state.config.user_id or not problem:
+            return
+
+        try:
+            started = session_state.current_problem_started or session_state.start_time
+            # The journal is file-backed, keep its I/O off the event loop
+            await asyncio.to_thread(
+                self.problem_database.record_attempt,
+                user_id=session_state.config.user_id,
+                problem_id=problem.id,
+                solution_correct=self._problem_solved(session_state, problem),
+                time_taken=((session_state.end_time or datetime.now()) - started).total_seconds()
+            )
+        except Exception as e:
+            logger.error(
+                f"Error recording attempt for session {session_state.session_id}: {str(e)}")
+
 
 def create_interview_orchestrator(
     api_key: Optional[str] = None,
@@ -423,23 +999,45 @@ def create_interview_orchestrator(
     Returns:
         Configured MainInterviewOrchestrator instance
     """
+    timings: Dict[str, float] = {}
+
+    def timed(name: str, build):
+        started = time.perf_counter()
+        component = build()
+        timings[name] = round((time.perf_counter() - started) * 1000, 2)
+        return component
+
     try:
         # Create core components using their factory functions
-        problem_database = create_problem_database()
-        interview_state_manager = create_interview_state_manager(
-            api_key=api_key)
-        dsa_interviewer = create_dsa_interviewer(api_key=api_key)
+        problem_database = timed("problem_database", create_problem_database)
+        timed("vector_index", problem_database.prepare_vector_index)
+        interview_state_manager = timed(
+            "interview_state_manager",
+            lambda: create_interview_state_manager(api_key=api_key))
+        # The agent shares the state manager, so an interview has one state session
+        dsa_interviewer = timed("dsa_interviewer", lambda: create_dsa_interviewer(
+            api_key=api_key,
+            problem_database=problem_database,
+            interview_state_manager=interview_state_manager))
+        session_store = timed("session_store", create_session_store)
+        session_pool = timed("session_pool", lambda: create_session_pool(dsa_interviewer))
+        admission = create_admission_controller()
 
         # Create orchestrator
         orchestrator = MainInterviewOrchestrator(
             problem_database=problem_database,
             interview_state_manager=interview_state_manager,
             dsa_interviewer=dsa_interviewer,
-            config=kwargs
+            config=kwargs,
+            session_store=session_store,
+            session_pool=session_pool,
+            admission=admission
         )
+        orchestrator.component_init_ms = timings
 
         logger.info(
-            "MainInterviewOrchestrator created successfully via factory function")
+            f"MainInterviewOrchestrator created successfully via factory function "
+            f"({sum(timings.values()):.0f} ms: {timings})")
         return orchestrator
 
     except Exception as e:
@@ -0,0 +1,113 @@
+"""
+Problem Refresher for AI-Based Mock Interview Platform
+
+Background task that keeps a MongoDB-backed problem catalog current. Each
+pass calls ProblemDatabase.refresh_from_source, which fetches only the
+Leetcode documents past the cached watermarks and publishes them as a new
+catalog version. Every worker process runs its own refresher, since each
+holds its own copy of the catalog.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from ..core.problem_database import ProblemDatabase
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ProblemRefresherConfig(BaseModel):
+    """Configuration for the problem refresher"""
+    # 0 disables periodic refreshes
+    refresh_interval_seconds: float = Field(default=300, ge=0)
+
+
+class ProblemRefresher:
+    """
+    Periodically pulls changed problems from the catalog's source
+    """
+
+    def __init__(self, problem_database: ProblemDatabase, config: ProblemRefresherConfig):
+        self.problem_database = problem_database
+        self.config = config
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.refreshes = 0
+        self.problems_refreshed = 0
+        self.last_refresh_ms = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return (self.problem_database.config.source == "mongo"
+                and self.config.refresh_interval_seconds > 0)
+
+    async def refresh(self) -> int:
+        """Run one refresh and return the number of changed problems"""
+        started = time.perf_counter()
+        # pymongo is synchronous; keep the event loop free
+        changed = await asyncio.to_thread(self.problem_database.refresh_from_source)
+        self.refreshes += 1
+        self.problems_refreshed += changed
+        self.last_refresh_ms = (time.perf_counter() - started) * 1000
+        return changed
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.refresh_interval_seconds)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Problem refresh failed: {e}")
+
+    def start(self) -> None:
+        """Start refreshing on the running event loop if the source is MongoDB"""
+        if not self.enabled:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(
+                f"Problem refresher started (every {self.config.refresh_interval_seconds:.0f}s)")
+
+    async def stop(self) -> None:
+        """Cancel the background task"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "source": self.problem_database.config.source,
+            "refresh_interval_seconds": self.config.refresh_interval_seconds,
+            "refreshes": self.refreshes,
+            "problems_refreshed": self.problems_refreshed,
+            "last_refresh_ms": round(self.last_refresh_ms, 2)
+        }
+
+
+def create_problem_refresher(
+    problem_database: ProblemDatabase,
+    **kwargs
+) -> ProblemRefresher:
+    """Factory function to create ProblemRefresher with environment overrides"""
+    settings = {
+        "refresh_interval_seconds": float(os.getenv("PROBLEM_REFRESH_INTERVAL_SECONDS", "300")),
+        **kwargs
+    }
+    return ProblemRefresher(problem_database, ProblemRefresherConfig(**settings))
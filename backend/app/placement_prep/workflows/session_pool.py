@@ -0,0 +1,249 @@
+"""
+Warm Session Pool for AI-Based Mock Interview Platform
+
+Keeps a few interview openings ready per (interview type, difficulty) so
+creating a session does not wait for problem selection or an LLM problem
+introduction. A background task refills the pool after each claim, rate
+limited by a token bucket so pre-warming never takes more than its share
+of the LLM quota. Openings are drawn before any user is known; a claim
+skips openings whose problem the user already solved, and falls back to
+the normal path when nothing suitable is ready.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..core.problem_database import ProblemDifficulty
+from ..interviewer_agents.dsa_interviewer import DSAInterviewAgent
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, ProblemDifficulty]
+
+
+class SessionPoolConfig(BaseModel):
+    """Configuration for the warm session pool"""
+    size_per_key: int = Field(default=2, ge=0)
+    interview_types: List[str] = Field(default_factory=lambda: ["dsa_only"])
+    difficulties: List[ProblemDifficulty] = Field(
+        default_factory=lambda: list(ProblemDifficulty))
+    generate_introductions: bool = True
+    refill_per_minute: float = Field(default=30, gt=0)
+    refill_burst: int = Field(default=5, ge=1)
+    max_age_seconds: float = Field(default=3600, gt=0)
+
+
+@dataclass
+class WarmSession:
+    """An interview opening prepared ahead of time"""
+    interview_type: str
+    difficulty: ProblemDifficulty
+    problem_id: str
+    introduction: Optional[str]
+    prepared_at: float = field(default_factory=time.monotonic)
+
+
+class WarmSessionPool:
+    """
+    Ready-to-serve interview openings with rate-limited background refill
+    """
+
+    def __init__(self, dsa_interviewer: DSAInterviewAgent, config: SessionPoolConfig):
+        self.dsa_interviewer = dsa_interviewer
+        self.config = config
+        self._pools: Dict[PoolKey, Deque[WarmSession]] = {
+            (interview_type, difficulty): deque()
+            for interview_type in config.interview_types
+            for difficulty in config.difficulties
+        }
+        # Keys the catalog cannot serve, with the time to retry them
+        self._unavailable: Dict[PoolKey, float] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        # Token bucket for refills
+        self._tokens = float(config.refill_burst)
+        self._tokens_updated = time.monotonic()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.prepared = 0
+        self.expired = 0
+        self.failures = 0
+        self._prepare_ms_total = 0.0
+
+    def claim(
+        self,
+        interview_type: str,
+        difficulties: List[ProblemDifficulty],
+        user_id: Optional[str] = None
+    ) -> Optional[WarmSession]:
+        """Take a ready opening for a new session, or None to take the normal path"""
+        aggregate = self.dsa_interviewer.problem_database.user_performance.get(
+            user_id) if user_id else None
+        completed = aggregate.completed_problems if aggregate else set()
+        expires_before = time.monotonic() - self.config.max_age_seconds
+
+        order = list(difficulties)
+        random.shuffle(order)
+        try:
+            for difficulty in order:
+                pool = self._pools.get((interview_type, difficulty))
+                while pool:
+                    warm = pool.popleft()
+                    if warm.prepared_at < expires_before:
+                        self.expired += 1
+                        continue
+                    if warm.problem_id in completed:
+                        # Still good for other users
+                        pool.append(warm)
+                        break
+                    self.hits += 1
+                    return warm
+            self.misses += 1
+            return None
+        finally:
+            self._wakeup.set()
+
+    def _next_deficit(self) -> Optional[PoolKey]:
+        now = time.monotonic()
+        for key, pool in self._pools.items():
+            if len(pool) < self.config.size_per_key and self._unavailable.get(key, 0) <= now:
+                return key
+        return None
+
+    async def _acquire_token(self) -> None:
+        rate = self.config.refill_per_minute / 60
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.config.refill_burst),
+                self._tokens + (now - self._tokens_updated) * rate)
+            self._tokens_updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / rate)
+
+    async def _refill(self, key: PoolKey) -> None:
+        interview_type, difficulty = key
+        await self._acquire_token()
+        started = time.perf_counter()
+        opening = await self.dsa_interviewer.prepare_opening(
+            difficulty, with_introduction=self.config.generate_introductions, admit=True)
+        if opening is None:
+            logger.warning(f"No {difficulty.value} problems to pre-warm, retrying later")
+            self._unavailable[key] = time.monotonic() + self.config.max_age_seconds
+            return
+        self._pools[key].append(WarmSession(
+            interview_type=interview_type,
+            difficulty=difficulty,
+            problem_id=opening["problem"]["id"],
+            introduction=opening["introduction"]
+        ))
+        self.prepared += 1
+        self._prepare_ms_total += (time.perf_counter() - started) * 1000
+
+    async def _run(self) -> None:
+        failures_in_a_row = 0
+        while True:
+            key = self._next_deficit()
+            if key is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self.config.max_age_seconds)
+                except asyncio.TimeoutError:
+                    self._drop_expired()
+                continue
+            try:
+                await self._refill(key)
+                failures_in_a_row = 0
+            except Exception as e:
+                # Usually the LLM quota; back off instead of retrying at full rate
+                self.failures += 1
+                failures_in_a_row += 1
+                delay = min(300, 2 ** failures_in_a_row)
+                logger.error(f"Pre-warming failed, retrying in {delay}s: {e}")
+                await asyncio.sleep(delay)
+
+    def _drop_expired(self) -> None:
+        expires_before = time.monotonic() - self.config.max_age_seconds
+        for pool in self._pools.values():
+            while pool and pool[0].prepared_at < expires_before:
+                pool.popleft()
+                self.expired += 1
+
+    def start(self) -> None:
+        """Start refilling on the running event loop"""
+        if self.config.size_per_key == 0:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(
+                f"Warm session pool started ({self.config.size_per_key} per key, "
+                f"{len(self._pools)} keys, {self.config.refill_per_minute:g} refills/min)")
+
+    async def stop(self) -> None:
+        """Cancel the background task"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        claims = self.hits + self.misses
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "ready": {
+                f"{interview_type}/{difficulty.value}": len(pool)
+                for (interview_type, difficulty), pool in self._pools.items()
+            },
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / claims, 3) if claims else 0.0,
+            "prepared": self.prepared,
+            "expired": self.expired,
+            "failures": self.failures,
+            "avg_prepare_ms": round(self._prepare_ms_total / self.prepared, 2) if self.prepared else 0.0
+        }
+
+
+def create_session_pool(
+    dsa_interviewer: DSAInterviewAgent,
+    **kwargs
+) -> Optional[WarmSessionPool]:
+    """
+    Factory function to create WarmSessionPool with environment overrides
+
+    Returns None when INTERVIEW_WARM_POOL_SIZE is 0.
+    """
+    settings = {
+        "size_per_key": int(os.getenv("INTERVIEW_WARM_POOL_SIZE", "2")),
+        "refill_per_minute": float(os.getenv("INTERVIEW_WARM_POOL_REFILL_PER_MINUTE", "30")),
+        "generate_introductions": os.getenv(
+            "INTERVIEW_WARM_POOL_INTRODUCTIONS", "true").lower() == "true",
+        **kwargs
+    }
+    config = SessionPoolConfig(**settings)
+    if config.size_per_key == 0:
+        return None
+    return WarmSessionPool(dsa_interviewer, config)
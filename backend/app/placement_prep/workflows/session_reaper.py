@@ -0,0 +1,166 @@
+"""
+Session Reaper for AI-Based Mock Interview Platform
+
+Background task that bounds the orchestrator's in-memory session state.
+Sessions that are never ended would otherwise stay in
+MainInterviewOrchestrator.active_sessions, InterviewStateManager.active_sessions
+and the LangGraph checkpointers forever. Each sweep hibernates sessions
+idle for a few minutes into the session store (they come back on their
+next message), evicts sessions idle for longer than the TTL, enforces a
+hard cap by evicting the least recently active sessions, and releases
+state-manager sessions and agent contexts that no live session refers to.
+
+Author: AI Mock Interview Platform Team
+Date: January 2025
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from .interview_orchestrator import MainInterviewOrchestrator
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SessionReaperConfig(BaseModel):
+    """Configuration for the session reaper"""
+    idle_ttl_seconds: float = Field(default=1800, gt=0)
+    # 0 disables hibernation
+    hibernate_after_seconds: float = Field(default=300, ge=0)
+    max_sessions: int = Field(default=1000, ge=1)
+    sweep_interval_seconds: float = Field(default=60, gt=0)
+
+
+class SessionReaper:
+    """
+    Periodically evicts idle and excess interview sessions
+    """
+
+    def __init__(self, orchestrator: MainInterviewOrchestrator, config: SessionReaperConfig):
+        self.orchestrator = orchestrator
+        self.config = config
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.sweeps = 0
+        self.hibernations = 0
+        self.idle_evictions = 0
+        self.cap_evictions = 0
+        self.orphans_released = 0
+        self.last_sweep_ms = 0.0
+
+    async def sweep(self) -> Dict[str, int]:
+        """Run one eviction pass and return what was released"""
+        started = time.perf_counter()
+        orchestrator = self.orchestrator
+
+        hibernated = await orchestrator.hibernate_idle_sessions(
+            self.config.hibernate_after_seconds) if self.config.hibernate_after_seconds else []
+        idle = orchestrator.reap_idle_sessions(self.config.idle_ttl_seconds)
+        capped = orchestrator.enforce_session_cap(self.config.max_sessions)
+
+        # State that outlived its orchestrator session; a busy session may be
+        # mid-restore, with its context back but not yet its session state
+        live_sessions = set(orchestrator.active_sessions) | orchestrator.busy_session_ids()
+        orphans = len(orchestrator.dsa_interviewer.reap_orphans(live_sessions))
+        agent = orchestrator.dsa_interviewer
+        session_keep = {
+            s.state_session_id for s in orchestrator.active_sessions.values()
+            if s.state_session_id
+        }
+        agent_keep = {
+            context.state_session_id for _, context in agent.session_contexts.items()
+            if context.state_session_id
+        }
+        if agent.interview_state_manager is orchestrator.interview_state_manager:
+            orphans += len(orchestrator.interview_state_manager.reap_idle_sessions(
+                self.config.idle_ttl_seconds, keep=session_keep | agent_keep))
+        else:
+            orphans += len(orchestrator.interview_state_manager.reap_idle_sessions(
+                self.config.idle_ttl_seconds, keep=session_keep))
+            orphans += len(agent.interview_state_manager.reap_idle_sessions(
+                self.config.idle_ttl_seconds, keep=agent_keep))
+
+        self.sweeps += 1
+        self.hibernations += len(hibernated)
+        self.idle_evictions += len(idle)
+        self.cap_evictions += len(capped)
+        self.orphans_released += orphans
+        self.last_sweep_ms = (time.perf_counter() - started) * 1000
+
+        if hibernated or idle or capped or orphans:
+            logger.info(
+                f"🧹 Session sweep: {len(hibernated)} hibernated, {len(idle)} idle, "
+                f"{len(capped)} over cap, {orphans} orphaned ({self.last_sweep_ms:.1f} ms)")
+        return {
+            "hibernated": len(hibernated),
+            "idle": len(idle),
+            "over_cap": len(capped),
+            "orphans": orphans
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.sweep_interval_seconds)
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Session sweep failed: {e}")
+
+    def start(self) -> None:
+        """Start sweeping on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(
+                f"Session reaper started (idle TTL {self.config.idle_ttl_seconds:.0f}s, "
+                f"cap {self.config.max_sessions})")
+
+    async def stop(self) -> None:
+        """Cancel the background task"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "idle_ttl_seconds": self.config.idle_ttl_seconds,
+            "hibernate_after_seconds": self.config.hibernate_after_seconds,
+            "max_sessions": self.config.max_sessions,
+            "sweeps": self.sweeps,
+            "hibernations": self.hibernations,
+            "idle_evictions": self.idle_evictions,
+            "cap_evictions": self.cap_evictions,
+            "orphans_released": self.orphans_released,
+            "last_sweep_ms": round(self.last_sweep_ms, 2)
+        }
+
+
+def create_session_reaper(
+    orchestrator: MainInterviewOrchestrator,
+    **kwargs
+) -> SessionReaper:
+    """Factory function to create SessionReaper with environment overrides"""
+    settings = {
+        "idle_ttl_seconds": float(os.getenv("INTERVIEW_SESSION_IDLE_TTL_SECONDS", "1800")),
+        "hibernate_after_seconds": float(os.getenv("INTERVIEW_SESSION_HIBERNATE_SECONDS", "300")),
+        "max_sessions": int(os.getenv("INTERVIEW_MAX_ACTIVE_SESSIONS", "1000")),
+        "sweep_interval_seconds": float(os.getenv("INTERVIEW_SESSION_SWEEP_SECONDS", "60")),
+        **kwargs
+    }
+    config = SessionReaperConfig(**settings)
+    # Evict at creation time too, not only on the next sweep
+    orchestrator.config.setdefault("max_active_sessions", config.max_sessions)
+    return SessionReaper(orchestrator, config)
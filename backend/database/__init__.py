@@ -6,7 +6,11 @@ MongoDB integration for the AI Mock Interview Platform.
 
 from .config import DatabaseConfig, db_config, get_database
 from .models import UserDocument, InterviewSessionDocument, InterviewMessageDocument
-from .repositories import UserRepository, get_user_repository
+from .repositories import (
+    UserRepository, get_user_repository,
+    InterviewRepository, get_interview_repository
+)
+from .write_behind import WriteBehindQueue
 
 __all__ = [
     "DatabaseConfig",
@@ -16,5 +20,8 @@ __all__ = [
     "InterviewSessionDocument",
     "InterviewMessageDocument",
     "UserRepository",
-    "get_user_repository"
+    "get_user_repository",
+    "InterviewRepository",
+    "get_interview_repository",
+    "WriteBehindQueue"
 ]
@@ -5,5 +5,7 @@ Repository pattern implementation for MongoDB operations.
 """
 
 from .users import UserRepository, get_user_repository
+from .interviews import InterviewRepository, get_interview_repository
 
-__all__ = ["UserRepository", "get_user_repository"]
+__all__ = ["UserRepository", "get_user_repository",
+           "InterviewRepository", "get_interview_repository"]
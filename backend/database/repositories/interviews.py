@@ -0,0 +1,112 @@
+"""
+Interview Repository
+
+MongoDB operations for interview sessions and their transcripts in the
+AI Mock Interview Platform. Writes are batch-oriented; they are normally
+driven by the write-behind queue rather than called per request.
+
+Author: AI Mock Interview Platform Team
+Date: July 2025
+"""
+
+from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
+from pymongo import ASCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
+from typing import Dict, Any, Optional, List
+from datetime import datetime
+import logging
+
+from ..models import InterviewSessionDocument, InterviewMessageDocument
+from ..config import get_database
+
+logger = logging.getLogger(__name__)
+
+
+class InterviewRepository:
+    """Repository for interview session and message operations in MongoDB"""
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.db = database
+        self.sessions: AsyncIOMotorCollection = database.interview_sessions
+        self.messages: AsyncIOMotorCollection = database.interview_messages
+
+    async def create_indexes(self):
+        """Create database indexes for optimal performance"""
+        try:
+            await self.sessions.create_index("session_id", unique=True)
+            await self.sessions.create_index([("user_id", ASCENDING), ("created_at", ASCENDING)])
+            # message_id makes batch retries idempotent
+            await self.messages.create_index("message_id", unique=True)
+            await self.messages.create_index([("session_id", ASCENDING), ("timestamp", ASCENDING)])
+            logger.info("Interview collection indexes created successfully")
+        except Exception as e:
+            logger.error(f"Error creating interview indexes: {e}")
+
+    async def insert_messages(self, messages: List[InterviewMessageDocument]) -> int:
+        """Insert a batch of messages; already stored messages are skipped"""
+        if not messages:
+            return 0
+        try:
+            result = await self.messages.insert_many(
+                [message.model_dump() for message in messages], ordered=False)
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Duplicate message_ids come from a retried batch
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != 11000 for error in errors):
+                raise
+            return e.details.get("nInserted", 0)
+
+    async def upsert_sessions(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Apply field updates to many sessions in one bulk write
+
+        updates maps session_id to the fields to set (never created_at);
+        sessions that do not exist yet are created.
+        """
+        if not updates:
+            return 0
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"session_id": session_id},
+                {
+                    "$set": {**fields, "updated_at": now},
+                    "$setOnInsert": {"created_at": now}
+                },
+                upsert=True
+            )
+            for session_id, fields in updates.items()
+        ]
+        result = await self.sessions.bulk_write(operations, ordered=False)
+        return result.upserted_count + result.modified_count
+
+    async def get_session(self, session_id: str) -> Optional[InterviewSessionDocument]:
+        """Get a stored interview session by session_id"""
+        try:
+            session_data = await self.sessions.find_one({"session_id": session_id})
+            if session_data:
+                session_data["_id"] = str(session_data["_id"])
+                return InterviewSessionDocument(**session_data)
+            return None
+        except Exception as e:
+            logger.error(f"Error getting interview session {session_id}: {e}")
+            raise
+
+    async def get_messages(self, session_id: str, limit: int = 500) -> List[InterviewMessageDocument]:
+        """Get the transcript of a session in order"""
+        try:
+            cursor = self.messages.find({"session_id": session_id}).sort(
+                "timestamp", ASCENDING).limit(limit)
+            return [InterviewMessageDocument(**message) async for message in cursor]
+        except Exception as e:
+            logger.error(f"Error getting messages for session {session_id}: {e}")
+            raise
+
+# Dependency to get interview repository
+
+
+async def get_interview_repository() -> InterviewRepository:
+    """FastAPI dependency to get interview repository instance"""
+    database = await get_database()
+    return InterviewRepository(database)
@@ -0,0 +1,226 @@
+"""
+Write-Behind Persistence
+
+Buffers interview transcript messages and session updates in memory and
+writes them to MongoDB in batches, so request handlers never wait on a
+database round trip. A batch is flushed every flush_interval_ms or as soon
+as max_batch items are pending, and once more on shutdown. Session updates
+are coalesced per session, so a burst of turns costs one upsert.
+
+A batch that fails because the database is unreachable is retried as it
+is. A batch the database rejects is retried max_batch_attempts times, then
+written one item at a time, and any item that is still rejected is logged
+and discarded. One bad document therefore cannot block the queue.
+
+Author: AI Mock Interview Platform Team
+Date: July 2025
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Any, Optional, List
+
+from pymongo.errors import ConnectionFailure
+
+from .models import InterviewMessageDocument
+from .repositories.interviews import InterviewRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Whether a failed write is worth retrying unchanged (database unreachable)"""
+    return isinstance(error, (ConnectionFailure, OSError, asyncio.TimeoutError))
+
+
+class WriteBehindQueue:
+    """Batches interview writes for an InterviewRepository"""
+
+    def __init__(
+        self,
+        repository: InterviewRepository,
+        flush_interval_ms: int = 250,
+        max_batch: int = 500,
+        max_pending: int = 50000,
+        max_batch_attempts: int = 3
+    ):
+        self.repository = repository
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.max_batch_attempts = max(1, max_batch_attempts)
+
+        self._messages: List[InterviewMessageDocument] = []
+        self._session_updates: Dict[str, Dict[str, Any]] = {}
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        # Consecutive flushes the database rejected for something other than
+        # being unreachable
+        self._rejected_attempts = 0
+
+        # Metrics
+        self.messages_written = 0
+        self.sessions_written = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.dropped = 0
+        self.discarded = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    @property
+    def depth(self) -> int:
+        return len(self._messages) + len(self._session_updates)
+
+    def _pending_changed(self) -> None:
+        if self.depth >= self.max_batch:
+            self._wakeup.set()
+
+    def enqueue_message(self, message: InterviewMessageDocument) -> None:
+        """Queue one transcript message"""
+        if self.depth >= self.max_pending:
+            # The database is down or far behind; shed load rather than grow
+            self.dropped += 1
+            return
+        self._messages.append(message)
+        self._pending_changed()
+
+    def enqueue_session_update(self, session_id: str, fields: Dict[str, Any]) -> None:
+        """Queue field updates for a session, merged with any pending ones"""
+        pending = self._session_updates.get(session_id)
+        if pending is not None:
+            pending.update(fields)
+            return
+        if self.depth >= self.max_pending:
+            self.dropped += 1
+            return
+        self._session_updates[session_id] = dict(fields)
+        self._pending_changed()
+
+    async def flush(self) -> None:
+        """Write everything that is pending"""
+        async with self._flush_lock:
+            while self._messages or self._session_updates:
+                messages = self._messages[:self.max_batch]
+                session_updates = self._session_updates
+                del self._messages[:len(messages)]
+                self._session_updates = {}
+
+                started = time.perf_counter()
+                try:
+                    if self._rejected_attempts >= self.max_batch_attempts:
+                        await self._write_items(session_updates, messages)
+                    else:
+                        # Sessions first, so a transcript never outlives its session row
+                        self.sessions_written += await self.repository.upsert_sessions(
+                            session_updates)
+                        session_updates = {}
+                        self.messages_written += await self.repository.insert_messages(messages)
+                    self._rejected_attempts = 0
+                except BaseException as e:
+                    # Put the batch back (also when cancelled mid-write);
+                    # newer session fields win
+                    self._messages[:0] = messages
+                    for session_id, fields in session_updates.items():
+                        self._session_updates[session_id] = {
+                            **fields, **self._session_updates.get(session_id, {})}
+                    if not isinstance(e, Exception):
+                        raise
+                    self.failed_flushes += 1
+                    if not _is_transient(e):
+                        self._rejected_attempts += 1
+                    logger.error(f"Write-behind flush failed, will retry: {e}")
+                    return
+                finally:
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    self.last_flush_ms = elapsed_ms
+                    self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+                    self._total_flush_ms += elapsed_ms
+                    self.flushes += 1
+
+    async def _write_items(
+        self,
+        session_updates: Dict[str, Dict[str, Any]],
+        messages: List[InterviewMessageDocument]
+    ) -> None:
+        """
+        Write a repeatedly rejected batch one item at a time
+
+        Items are removed from session_updates and messages as they are
+        written or discarded, so a transient failure puts back only the rest.
+        """
+        for session_id in list(session_updates):
+            try:
+                self.sessions_written += await self.repository.upsert_sessions(
+                    {session_id: session_updates[session_id]})
+            except Exception as e:
+                if _is_transient(e):
+                    raise
+                self.discarded += 1
+                logger.error(f"Write-behind discarded update for session {session_id}: {e}")
+            del session_updates[session_id]
+
+        while messages:
+            message = messages[0]
+            try:
+                self.messages_written += await self.repository.insert_messages([message])
+            except Exception as e:
+                if _is_transient(e):
+                    raise
+                self.discarded += 1
+                logger.error(
+                    f"Write-behind discarded message {message.message_id} "
+                    f"of session {message.session_id}: {e}")
+            del messages[0]
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop"""
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(
+                f"Write-behind queue started (every {self.flush_interval * 1000:.0f} ms "
+                f"or {self.max_batch} items)")
+
+    async def stop(self) -> None:
+        """Stop the flusher and write what is still pending"""
+        if self._task is not None:
+            # Let an in-flight flush finish instead of cancelling it
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+        if self.depth:
+            logger.error(f"Write-behind queue stopped with {self.depth} unwritten items")
+        else:
+            logger.info("Write-behind queue flushed and stopped")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.depth,
+            "pending_messages": len(self._messages),
+            "pending_sessions": len(self._session_updates),
+            "messages_written": self.messages_written,
+            "sessions_written": self.sessions_written,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "dropped": self.dropped,
+            "discarded": self.discarded,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "avg_flush_ms": round(self._total_flush_ms / self.flushes, 2) if self.flushes else 0.0,
+            "max_flush_ms": round(self.max_flush_ms, 2)
+        }
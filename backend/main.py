@@ -11,7 +11,12 @@ Date: July 2025
 from database.repositories import UserRepository
 from database import db_config
 from routers.users import router as users_router
-from routers.interviews import router as interviews_router
+from routers.interviews import (
+    router as interviews_router,
+    start_interview_persistence,
+    warm_up_interview_system,
+    shutdown_interview_system
+)
 from routers.problem_sheets import router as problem_sheets_router
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -28,6 +33,13 @@ from dotenv import load_dotenv
 load_dotenv(dotenv_path=os.path.join(
     os.path.dirname(__file__), '..', '.env'))
 
+# Build the shared problem catalog at import time so that a preforking
+# server (e.g. gunicorn --preload with uvicorn workers) shares its pages
+# copy-on-write across workers
+if os.getenv("PRELOAD_PROBLEM_CATALOG", "false").lower() == "true":
+    from app.placement_prep.core.problem_database import preload_problem_catalog
+    preload_problem_catalog()
+
 
 # Import routers
 
@@ -52,15 +64,22 @@ async def lifespan(app: FastAPI):
         user_repo = UserRepository(db_config.get_database())
         await user_repo.create_indexes()
 
+        # Batched persistence of interview sessions and transcripts
+        await start_interview_persistence(db_config.get_database())
+
         logger.info("✅ Database initialized successfully")
     except Exception as e:
         logger.error(f"❌ Database initialization failed: {e}")
         raise
 
+    # Build the interview orchestrator now instead of on the first request
+    await warm_up_interview_system()
+
     yield
 
     # Shutdown
     logger.info("🛑 AI Mock Interview Platform API shutting down...")
+    await shutdown_interview_system()
     await db_config.disconnect()
 
 # Create FastAPI app instance with lifespan
@@ -117,6 +136,7 @@ async def root():
         endpoints={
             "/": "API information",
             "/health": "Health check",
+            "/api/v1/interviews/ready": "Interview system readiness",
             "/api/v1/interviews": "Interview management endpoints",
             "/api/v1/users": "User management endpoints",
             "/docs": "API documentation",
@@ -14,15 +14,26 @@ from app.placement_prep.workflows.interview_orchestrator import (
     MainInterviewOrchestrator,
     InterviewSessionConfig,
     InterviewType,
-    OrchestratorResponse
+    OrchestratorResponse,
+    SessionState
 )
-from fastapi import APIRouter, HTTPException, Depends
+from app.placement_prep.workflows.session_reaper import SessionReaper, create_session_reaper
+from app.placement_prep.workflows.problem_refresher import ProblemRefresher, create_problem_refresher
+from app.placement_prep.core.session_store import SessionVersionConflict
+from app.placement_prep.core.admission_control import AdmissionRejected
+from database import InterviewMessageDocument, InterviewRepository, WriteBehindQueue
+from app.placement_prep.utils.gemini_chat import get_llm_client_stats, preconnect_gemini_chat
+from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List, Union
 from datetime import datetime
+import asyncio
+import json
 import logging
 import sys
 import os
+import time
 
 # Add the project root to the Python path to access the app module
 project_root = os.path.abspath(os.path.join(
@@ -38,17 +49,131 @@ router = APIRouter(prefix="/api/v1/interviews", tags=["interviews"])
 
 # Global orchestrator instance (will be properly managed later)
 _orchestrator: Optional[MainInterviewOrchestrator] = None
+_session_reaper: Optional[SessionReaper] = None
+_problem_refresher: Optional[ProblemRefresher] = None
+_write_behind: Optional[WriteBehindQueue] = None
+_warmup_task: Optional[asyncio.Task] = None
+_warmup_status: Dict[str, Any] = {"state": "pending"}
+
+
+async def _build_orchestrator(preconnect_llm: bool) -> None:
+    """Construct the orchestrator and start its background work"""
+    global _orchestrator, _session_reaper, _problem_refresher
+    logger.info("Initializing Interview Orchestrator...")
+    started = time.perf_counter()
+    try:
+        # Construction is synchronous and slow; keep the event loop free
+        orchestrator = await asyncio.to_thread(create_interview_orchestrator)
+        _session_reaper = create_session_reaper(orchestrator)
+        _session_reaper.start()
+        _problem_refresher = create_problem_refresher(orchestrator.problem_database)
+        _problem_refresher.start()
+        if orchestrator.session_pool is not None:
+            orchestrator.session_pool.start()
+
+        component_ms = dict(orchestrator.component_init_ms)
+        if preconnect_llm:
+            for index, client in enumerate(orchestrator.dsa_interviewer.get_llm_clients()):
+                try:
+                    component_ms[f"llm_preconnect_{index}"] = round(
+                        await preconnect_gemini_chat(client), 2)
+                except Exception as e:
+                    logger.warning(f"LLM preconnect failed: {e}")
+
+        _orchestrator = orchestrator
+        _warmup_status.update(
+            state="ready",
+            ready_at=datetime.now().isoformat(),
+            total_ms=round((time.perf_counter() - started) * 1000, 2),
+            component_ms=component_ms)
+        logger.info(
+            f"Interview Orchestrator initialized successfully in {_warmup_status['total_ms']:.0f} ms")
+    except Exception as e:
+        _warmup_status.update(state="failed", error=str(e))
+        logger.error(f"Interview Orchestrator initialization failed: {e}")
+        raise
+
+
+def _start_warmup(preconnect_llm: bool) -> asyncio.Task:
+    global _warmup_task
+    _warmup_status.clear()
+    _warmup_status.update(state="warming", started_at=datetime.now().isoformat())
+    _warmup_task = asyncio.get_running_loop().create_task(_build_orchestrator(preconnect_llm))
+    return _warmup_task
+
+
+async def warm_up_interview_system() -> None:
+    """
+    Build the orchestrator at application startup
+
+    INTERVIEW_WARMUP selects "blocking" (default; startup waits for it),
+    "background" (serve immediately, /ready reports 503 until done) or
+    "lazy" (build on the first interview request). With
+    INTERVIEW_WARMUP_PRECONNECT_LLM=true the LLM connections are opened too.
+    """
+    mode = os.getenv("INTERVIEW_WARMUP", "blocking").lower()
+    if mode == "lazy":
+        return
+    task = _start_warmup(
+        os.getenv("INTERVIEW_WARMUP_PRECONNECT_LLM", "false").lower() == "true")
+    if mode == "blocking":
+        try:
+            await task
+        except Exception:
+            # Interview routes retry on first use; the rest of the API still starts
+            pass
 
 
 async def get_orchestrator() -> MainInterviewOrchestrator:
     """Dependency to get the interview orchestrator instance"""
-    global _orchestrator
     if _orchestrator is None:
-        logger.info("Initializing Interview Orchestrator...")
-        _orchestrator = create_interview_orchestrator()
-        logger.info("Interview Orchestrator initialized successfully")
+        task = _warmup_task
+        if task is None or (task.done() and _orchestrator is None):
+            # Lazy mode, or a failed warmup being retried
+            task = _start_warmup(preconnect_llm=False)
+        # A cancelled request must not cancel the shared build
+        await asyncio.shield(task)
     return _orchestrator
 
+
+async def start_interview_persistence(database) -> None:
+    """Start write-behind persistence of sessions and transcripts"""
+    global _write_behind
+    repository = InterviewRepository(database)
+    await repository.create_indexes()
+    _write_behind = WriteBehindQueue(
+        repository,
+        flush_interval_ms=int(os.getenv("INTERVIEW_PERSIST_FLUSH_MS", "250")),
+        max_batch=int(os.getenv("INTERVIEW_PERSIST_BATCH_SIZE", "500"))
+    )
+    _write_behind.start()
+
+
+async def shutdown_interview_system() -> None:
+    """Stop background work started by the interview router"""
+    if _warmup_task is not None and not _warmup_task.done():
+        _warmup_task.cancel()
+    if _session_reaper is not None:
+        await _session_reaper.stop()
+    if _problem_refresher is not None:
+        await _problem_refresher.stop()
+    if _orchestrator is not None and _orchestrator.session_pool is not None:
+        await _orchestrator.session_pool.stop()
+    if _write_behind is not None:
+        # Pending transcripts are written before the database goes away
+        await _write_behind.stop()
+    if _orchestrator is not None and _orchestrator.session_store is not None:
+        await _orchestrator.session_store.close()
+    if _orchestrator is not None and _orchestrator.dsa_interviewer.response_generator.cache is not None:
+        await _orchestrator.dsa_interviewer.response_generator.cache.close()
+
+
+async def require_admin_key(x_admin_key: Optional[str] = Header(default=None)) -> None:
+    """Guard admin routes with INTERVIEW_ADMIN_API_KEY when it is set"""
+    expected = os.getenv("INTERVIEW_ADMIN_API_KEY")
+    if expected and x_admin_key != expected:
+        raise HTTPException(status_code=403, detail="Admin key required")
+
 # Request/Response models
 
 
@@ -110,6 +235,53 @@ def _map_interview_type(type_string: str) -> InterviewType:
     }
     return mapping.get(type_string.lower(), InterviewType.DSA_ONLY)
 
+
+def _session_fields(session_state: SessionState) -> Dict[str, Any]:
+    """InterviewSessionDocument fields for the current session state"""
+    problem = session_state.current_problem
+    return {
+        "user_id": session_state.config.user_id or "anonymous",
+        "interview_type": session_state.config.interview_type.value,
+        "status": session_state.status.value,
+        "difficulty": problem.difficulty.value if problem else None,
+        "category": problem.category.value if problem else None,
+        "problem_id": problem.id if problem else None,
+        "problem_title": problem.title if problem else None,
+        "problem_description": problem.description if problem else None,
+        "score": session_state.total_score,
+        "duration_minutes": session_state.config.duration_minutes,
+        "completed_at": session_state.end_time
+    }
+
+
+def _persist_turn(
+    response: OrchestratorResponse,
+    user_message: Optional[str] = None,
+    received_at: Optional[datetime] = None,
+    **session_fields: Any
+) -> None:
+    """Queue the session update and transcript of one exchange"""
+    if _write_behind is None:
+        return
+
+    _write_behind.enqueue_session_update(
+        response.session_id, {**_session_fields(response.session_state), **session_fields})
+    if user_message is not None:
+        _write_behind.enqueue_message(InterviewMessageDocument(
+            session_id=response.session_id,
+            sender="user",
+            message_type="code" if "```" in user_message else "text",
+            content=user_message,
+            timestamp=received_at or datetime.utcnow()
+        ))
+    _write_behind.enqueue_message(InterviewMessageDocument(
+        session_id=response.session_id,
+        sender="interviewer",
+        message_type="text",
+        content=response.message,
+        metadata={"phase": response.current_phase}
+    ))
+
 # Interview session endpoints
 
 
@@ -134,6 +306,7 @@ async def create_interview_session(
 
         # Create session through orchestrator
         response = await orchestrator.create_session(config)
+        _persist_turn(response)
 
         logger.info(
             f"Interview session created successfully: {response.session_id}")
@@ -164,6 +337,7 @@ async def start_interview_session(
 
         # Start interview through orchestrator
         response = await orchestrator.start_interview(session_id)
+        _persist_turn(response, started_at=datetime.utcnow())
 
         logger.info(f"Interview session started successfully: {session_id}")
 
@@ -176,6 +350,14 @@ async def start_interview_session(
             timestamp=datetime.now().isoformat()
         )
 
+    except AdmissionRejected as e:
+        logger.warning(f"Interview system busy, rejected request for {session_id}: {e.reason}")
+        raise HTTPException(
+            status_code=429, detail=str(e), headers={"Retry-After": e.retry_after_header})
+    except SessionVersionConflict:
+        logger.warning(f"Concurrent update rejected for session: {session_id}")
+        raise HTTPException(
+            status_code=409, detail=f"Session was updated by another request: {session_id}")
     except ValueError as e:
         logger.warning(f"Session not found: {session_id}")
         raise HTTPException(
@@ -199,7 +381,9 @@ async def process_message(
             f"Processing message for session {session_id}: {request.message[:50]}...")
 
         # Process message through orchestrator
+        received_at = datetime.utcnow()
         response = await orchestrator.process_message(session_id, request.message)
+        _persist_turn(response, request.message, received_at)
 
         logger.info(
             f"Message processed successfully for session: {session_id}")
@@ -213,6 +397,14 @@ async def process_message(
             timestamp=datetime.now().isoformat()
         )
 
+    except AdmissionRejected as e:
+        logger.warning(f"Interview system busy, rejected request for {session_id}: {e.reason}")
+        raise HTTPException(
+            status_code=429, detail=str(e), headers={"Retry-After": e.retry_after_header})
+    except SessionVersionConflict:
+        logger.warning(f"Concurrent update rejected for session: {session_id}")
+        raise HTTPException(
+            status_code=409, detail=f"Session was updated by another request: {session_id}")
     except ValueError as e:
         logger.warning(f"Session not found: {session_id}")
         raise HTTPException(
@@ -224,6 +416,78 @@ async def process_message(
             status_code=500, detail=f"Failed to process message: {str(e)}")
 
 
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/{session_id}/message/stream")
+async def stream_message(
+    session_id: str,
+    request: MessageRequest,
+    orchestrator: MainInterviewOrchestrator = Depends(get_orchestrator)
+):
+    """
+    Process a user message, streaming the reply as Server-Sent Events
+
+    "token" events carry pieces of the reply ({"text": ...}) as they are
+    generated. A final "done" event carries the MessageResponse fields;
+    its ai_message is the authoritative full reply. Errors before the
+    first piece get the same status codes as /message; a failure after
+    that ends the stream with an "error" event.
+    """
+    received_at = datetime.utcnow()
+    pieces: AsyncIterator[Union[str, OrchestratorResponse]] = orchestrator.stream_message(
+        session_id, request.message)
+    try:
+        # Admission, lookup and version errors surface here, before the response starts
+        first = await pieces.__anext__()
+    except AdmissionRejected as e:
+        logger.warning(f"Interview system busy, rejected request for {session_id}: {e.reason}")
+        raise HTTPException(
+            status_code=429, detail=str(e), headers={"Retry-After": e.retry_after_header})
+    except SessionVersionConflict:
+        logger.warning(f"Concurrent update rejected for session: {session_id}")
+        raise HTTPException(
+            status_code=409, detail=f"Session was updated by another request: {session_id}")
+    except ValueError:
+        logger.warning(f"Session not found: {session_id}")
+        raise HTTPException(
+            status_code=404, detail=f"Session not found: {session_id}")
+    except Exception as e:
+        logger.error(f"Error streaming message for session {session_id}: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to process message: {str(e)}")
+
+    async def events() -> AsyncIterator[str]:
+        piece = first
+        try:
+            while True:
+                if isinstance(piece, OrchestratorResponse):
+                    _persist_turn(piece, request.message, received_at)
+                    yield _sse_event("done", MessageResponse(
+                        session_id=session_id,
+                        ai_message=piece.message,
+                        current_phase=piece.current_phase,
+                        suggested_actions=piece.suggested_actions,
+                        is_session_complete=piece.is_session_complete,
+                        timestamp=datetime.now().isoformat()
+                    ).model_dump())
+                    return
+                yield _sse_event("token", {"text": piece})
+                piece = await pieces.__anext__()
+        except Exception as e:
+            logger.error(f"Error streaming message for session {session_id}: {str(e)}")
+            yield _sse_event("error", {"detail": f"Failed to process message: {str(e)}"})
+        finally:
+            await pieces.aclose()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/{session_id}/status")
 async def get_session_status(
     session_id: str,
@@ -272,6 +536,7 @@ async def end_interview_session(
 
         # End session through orchestrator
         response = await orchestrator.end_session(session_id)
+        _persist_turn(response)
 
         logger.info(f"Interview session ended successfully: {session_id}")
 
@@ -284,6 +549,10 @@ async def end_interview_session(
             timestamp=datetime.now().isoformat()
         )
 
+    except SessionVersionConflict:
+        logger.warning(f"Concurrent update rejected for session: {session_id}")
+        raise HTTPException(
+            status_code=409, detail=f"Session was updated by another request: {session_id}")
     except ValueError as e:
         logger.warning(f"Session not found: {session_id}")
         raise HTTPException(
@@ -293,6 +562,99 @@ async def end_interview_session(
         raise HTTPException(
             status_code=500, detail=f"Failed to end interview session: {str(e)}")
 
+
+@router.post("/{session_id}/pause", response_model=MessageResponse)
+async def pause_interview_session(
+    session_id: str,
+    orchestrator: MainInterviewOrchestrator = Depends(get_orchestrator)
+):
+    """Pause an interview session; the next message resumes it"""
+    try:
+        logger.info(f"Pausing interview session: {session_id}")
+
+        response = await orchestrator.pause_session(session_id)
+        _persist_turn(response)
+
+        return MessageResponse(
+            session_id=session_id,
+            ai_message=response.message,
+            current_phase=response.current_phase,
+            suggested_actions=response.suggested_actions,
+            is_session_complete=response.is_session_complete,
+            timestamp=datetime.now().isoformat()
+        )
+
+    except SessionVersionConflict:
+        logger.warning(f"Concurrent update rejected for session: {session_id}")
+        raise HTTPException(
+            status_code=409, detail=f"Session was updated by another request: {session_id}")
+    except ValueError:
+        logger.warning(f"Session not found: {session_id}")
+        raise HTTPException(
+            status_code=404, detail=f"Session not found: {session_id}")
+    except Exception as e:
+        logger.error(f"Error pausing interview session {session_id}: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to pause interview session: {str(e)}")
+
+# Admin endpoints
+
+
+@router.get("/admin/memory", dependencies=[Depends(require_admin_key)])
+async def interview_memory_report(
+    orchestrator: MainInterviewOrchestrator = Depends(get_orchestrator)
+):
+    """Approximate memory held by each in-memory session store"""
+    try:
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "stores": orchestrator.get_memory_report(),
+            "reaper": _session_reaper.get_stats() if _session_reaper else None,
+            "problem_refresher": _problem_refresher.get_stats() if _problem_refresher else None,
+            "llm_clients": get_llm_client_stats(),
+            "write_behind": _write_behind.get_stats() if _write_behind else None
+        }
+    except Exception as e:
+        logger.error(f"Error building memory report: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to build memory report: {str(e)}")
+
+
+@router.post("/admin/problems/refresh", dependencies=[Depends(require_admin_key)])
+async def refresh_problem_catalog(
+    orchestrator: MainInterviewOrchestrator = Depends(get_orchestrator)
+):
+    """Pull problems changed in MongoDB into this worker's catalog now"""
+    try:
+        refresher = _problem_refresher or create_problem_refresher(orchestrator.problem_database)
+        changed = await refresher.refresh()
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "source": orchestrator.problem_database.config.source,
+            "changed_problems": changed,
+            "catalog_version": orchestrator.problem_database.catalog.version
+        }
+    except Exception as e:
+        logger.error(f"Error refreshing problem catalog: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to refresh problem catalog: {str(e)}")
+
+# Readiness of the interview system
+
+
+@router.get("/ready")
+async def interview_system_ready():
+    """Whether the orchestrator is built, with per-component init timings"""
+    status_code = 200 if _orchestrator is not None else 503
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            "ready": _orchestrator is not None,
+            "timestamp": datetime.now().isoformat(),
+            **_warmup_status
+        }
+    )
+
 # Health check for the interview system
 
 
@@ -310,6 +672,9 @@ async def interview_system_health(
             "timestamp": datetime.now().isoformat(),
             "orchestrator_status": "operational",
             "active_sessions": active_sessions_count,
+            "persistence_queue_depth": _write_behind.depth if _write_behind else None,
+            "llm_calls_active": orchestrator.admission.active if orchestrator.admission else None,
+            "llm_calls_queued": orchestrator.admission.queued if orchestrator.admission else None,
             "message": "Interview system is running successfully"
         }
 